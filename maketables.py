@@ -0,0 +1,36 @@
+from pcpy._bitmask import toMask, _makeIcvTable, _normalForm, _primeForm
+
+
+def makeTables():
+    """
+    Writes the lookup tables indexed by bitmask into pcpy/_tables.py, so
+    that they are loaded with the package instead of computed at every
+    import: the ICVs, the first pcs of the normal forms, and the bitmasks
+    of the prime forms of the 4096 pcsets.
+    """
+    icvs = _makeIcvTable()
+    normals = tuple((_normalForm(mask) or (0,))[0] for mask in range(4096))
+    primes = tuple(toMask(_primeForm(mask)) for mask in range(4096))
+    with open("pcpy/_tables.py", "w") as outfile:
+        outfile.write("# Lookup tables indexed by bitmask, generated by "
+                      "maketables.py: do not edit.\n\n")
+        outfile.write("# ICVs\nICV_TABLE = (\n")
+        for i in range(0, 4096, 3):
+            outfile.write("    {},\n".format(
+                ", ".join(str(icv) for icv in icvs[i:i + 3])))
+        outfile.write(")\n\n# First pcs of the normal forms\n"
+                      "NORMAL_TABLE = (\n")
+        for i in range(0, 4096, 12):
+            outfile.write("    {},\n".format(
+                ", ".join(str(pc) for pc in normals[i:i + 12])))
+        outfile.write(")\n\n# Bitmasks of the prime forms\nPRIME_TABLE = (\n")
+        for i in range(0, 4096, 12):
+            outfile.write("    {},\n".format(
+                ", ".join(str(pf) for pf in primes[i:i + 12])))
+        outfile.write(")\n")
+
+
+answer = input("\nGenerate new lookup tables (Y/N)?\n>>> ")
+if answer.lower()[0] == 'y':
+    makeTables()
+    print("\nDone!")
@@ -0,0 +1,365 @@
+"""
+_bitmask.py    Yota Kobayashi
+
+A private module for the bitmask representation of pcsets.
+
+Since each pc is an int in the range from 0 to 11, a pcset can be
+represented by a 12-bit int where bit i is set if and only if pc i is an
+element of the set: e.g., {0, 1, 4} is 0b000000010011 (i.e., 19). The set
+operations then become bitwise operations on a single int:
+
+    transposition   a 12-bit circular rotation
+    inversion       a lookup in the precomputed table INVERT_TABLE
+    complement      XOR with MASK_ALL
+
+There are only 4096 possible pcsets, so the tables defined here cover the
+entire pc space and are computed once at the module import.
+
+List of functions:
+
+    toMask(pcs)
+    fromMask(mask)
+    rotate(mask, n)
+    popcount(mask)
+    subMasks(mask, n)
+    imagesOf(mask)
+    indexVectorOf(mask)
+    normalFormOf(mask)
+    primeFormOf(mask)
+    transformationLevelsOf(mask)
+    symmetryOf(mask)
+"""
+
+from functools import lru_cache, reduce
+from operator import ior
+from .constants import TT_MASK
+
+# Bitmask of the aggregate (i.e., all the 12 pcs), defined once in constants
+MASK_ALL = TT_MASK
+
+# Interval classes indexed by ordered pc interval: an interval i and its
+#   inverse 12-i belong to the same ic
+IC_TABLE = (0, 1, 2, 3, 4, 5, 6, 5, 4, 3, 2, 1)
+
+# Pcsets indexed by bitmask
+_PCS_TABLE = tuple(frozenset(pc for pc in range(12) if mask >> pc & 1)
+                   for mask in range(4096))
+
+# Bitmasks indexed by pcset (the inverse of _PCS_TABLE)
+_MASK_TABLE = {pcs: mask for mask, pcs in enumerate(_PCS_TABLE)}
+
+
+def toMask(pcs):
+    """
+    Converts an iterable with pcs into a bitmask.
+
+    :param pcs: an iterable with pcs.
+    :return: an int in the range from 0 to 4095.
+    """
+    # The frozensets returned by fromMask() (e.g., results of the set
+    #   transformations passed on to other functions) map back directly.
+    #   Only those very objects are taken, since an equal frozenset from
+    #   elsewhere may hold pcs the general path rejects (e.g., 1.0 for 1).
+    if type(pcs) is frozenset:
+        mask = _MASK_TABLE.get(pcs)
+        if mask is not None and _PCS_TABLE[mask] is pcs:
+            return mask
+    return reduce(ior, (1 << (pc % 12) for pc in pcs), 0)
+
+
+def fromMask(mask):
+    """
+    Converts a bitmask into a pcset.
+
+    :param mask: an int in the range from 0 to 4095.
+    :return: a frozenset of pcs.
+    """
+    return _PCS_TABLE[mask]
+
+
+def rotate(mask, n):
+    """
+    Rotates a bitmask by n bits, which is equivalent to Tn.
+
+    :param mask: an int in the range from 0 to 4095.
+    :param n: an int (mod 12) for the transposition number.
+    :return: an int for the bitmask of the transposed pcset.
+    """
+    n %= 12
+    return ((mask << n) | (mask >> (12 - n))) & MASK_ALL
+
+
+def _bitCount(mask):
+    """A fallback for int.bit_count(), which is new in Python 3.10."""
+    return bin(mask).count("1")
+
+
+# Population count of a bitmask, that is, the cardinality of the pcset.
+#   int.bit_count() maps to a single POPCNT instruction where available.
+popcount = getattr(int, "bit_count", _bitCount)
+
+
+# Rotations specialized for each transposition number n: the shift amounts
+#   are compiled in as constants, which saves the arithmetic on n in loops
+#   that scan all the 12 transposition levels (i.e., ROTATIONS[n] is Tn).
+#   T0 is the identity, which returns the bitmask as it is.
+ROTATIONS = (lambda mask: mask,) + tuple(
+    eval("lambda mask: ((mask << {}) | (mask >> {})) & {}"
+         .format(n, 12 - n, MASK_ALL))
+    for n in range(1, 12))
+
+
+def subMasks(mask, n):
+    """
+    Generates the bitmasks of the subsets of cardinality n of a pcset in
+    ascending order, stepping from one n-bit submask directly to the next
+    with integer arithmetic only (Gosper's hack restricted to the bits of
+    the mask).
+
+    :param mask: an int for the bitmask of a pcset.
+    :param n: an int for the cardinality of the subsets.
+    :return: a generator of ints for the bitmasks of the subsets.
+    :raises ValueError: if n is negative.
+    """
+    if n < 0:
+        raise ValueError("n must be non-negative")
+    if n == 0:
+        yield 0
+        return
+    # The smallest submask of cardinality n: the n lowest bits of the mask
+    sub = _lowBits(mask, n)
+    if popcount(sub) < n:
+        return
+    holes = MASK_ALL ^ mask
+    while True:
+        yield sub
+        # Adding the lowest bit of sub to sub with the holes filled in makes
+        #   the carry run through its lowest block of bits (skipping the
+        #   holes) up to the next bit of the mask.
+        carry = (sub | holes) + (sub & -sub)
+        if carry > MASK_ALL:
+            return
+        sub = carry & mask
+        # The bits lost in the carry are refilled from the bottom of the mask.
+        lost = n - popcount(sub)
+        if lost:
+            sub |= _lowBits(mask, lost)
+
+
+def _lowBits(mask, n):
+    """A helper function to take the n lowest bits of a bitmask."""
+    bits = 0
+    for _ in range(n):
+        low = mask & -mask
+        bits |= low
+        mask ^= low
+    return bits
+
+
+@lru_cache(maxsize=4096)
+def imagesOf(mask):
+    """
+    Computes the Tn and TnI images of a pcset for all the 12 values of n,
+    memoized by bitmask, so that scanning the operational paths from the
+    same pcset repeatedly does not redo the 24 rotations.
+
+    :param mask: an int for the bitmask of a pcset.
+    :return: a tuple of two tuples of 12 ints, the bitmasks of Tn and TnI
+        images of the pcset indexed by n.
+    """
+    inv = INVERT_TABLE[mask]
+    return (tuple(rot(mask) for rot in ROTATIONS),
+            tuple(rot(inv) for rot in ROTATIONS))
+
+
+@lru_cache(maxsize=4096)
+def indexVectorOf(mask):
+    """
+    Computes the index vector of a pcset, memoized by bitmask. Entry k of
+    the addition table counts the ordered pairs (i, j) with i + j = k, that
+    is, the pcs the set has in common with its TkI image.
+
+    :param mask: an int for the bitmask of a pcset.
+    :return: a tuple of 12 ints representing the index vector.
+    """
+    _, tnis = imagesOf(mask)
+    return tuple(popcount(mask & tni) for tni in tnis)
+
+
+def _normalForm(mask):
+    """
+    A helper function to compute the normal form of a pcset: among the
+    rotations of the ascending pcseg, the one with the smallest span from
+    the first pc to the last, then to the second last, and so on, and
+    with the smallest first pc if still tied.
+    """
+    card = popcount(mask)
+    if card == 0:
+        return ()
+    elif card == 12:
+        return tuple(range(12))
+    # The rotations are represented by their start indices into the
+    #   ascending pcseg repeated twice, so that pcseg2[r + k] is the kth pc
+    #   of the rotation r without building the rotations themselves.
+    pcseg = sorted(_PCS_TABLE[mask])
+    pcseg2 = pcseg + pcseg
+    starts = range(card)
+    k = card - 1
+    # If k=0 is reached, NF is the one with the smallest first pc.
+    while len(starts) > 1 and k > 0:
+        intervals = [(pcseg2[r + k] - pcseg2[r]) % 12 for r in starts]
+        # Delete a rotation if its interval > the smallest interval
+        smallest = min(intervals)
+        starts = [r for r, i in zip(starts, intervals) if i == smallest]
+        k -= 1
+    return tuple(pcseg2[starts[0]:starts[0] + card])
+
+
+def _primeForm(mask):
+    """
+    A helper function to compute the prime form of a pcset: the normal
+    form of the pcset or its inversion transposed to begin with 0, whichever
+    is more packed to the left.
+    """
+    card = popcount(mask)
+    if card == 0:
+        return ()
+    elif card == 12:
+        return tuple(range(12))
+    # The normal forms are computed afresh rather than through normalFormOf(),
+    #   so that maketables.py never derives PRIME_TABLE from a stale
+    #   NORMAL_TABLE.
+    s1, s2 = _normalForm(mask), _normalForm(INVERT_TABLE[mask])
+    z1, z2 = s1[0], s2[0]
+    # Intervals from the first pc are compared on the fly, and only the
+    #   winning form is transposed to begin with 0.
+    for i in range(card - 2, 0, -1):
+        a, b = (s1[i] - z1) % 12, (s2[i] - z2) % 12
+        if a > b:
+            s1, z1 = s2, z2
+        if a != b:
+            break
+    return tuple((pc - z1) % 12 for pc in s1)
+
+
+@lru_cache(maxsize=4096)
+def normalFormOf(mask):
+    """
+    Computes the normal form of a pcset, memoized by bitmask. The normal
+    forms are decoded from NORMAL_TABLE where it has been generated.
+
+    :param mask: an int for the bitmask of a pcset.
+    :return: a tuple of pcs representing the normal form.
+    """
+    if NORMAL_TABLE is None:
+        return _normalForm(mask)
+    # The normal form is the rotation of the ascending pcseg beginning with
+    #   the first pc given by NORMAL_TABLE.
+    pcseg = sorted(_PCS_TABLE[mask])
+    if not pcseg:
+        return ()
+    r = pcseg.index(NORMAL_TABLE[mask])
+    return tuple(pcseg[r:] + pcseg[:r])
+
+
+@lru_cache(maxsize=4096)
+def primeFormOf(mask):
+    """
+    Computes the prime form of a pcset, memoized by bitmask. The prime
+    forms are decoded from PRIME_TABLE where it has been generated.
+
+    :param mask: an int for the bitmask of a pcset.
+    :return: a tuple of pcs representing the prime form.
+    """
+    if PRIME_TABLE is None:
+        return _primeForm(mask)
+    return tuple(sorted(_PCS_TABLE[PRIME_TABLE[mask]]))
+
+
+@lru_cache(maxsize=4096)
+def transformationLevelsOf(mask):
+    """
+    Computes the Tn/TnI transformation levels of a pcset, memoized by
+    bitmask: the values of n where Tn or TnI maps the prime form onto the
+    pcset.
+
+    :param mask: an int for the bitmask of a pcset.
+    :return: a tuple of two tuples of ints, the Tn and TnI levels.
+    """
+    tns, tnis = imagesOf(toMask(primeFormOf(mask)))
+    return (tuple(n for n, tn in enumerate(tns) if tn == mask),
+            tuple(n for n, tni in enumerate(tnis) if tni == mask))
+
+
+@lru_cache(maxsize=4096)
+def symmetryOf(mask):
+    """
+    Computes the levels of transpositional and inversional symmetry of a
+    pcset, memoized by bitmask.
+
+    The levels of transpositional symmetry form a subgroup of the integers
+    mod 12, so they are the multiples of the smallest divisor of 12 at which
+    the pcset maps onto itself. The levels of inversional symmetry are then
+    those of the transpositional symmetry offset by any one of them, because
+    TnI followed by TmI is T(m-n).
+
+    :param mask: an int for the bitmask of a pcset.
+    :return: a tuple of two tuples of ints, the Tn and TnI levels that map
+        the pcset onto itself.
+    """
+    step = next(n for n in (1, 2, 3, 4, 6, 12)
+                if n == 12 or ROTATIONS[n](mask) == mask)
+    levels = tuple(range(0, 12, step))
+    inv = INVERT_TABLE[mask]
+    index = next((n for n, rot in enumerate(ROTATIONS) if rot(inv) == mask),
+                 None)
+    if index is None:
+        return levels, ()
+    return levels, tuple(sorted((index + n) % 12 for n in levels))
+
+
+def _makeInvertTable():
+    """
+    A helper function to compute the inversions of all the 4096 pcsets.
+
+    Reversing the 12 bits maps pc p onto 11-p, and rotating the result by
+    one bit (T1) maps it onto 12-p, the inversion around pc 0. Each bit
+    reversal is that of the mask without its lowest bit, shifted down by
+    one, with the lowest bit moved to the top.
+    """
+    reverse = [0]
+    for mask in range(1, 4096):
+        reverse.append((reverse[mask >> 1] >> 1) | ((mask & 1) << 11))
+    return tuple(((rev << 1) | (rev >> 11)) & MASK_ALL for rev in reverse)
+
+
+def _makeIcvTable():
+    """
+    A helper function to compute the ICVs of all the 4096 pcsets.
+
+    The ICV of a pcset is that of the pcset without its highest pc plus the
+    ics between the highest pc and the others, so each pair of pcs is
+    visited only once over the whole table.
+    """
+    table = [(0, 0, 0, 0, 0, 0)]
+    for mask in range(1, 4096):
+        top = mask.bit_length() - 1  # Highest pc
+        rest = mask ^ (1 << top)
+        vec = list(table[rest])
+        for pc in _PCS_TABLE[rest]:
+            vec[IC_TABLE[top - pc] - 1] += 1
+        table.append(tuple(vec))
+    return tuple(table)
+
+
+# Inversions around pc 0 indexed by bitmask
+INVERT_TABLE = _makeInvertTable()
+
+# ICVs, first pcs of the normal forms, and bitmasks of the prime forms
+#   indexed by bitmask, loaded from the module generated by maketables.py.
+#   Without it, the ICVs are computed here and the normal and prime forms by
+#   normalFormOf() and primeFormOf() on demand.
+try:
+    from ._tables import ICV_TABLE, NORMAL_TABLE, PRIME_TABLE
+except ImportError:
+    ICV_TABLE, NORMAL_TABLE, PRIME_TABLE = _makeIcvTable(), None, None
@@ -0,0 +1,2063 @@
+# Lookup tables indexed by bitmask, generated by maketables.py: do not edit.
+
+# ICVs
+ICV_TABLE = (
+    (0, 0, 0, 0, 0, 0), (0, 0, 0, 0, 0, 0), (0, 0, 0, 0, 0, 0),
+    (1, 0, 0, 0, 0, 0), (0, 0, 0, 0, 0, 0), (0, 1, 0, 0, 0, 0),
+    (1, 0, 0, 0, 0, 0), (2, 1, 0, 0, 0, 0), (0, 0, 0, 0, 0, 0),
+    (0, 0, 1, 0, 0, 0), (0, 1, 0, 0, 0, 0), (1, 1, 1, 0, 0, 0),
+    (1, 0, 0, 0, 0, 0), (1, 1, 1, 0, 0, 0), (2, 1, 0, 0, 0, 0),
+    (3, 2, 1, 0, 0, 0), (0, 0, 0, 0, 0, 0), (0, 0, 0, 1, 0, 0),
+    (0, 0, 1, 0, 0, 0), (1, 0, 1, 1, 0, 0), (0, 1, 0, 0, 0, 0),
+    (0, 2, 0, 1, 0, 0), (1, 1, 1, 0, 0, 0), (2, 2, 1, 1, 0, 0),
+    (1, 0, 0, 0, 0, 0), (1, 0, 1, 1, 0, 0), (1, 1, 1, 0, 0, 0),
+    (2, 1, 2, 1, 0, 0), (2, 1, 0, 0, 0, 0), (2, 2, 1, 1, 0, 0),
+    (3, 2, 1, 0, 0, 0), (4, 3, 2, 1, 0, 0), (0, 0, 0, 0, 0, 0),
+    (0, 0, 0, 0, 1, 0), (0, 0, 0, 1, 0, 0), (1, 0, 0, 1, 1, 0),
+    (0, 0, 1, 0, 0, 0), (0, 1, 1, 0, 1, 0), (1, 0, 1, 1, 0, 0),
+    (2, 1, 1, 1, 1, 0), (0, 1, 0, 0, 0, 0), (0, 1, 1, 0, 1, 0),
+    (0, 2, 0, 1, 0, 0), (1, 2, 1, 1, 1, 0), (1, 1, 1, 0, 0, 0),
+    (1, 2, 2, 0, 1, 0), (2, 2, 1, 1, 0, 0), (3, 3, 2, 1, 1, 0),
+    (1, 0, 0, 0, 0, 0), (1, 0, 0, 1, 1, 0), (1, 0, 1, 1, 0, 0),
+    (2, 0, 1, 2, 1, 0), (1, 1, 1, 0, 0, 0), (1, 2, 1, 1, 1, 0),
+    (2, 1, 2, 1, 0, 0), (3, 2, 2, 2, 1, 0), (2, 1, 0, 0, 0, 0),
+    (2, 1, 1, 1, 1, 0), (2, 2, 1, 1, 0, 0), (3, 2, 2, 2, 1, 0),
+    (3, 2, 1, 0, 0, 0), (3, 3, 2, 1, 1, 0), (4, 3, 2, 1, 0, 0),
+    (5, 4, 3, 2, 1, 0), (0, 0, 0, 0, 0, 0), (0, 0, 0, 0, 0, 1),
+    (0, 0, 0, 0, 1, 0), (1, 0, 0, 0, 1, 1), (0, 0, 0, 1, 0, 0),
+    (0, 1, 0, 1, 0, 1), (1, 0, 0, 1, 1, 0), (2, 1, 0, 1, 1, 1),
+    (0, 0, 1, 0, 0, 0), (0, 0, 2, 0, 0, 1), (0, 1, 1, 0, 1, 0),
+    (1, 1, 2, 0, 1, 1), (1, 0, 1, 1, 0, 0), (1, 1, 2, 1, 0, 1),
+    (2, 1, 1, 1, 1, 0), (3, 2, 2, 1, 1, 1), (0, 1, 0, 0, 0, 0),
+    (0, 1, 0, 1, 0, 1), (0, 1, 1, 0, 1, 0), (1, 1, 1, 1, 1, 1),
+    (0, 2, 0, 1, 0, 0), (0, 3, 0, 2, 0, 1), (1, 2, 1, 1, 1, 0),
+    (2, 3, 1, 2, 1, 1), (1, 1, 1, 0, 0, 0), (1, 1, 2, 1, 0, 1),
+    (1, 2, 2, 0, 1, 0), (2, 2, 3, 1, 1, 1), (2, 2, 1, 1, 0, 0),
+    (2, 3, 2, 2, 0, 1), (3, 3, 2, 1, 1, 0), (4, 4, 3, 2, 1, 1),
+    (1, 0, 0, 0, 0, 0), (1, 0, 0, 0, 1, 1), (1, 0, 0, 1, 1, 0),
+    (2, 0, 0, 1, 2, 1), (1, 0, 1, 1, 0, 0), (1, 1, 1, 1, 1, 1),
+    (2, 0, 1, 2, 1, 0), (3, 1, 1, 2, 2, 1), (1, 1, 1, 0, 0, 0),
+    (1, 1, 2, 0, 1, 1), (1, 2, 1, 1, 1, 0), (2, 2, 2, 1, 2, 1),
+    (2, 1, 2, 1, 0, 0), (2, 2, 3, 1, 1, 1), (3, 2, 2, 2, 1, 0),
+    (4, 3, 3, 2, 2, 1), (2, 1, 0, 0, 0, 0), (2, 1, 0, 1, 1, 1),
+    (2, 1, 1, 1, 1, 0), (3, 1, 1, 2, 2, 1), (2, 2, 1, 1, 0, 0),
+    (2, 3, 1, 2, 1, 1), (3, 2, 2, 2, 1, 0), (4, 3, 2, 3, 2, 1),
+    (3, 2, 1, 0, 0, 0), (3, 2, 2, 1, 1, 1), (3, 3, 2, 1, 1, 0),
+    (4, 3, 3, 2, 2, 1), (4, 3, 2, 1, 0, 0), (4, 4, 3, 2, 1, 1),
+    (5, 4, 3, 2, 1, 0), (6, 5, 4, 3, 2, 1), (0, 0, 0, 0, 0, 0),
+    (0, 0, 0, 0, 1, 0), (0, 0, 0, 0, 0, 1), (1, 0, 0, 0, 1, 1),
+    (0, 0, 0, 0, 1, 0), (0, 1, 0, 0, 2, 0), (1, 0, 0, 0, 1, 1),
+    (2, 1, 0, 0, 2, 1), (0, 0, 0, 1, 0, 0), (0, 0, 1, 1, 1, 0),
+    (0, 1, 0, 1, 0, 1), (1, 1, 1, 1, 1, 1), (1, 0, 0, 1, 1, 0),
+    (1, 1, 1, 1, 2, 0), (2, 1, 0, 1, 1, 1), (3, 2, 1, 1, 2, 1),
+    (0, 0, 1, 0, 0, 0), (0, 0, 1, 1, 1, 0), (0, 0, 2, 0, 0, 1),
+    (1, 0, 2, 1, 1, 1), (0, 1, 1, 0, 1, 0), (0, 2, 1, 1, 2, 0),
+    (1, 1, 2, 0, 1, 1), (2, 2, 2, 1, 2, 1), (1, 0, 1, 1, 0, 0),
+    (1, 0, 2, 2, 1, 0), (1, 1, 2, 1, 0, 1), (2, 1, 3, 2, 1, 1),
+    (2, 1, 1, 1, 1, 0), (2, 2, 2, 2, 2, 0), (3, 2, 2, 1, 1, 1),
+    (4, 3, 3, 2, 2, 1), (0, 1, 0, 0, 0, 0), (0, 1, 0, 0, 2, 0),
+    (0, 1, 0, 1, 0, 1), (1, 1, 0, 1, 2, 1), (0, 1, 1, 0, 1, 0),
+    (0, 2, 1, 0, 3, 0), (1, 1, 1, 1, 1, 1), (2, 2, 1, 1, 3, 1),
+    (0, 2, 0, 1, 0, 0), (0, 2, 1, 1, 2, 0), (0, 3, 0, 2, 0, 1),
+    (1, 3, 1, 2, 2, 1), (1, 2, 1, 1, 1, 0), (1, 3, 2, 1, 3, 0),
+    (2, 3, 1, 2, 1, 1), (3, 4, 2, 2, 3, 1), (1, 1, 1, 0, 0, 0),
+    (1, 1, 1, 1, 2, 0), (1, 1, 2, 1, 0, 1), (2, 1, 2, 2, 2, 1),
+    (1, 2, 2, 0, 1, 0), (1, 3, 2, 1, 3, 0), (2, 2, 3, 1, 1, 1),
+    (3, 3, 3, 2, 3, 1), (2, 2, 1, 1, 0, 0), (2, 2, 2, 2, 2, 0),
+    (2, 3, 2, 2, 0, 1), (3, 3, 3, 3, 2, 1), (3, 3, 2, 1, 1, 0),
+    (3, 4, 3, 2, 3, 0), (4, 4, 3, 2, 1, 1), (5, 5, 4, 3, 3, 1),
+    (1, 0, 0, 0, 0, 0), (1, 0, 0, 0, 1, 1), (1, 0, 0, 0, 1, 1),
+    (2, 0, 0, 0, 2, 2), (1, 0, 0, 1, 1, 0), (1, 1, 0, 1, 2, 1),
+    (2, 0, 0, 1, 2, 1), (3, 1, 0, 1, 3, 2), (1, 0, 1, 1, 0, 0),
+    (1, 0, 2, 1, 1, 1), (1, 1, 1, 1, 1, 1), (2, 1, 2, 1, 2, 2),
+    (2, 0, 1, 2, 1, 0), (2, 1, 2, 2, 2, 1), (3, 1, 1, 2, 2, 1),
+    (4, 2, 2, 2, 3, 2), (1, 1, 1, 0, 0, 0), (1, 1, 1, 1, 1, 1),
+    (1, 1, 2, 0, 1, 1), (2, 1, 2, 1, 2, 2), (1, 2, 1, 1, 1, 0),
+    (1, 3, 1, 2, 2, 1), (2, 2, 2, 1, 2, 1), (3, 3, 2, 2, 3, 2),
+    (2, 1, 2, 1, 0, 0), (2, 1, 3, 2, 1, 1), (2, 2, 3, 1, 1, 1),
+    (3, 2, 4, 2, 2, 2), (3, 2, 2, 2, 1, 0), (3, 3, 3, 3, 2, 1),
+    (4, 3, 3, 2, 2, 1), (5, 4, 4, 3, 3, 2), (2, 1, 0, 0, 0, 0),
+    (2, 1, 0, 0, 2, 1), (2, 1, 0, 1, 1, 1), (3, 1, 0, 1, 3, 2),
+    (2, 1, 1, 1, 1, 0), (2, 2, 1, 1, 3, 1), (3, 1, 1, 2, 2, 1),
+    (4, 2, 1, 2, 4, 2), (2, 2, 1, 1, 0, 0), (2, 2, 2, 1, 2, 1),
+    (2, 3, 1, 2, 1, 1), (3, 3, 2, 2, 3, 2), (3, 2, 2, 2, 1, 0),
+    (3, 3, 3, 2, 3, 1), (4, 3, 2, 3, 2, 1), (5, 4, 3, 3, 4, 2),
+    (3, 2, 1, 0, 0, 0), (3, 2, 1, 1, 2, 1), (3, 2, 2, 1, 1, 1),
+    (4, 2, 2, 2, 3, 2), (3, 3, 2, 1, 1, 0), (3, 4, 2, 2, 3, 1),
+    (4, 3, 3, 2, 2, 1), (5, 4, 3, 3, 4, 2), (4, 3, 2, 1, 0, 0),
+    (4, 3, 3, 2, 2, 1), (4, 4, 3, 2, 1, 1), (5, 4, 4, 3, 3, 2),
+    (5, 4, 3, 2, 1, 0), (5, 5, 4, 3, 3, 1), (6, 5, 4, 3, 2, 1),
+    (7, 6, 5, 4, 4, 2), (0, 0, 0, 0, 0, 0), (0, 0, 0, 1, 0, 0),
+    (0, 0, 0, 0, 1, 0), (1, 0, 0, 1, 1, 0), (0, 0, 0, 0, 0, 1),
+    (0, 1, 0, 1, 0, 1), (1, 0, 0, 0, 1, 1), (2, 1, 0, 1, 1, 1),
+    (0, 0, 0, 0, 1, 0), (0, 0, 1, 1, 1, 0), (0, 1, 0, 0, 2, 0),
+    (1, 1, 1, 1, 2, 0), (1, 0, 0, 0, 1, 1), (1, 1, 1, 1, 1, 1),
+    (2, 1, 0, 0, 2, 1), (3, 2, 1, 1, 2, 1), (0, 0, 0, 1, 0, 0),
+    (0, 0, 0, 3, 0, 0), (0, 0, 1, 1, 1, 0), (1, 0, 1, 3, 1, 0),
+    (0, 1, 0, 1, 0, 1), (0, 2, 0, 3, 0, 1), (1, 1, 1, 1, 1, 1),
+    (2, 2, 1, 3, 1, 1), (1, 0, 0, 1, 1, 0), (1, 0, 1, 3, 1, 0),
+    (1, 1, 1, 1, 2, 0), (2, 1, 2, 3, 2, 0), (2, 1, 0, 1, 1, 1),
+    (2, 2, 1, 3, 1, 1), (3, 2, 1, 1, 2, 1), (4, 3, 2, 3, 2, 1),
+    (0, 0, 1, 0, 0, 0), (0, 0, 1, 1, 1, 0), (0, 0, 1, 1, 1, 0),
+    (1, 0, 1, 2, 2, 0), (0, 0, 2, 0, 0, 1), (0, 1, 2, 1, 1, 1),
+    (1, 0, 2, 1, 1, 1), (2, 1, 2, 2, 2, 1), (0, 1, 1, 0, 1, 0),
+    (0, 1, 2, 1, 2, 0), (0, 2, 1, 1, 2, 0), (1, 2, 2, 2, 3, 0),
+    (1, 1, 2, 0, 1, 1), (1, 2, 3, 1, 2, 1), (2, 2, 2, 1, 2, 1),
+    (3, 3, 3, 2, 3, 1), (1, 0, 1, 1, 0, 0), (1, 0, 1, 3, 1, 0),
+    (1, 0, 2, 2, 1, 0), (2, 0, 2, 4, 2, 0), (1, 1, 2, 1, 0, 1),
+    (1, 2, 2, 3, 1, 1), (2, 1, 3, 2, 1, 1), (3, 2, 3, 4, 2, 1),
+    (2, 1, 1, 1, 1, 0), (2, 1, 2, 3, 2, 0), (2, 2, 2, 2, 2, 0),
+    (3, 2, 3, 4, 3, 0), (3, 2, 2, 1, 1, 1), (3, 3, 3, 3, 2, 1),
+    (4, 3, 3, 2, 2, 1), (5, 4, 4, 4, 3, 1), (0, 1, 0, 0, 0, 0),
+    (0, 1, 0, 1, 0, 1), (0, 1, 0, 0, 2, 0), (1, 1, 0, 1, 2, 1),
+    (0, 1, 0, 1, 0, 1), (0, 2, 0, 2, 0, 2), (1, 1, 0, 1, 2, 1),
+    (2, 2, 0, 2, 2, 2), (0, 1, 1, 0, 1, 0), (0, 1, 2, 1, 1, 1),
+    (0, 2, 1, 0, 3, 0), (1, 2, 2, 1, 3, 1), (1, 1, 1, 1, 1, 1),
+    (1, 2, 2, 2, 1, 2), (2, 2, 1, 1, 3, 1), (3, 3, 2, 2, 3, 2),
+    (0, 2, 0, 1, 0, 0), (0, 2, 0, 3, 0, 1), (0, 2, 1, 1, 2, 0),
+    (1, 2, 1, 3, 2, 1), (0, 3, 0, 2, 0, 1), (0, 4, 0, 4, 0, 2),
+    (1, 3, 1, 2, 2, 1), (2, 4, 1, 4, 2, 2), (1, 2, 1, 1, 1, 0),
+    (1, 2, 2, 3, 1, 1), (1, 3, 2, 1, 3, 0), (2, 3, 3, 3, 3, 1),
+    (2, 3, 1, 2, 1, 1), (2, 4, 2, 4, 1, 2), (3, 4, 2, 2, 3, 1),
+    (4, 5, 3, 4, 3, 2), (1, 1, 1, 0, 0, 0), (1, 1, 1, 1, 1, 1),
+    (1, 1, 1, 1, 2, 0), (2, 1, 1, 2, 3, 1), (1, 1, 2, 1, 0, 1),
+    (1, 2, 2, 2, 1, 2), (2, 1, 2, 2, 2, 1), (3, 2, 2, 3, 3, 2),
+    (1, 2, 2, 0, 1, 0), (1, 2, 3, 1, 2, 1), (1, 3, 2, 1, 3, 0),
+    (2, 3, 3, 2, 4, 1), (2, 2, 3, 1, 1, 1), (2, 3, 4, 2, 2, 2),
+    (3, 3, 3, 2, 3, 1), (4, 4, 4, 3, 4, 2), (2, 2, 1, 1, 0, 0),
+    (2, 2, 1, 3, 1, 1), (2, 2, 2, 2, 2, 0), (3, 2, 2, 4, 3, 1),
+    (2, 3, 2, 2, 0, 1), (2, 4, 2, 4, 1, 2), (3, 3, 3, 3, 2, 1),
+    (4, 4, 3, 5, 3, 2), (3, 3, 2, 1, 1, 0), (3, 3, 3, 3, 2, 1),
+    (3, 4, 3, 2, 3, 0), (4, 4, 4, 4, 4, 1), (4, 4, 3, 2, 1, 1),
+    (4, 5, 4, 4, 2, 2), (5, 5, 4, 3, 3, 1), (6, 6, 5, 5, 4, 2),
+    (1, 0, 0, 0, 0, 0), (1, 0, 0, 1, 1, 0), (1, 0, 0, 0, 1, 1),
+    (2, 0, 0, 1, 2, 1), (1, 0, 0, 0, 1, 1), (1, 1, 0, 1, 2, 1),
+    (2, 0, 0, 0, 2, 2), (3, 1, 0, 1, 3, 2), (1, 0, 0, 1, 1, 0),
+    (1, 0, 1, 2, 2, 0), (1, 1, 0, 1, 2, 1), (2, 1, 1, 2, 3, 1),
+    (2, 0, 0, 1, 2, 1), (2, 1, 1, 2, 3, 1), (3, 1, 0, 1, 3, 2),
+    (4, 2, 1, 2, 4, 2), (1, 0, 1, 1, 0, 0), (1, 0, 1, 3, 1, 0),
+    (1, 0, 2, 1, 1, 1), (2, 0, 2, 3, 2, 1), (1, 1, 1, 1, 1, 1),
+    (1, 2, 1, 3, 2, 1), (2, 1, 2, 1, 2, 2), (3, 2, 2, 3, 3, 2),
+    (2, 0, 1, 2, 1, 0), (2, 0, 2, 4, 2, 0), (2, 1, 2, 2, 2, 1),
+    (3, 1, 3, 4, 3, 1), (3, 1, 1, 2, 2, 1), (3, 2, 2, 4, 3, 1),
+    (4, 2, 2, 2, 3, 2), (5, 3, 3, 4, 4, 2), (1, 1, 1, 0, 0, 0),
+    (1, 1, 1, 1, 2, 0), (1, 1, 1, 1, 1, 1), (2, 1, 1, 2, 3, 1),
+    (1, 1, 2, 0, 1, 1), (1, 2, 2, 1, 3, 1), (2, 1, 2, 1, 2, 2),
+    (3, 2, 2, 2, 4, 2), (1, 2, 1, 1, 1, 0), (1, 2, 2, 2, 3, 0),
+    (1, 3, 1, 2, 2, 1), (2, 3, 2, 3, 4, 1), (2, 2, 2, 1, 2, 1),
+    (2, 3, 3, 2, 4, 1), (3, 3, 2, 2, 3, 2), (4, 4, 3, 3, 5, 2),
+    (2, 1, 2, 1, 0, 0), (2, 1, 2, 3, 2, 0), (2, 1, 3, 2, 1, 1),
+    (3, 1, 3, 4, 3, 1), (2, 2, 3, 1, 1, 1), (2, 3, 3, 3, 3, 1),
+    (3, 2, 4, 2, 2, 2), (4, 3, 4, 4, 4, 2), (3, 2, 2, 2, 1, 0),
+    (3, 2, 3, 4, 3, 0), (3, 3, 3, 3, 2, 1), (4, 3, 4, 5, 4, 1),
+    (4, 3, 3, 2, 2, 1), (4, 4, 4, 4, 4, 1), (5, 4, 4, 3, 3, 2),
+    (6, 5, 5, 5, 5, 2), (2, 1, 0, 0, 0, 0), (2, 1, 0, 1, 1, 1),
+    (2, 1, 0, 0, 2, 1), (3, 1, 0, 1, 3, 2), (2, 1, 0, 1, 1, 1),
+    (2, 2, 0, 2, 2, 2), (3, 1, 0, 1, 3, 2), (4, 2, 0, 2, 4, 3),
+    (2, 1, 1, 1, 1, 0), (2, 1, 2, 2, 2, 1), (2, 2, 1, 1, 3, 1),
+    (3, 2, 2, 2, 4, 2), (3, 1, 1, 2, 2, 1), (3, 2, 2, 3, 3, 2),
+    (4, 2, 1, 2, 4, 2), (5, 3, 2, 3, 5, 3), (2, 2, 1, 1, 0, 0),
+    (2, 2, 1, 3, 1, 1), (2, 2, 2, 1, 2, 1), (3, 2, 2, 3, 3, 2),
+    (2, 3, 1, 2, 1, 1), (2, 4, 1, 4, 2, 2), (3, 3, 2, 2, 3, 2),
+    (4, 4, 2, 4, 4, 3), (3, 2, 2, 2, 1, 0), (3, 2, 3, 4, 2, 1),
+    (3, 3, 3, 2, 3, 1), (4, 3, 4, 4, 4, 2), (4, 3, 2, 3, 2, 1),
+    (4, 4, 3, 5, 3, 2), (5, 4, 3, 3, 4, 2), (6, 5, 4, 5, 5, 3),
+    (3, 2, 1, 0, 0, 0), (3, 2, 1, 1, 2, 1), (3, 2, 1, 1, 2, 1),
+    (4, 2, 1, 2, 4, 2), (3, 2, 2, 1, 1, 1), (3, 3, 2, 2, 3, 2),
+    (4, 2, 2, 2, 3, 2), (5, 3, 2, 3, 5, 3), (3, 3, 2, 1, 1, 0),
+    (3, 3, 3, 2, 3, 1), (3, 4, 2, 2, 3, 1), (4, 4, 3, 3, 5, 2),
+    (4, 3, 3, 2, 2, 1), (4, 4, 4, 3, 4, 2), (5, 4, 3, 3, 4, 2),
+    (6, 5, 4, 4, 6, 3), (4, 3, 2, 1, 0, 0), (4, 3, 2, 3, 2, 1),
+    (4, 3, 3, 2, 2, 1), (5, 3, 3, 4, 4, 2), (4, 4, 3, 2, 1, 1),
+    (4, 5, 3, 4, 3, 2), (5, 4, 4, 3, 3, 2), (6, 5, 4, 5, 5, 3),
+    (5, 4, 3, 2, 1, 0), (5, 4, 4, 4, 3, 1), (5, 5, 4, 3, 3, 1),
+    (6, 5, 5, 5, 5, 2), (6, 5, 4, 3, 2, 1), (6, 6, 5, 5, 4, 2),
+    (7, 6, 5, 4, 4, 2), (8, 7, 6, 6, 6, 3), (0, 0, 0, 0, 0, 0),
+    (0, 0, 1, 0, 0, 0), (0, 0, 0, 1, 0, 0), (1, 0, 1, 1, 0, 0),
+    (0, 0, 0, 0, 1, 0), (0, 1, 1, 0, 1, 0), (1, 0, 0, 1, 1, 0),
+    (2, 1, 1, 1, 1, 0), (0, 0, 0, 0, 0, 1), (0, 0, 2, 0, 0, 1),
+    (0, 1, 0, 1, 0, 1), (1, 1, 2, 1, 0, 1), (1, 0, 0, 0, 1, 1),
+    (1, 1, 2, 0, 1, 1), (2, 1, 0, 1, 1, 1), (3, 2, 2, 1, 1, 1),
+    (0, 0, 0, 0, 1, 0), (0, 0, 1, 1, 1, 0), (0, 0, 1, 1, 1, 0),
+    (1, 0, 2, 2, 1, 0), (0, 1, 0, 0, 2, 0), (0, 2, 1, 1, 2, 0),
+    (1, 1, 1, 1, 2, 0), (2, 2, 2, 2, 2, 0), (1, 0, 0, 0, 1, 1),
+    (1, 0, 2, 1, 1, 1), (1, 1, 1, 1, 1, 1), (2, 1, 3, 2, 1, 1),
+    (2, 1, 0, 0, 2, 1), (2, 2, 2, 1, 2, 1), (3, 2, 1, 1, 2, 1),
+    (4, 3, 3, 2, 2, 1), (0, 0, 0, 1, 0, 0), (0, 0, 1, 1, 1, 0),
+    (0, 0, 0, 3, 0, 0), (1, 0, 1, 3, 1, 0), (0, 0, 1, 1, 1, 0),
+    (0, 1, 2, 1, 2, 0), (1, 0, 1, 3, 1, 0), (2, 1, 2, 3, 2, 0),
+    (0, 1, 0, 1, 0, 1), (0, 1, 2, 1, 1, 1), (0, 2, 0, 3, 0, 1),
+    (1, 2, 2, 3, 1, 1), (1, 1, 1, 1, 1, 1), (1, 2, 3, 1, 2, 1),
+    (2, 2, 1, 3, 1, 1), (3, 3, 3, 3, 2, 1), (1, 0, 0, 1, 1, 0),
+    (1, 0, 1, 2, 2, 0), (1, 0, 1, 3, 1, 0), (2, 0, 2, 4, 2, 0),
+    (1, 1, 1, 1, 2, 0), (1, 2, 2, 2, 3, 0), (2, 1, 2, 3, 2, 0),
+    (3, 2, 3, 4, 3, 0), (2, 1, 0, 1, 1, 1), (2, 1, 2, 2, 2, 1),
+    (2, 2, 1, 3, 1, 1), (3, 2, 3, 4, 2, 1), (3, 2, 1, 1, 2, 1),
+    (3, 3, 3, 2, 3, 1), (4, 3, 2, 3, 2, 1), (5, 4, 4, 4, 3, 1),
+    (0, 0, 1, 0, 0, 0), (0, 0, 2, 0, 0, 1), (0, 0, 1, 1, 1, 0),
+    (1, 0, 2, 1, 1, 1), (0, 0, 1, 1, 1, 0), (0, 1, 2, 1, 1, 1),
+    (1, 0, 1, 2, 2, 0), (2, 1, 2, 2, 2, 1), (0, 0, 2, 0, 0, 1),
+    (0, 0, 4, 0, 0, 2), (0, 1, 2, 1, 1, 1), (1, 1, 4, 1, 1, 2),
+    (1, 0, 2, 1, 1, 1), (1, 1, 4, 1, 1, 2), (2, 1, 2, 2, 2, 1),
+    (3, 2, 4, 2, 2, 2), (0, 1, 1, 0, 1, 0), (0, 1, 2, 1, 1, 1),
+    (0, 1, 2, 1, 2, 0), (1, 1, 3, 2, 2, 1), (0, 2, 1, 1, 2, 0),
+    (0, 3, 2, 2, 2, 1), (1, 2, 2, 2, 3, 0), (2, 3, 3, 3, 3, 1),
+    (1, 1, 2, 0, 1, 1), (1, 1, 4, 1, 1, 2), (1, 2, 3, 1, 2, 1),
+    (2, 2, 5, 2, 2, 2), (2, 2, 2, 1, 2, 1), (2, 3, 4, 2, 2, 2),
+    (3, 3, 3, 2, 3, 1), (4, 4, 5, 3, 3, 2), (1, 0, 1, 1, 0, 0),
+    (1, 0, 2, 1, 1, 1), (1, 0, 1, 3, 1, 0), (2, 0, 2, 3, 2, 1),
+    (1, 0, 2, 2, 1, 0), (1, 1, 3, 2, 2, 1), (2, 0, 2, 4, 2, 0),
+    (3, 1, 3, 4, 3, 1), (1, 1, 2, 1, 0, 1), (1, 1, 4, 1, 1, 2),
+    (1, 2, 2, 3, 1, 1), (2, 2, 4, 3, 2, 2), (2, 1, 3, 2, 1, 1),
+    (2, 2, 5, 2, 2, 2), (3, 2, 3, 4, 2, 1), (4, 3, 5, 4, 3, 2),
+    (2, 1, 1, 1, 1, 0), (2, 1, 2, 2, 2, 1), (2, 1, 2, 3, 2, 0),
+    (3, 1, 3, 4, 3, 1), (2, 2, 2, 2, 2, 0), (2, 3, 3, 3, 3, 1),
+    (3, 2, 3, 4, 3, 0), (4, 3, 4, 5, 4, 1), (3, 2, 2, 1, 1, 1),
+    (3, 2, 4, 2, 2, 2), (3, 3, 3, 3, 2, 1), (4, 3, 5, 4, 3, 2),
+    (4, 3, 3, 2, 2, 1), (4, 4, 5, 3, 3, 2), (5, 4, 4, 4, 3, 1),
+    (6, 5, 6, 5, 4, 2), (0, 1, 0, 0, 0, 0), (0, 1, 1, 0, 1, 0),
+    (0, 1, 0, 1, 0, 1), (1, 1, 1, 1, 1, 1), (0, 1, 0, 0, 2, 0),
+    (0, 2, 1, 0, 3, 0), (1, 1, 0, 1, 2, 1), (2, 2, 1, 1, 3, 1),
+    (0, 1, 0, 1, 0, 1), (0, 1, 2, 1, 1, 1), (0, 2, 0, 2, 0, 2),
+    (1, 2, 2, 2, 1, 2), (1, 1, 0, 1, 2, 1), (1, 2, 2, 1, 3, 1),
+    (2, 2, 0, 2, 2, 2), (3, 3, 2, 2, 3, 2), (0, 1, 1, 0, 1, 0),
+    (0, 1, 2, 1, 2, 0), (0, 1, 2, 1, 1, 1), (1, 1, 3, 2, 2, 1),
+    (0, 2, 1, 0, 3, 0), (0, 3, 2, 1, 4, 0), (1, 2, 2, 1, 3, 1),
+    (2, 3, 3, 2, 4, 1), (1, 1, 1, 1, 1, 1), (1, 1, 3, 2, 2, 1),
+    (1, 2, 2, 2, 1, 2), (2, 2, 4, 3, 2, 2), (2, 2, 1, 1, 3, 1),
+    (2, 3, 3, 2, 4, 1), (3, 3, 2, 2, 3, 2), (4, 4, 4, 3, 4, 2),
+    (0, 2, 0, 1, 0, 0), (0, 2, 1, 1, 2, 0), (0, 2, 0, 3, 0, 1),
+    (1, 2, 1, 3, 2, 1), (0, 2, 1, 1, 2, 0), (0, 3, 2, 1, 4, 0),
+    (1, 2, 1, 3, 2, 1), (2, 3, 2, 3, 4, 1), (0, 3, 0, 2, 0, 1),
+    (0, 3, 2, 2, 2, 1), (0, 4, 0, 4, 0, 2), (1, 4, 2, 4, 2, 2),
+    (1, 3, 1, 2, 2, 1), (1, 4, 3, 2, 4, 1), (2, 4, 1, 4, 2, 2),
+    (3, 5, 3, 4, 4, 2), (1, 2, 1, 1, 1, 0), (1, 2, 2, 2, 3, 0),
+    (1, 2, 2, 3, 1, 1), (2, 2, 3, 4, 3, 1), (1, 3, 2, 1, 3, 0),
+    (1, 4, 3, 2, 5, 0), (2, 3, 3, 3, 3, 1), (3, 4, 4, 4, 5, 1),
+    (2, 3, 1, 2, 1, 1), (2, 3, 3, 3, 3, 1), (2, 4, 2, 4, 1, 2),
+    (3, 4, 4, 5, 3, 2), (3, 4, 2, 2, 3, 1), (3, 5, 4, 3, 5, 1),
+    (4, 5, 3, 4, 3, 2), (5, 6, 5, 5, 5, 2), (1, 1, 1, 0, 0, 0),
+    (1, 1, 2, 0, 1, 1), (1, 1, 1, 1, 1, 1), (2, 1, 2, 1, 2, 2),
+    (1, 1, 1, 1, 2, 0), (1, 2, 2, 1, 3, 1), (2, 1, 1, 2, 3, 1),
+    (3, 2, 2, 2, 4, 2), (1, 1, 2, 1, 0, 1), (1, 1, 4, 1, 1, 2),
+    (1, 2, 2, 2, 1, 2), (2, 2, 4, 2, 2, 3), (2, 1, 2, 2, 2, 1),
+    (2, 2, 4, 2, 3, 2), (3, 2, 2, 3, 3, 2), (4, 3, 4, 3, 4, 3),
+    (1, 2, 2, 0, 1, 0), (1, 2, 3, 1, 2, 1), (1, 2, 3, 1, 2, 1),
+    (2, 2, 4, 2, 3, 2), (1, 3, 2, 1, 3, 0), (1, 4, 3, 2, 4, 1),
+    (2, 3, 3, 2, 4, 1), (3, 4, 4, 3, 5, 2), (2, 2, 3, 1, 1, 1),
+    (2, 2, 5, 2, 2, 2), (2, 3, 4, 2, 2, 2), (3, 3, 6, 3, 3, 3),
+    (3, 3, 3, 2, 3, 1), (3, 4, 5, 3, 4, 2), (4, 4, 4, 3, 4, 2),
+    (5, 5, 6, 4, 5, 3), (2, 2, 1, 1, 0, 0), (2, 2, 2, 1, 2, 1),
+    (2, 2, 1, 3, 1, 1), (3, 2, 2, 3, 3, 2), (2, 2, 2, 2, 2, 0),
+    (2, 3, 3, 2, 4, 1), (3, 2, 2, 4, 3, 1), (4, 3, 3, 4, 5, 2),
+    (2, 3, 2, 2, 0, 1), (2, 3, 4, 2, 2, 2), (2, 4, 2, 4, 1, 2),
+    (3, 4, 4, 4, 3, 3), (3, 3, 3, 3, 2, 1), (3, 4, 5, 3, 4, 2),
+    (4, 4, 3, 5, 3, 2), (5, 5, 5, 5, 5, 3), (3, 3, 2, 1, 1, 0),
+    (3, 3, 3, 2, 3, 1), (3, 3, 3, 3, 2, 1), (4, 3, 4, 4, 4, 2),
+    (3, 4, 3, 2, 3, 0), (3, 5, 4, 3, 5, 1), (4, 4, 4, 4, 4, 1),
+    (5, 5, 5, 5, 6, 2), (4, 4, 3, 2, 1, 1), (4, 4, 5, 3, 3, 2),
+    (4, 5, 4, 4, 2, 2), (5, 5, 6, 5, 4, 3), (5, 5, 4, 3, 3, 1),
+    (5, 6, 6, 4, 5, 2), (6, 6, 5, 5, 4, 2), (7, 7, 7, 6, 6, 3),
+    (1, 0, 0, 0, 0, 0), (1, 0, 1, 1, 0, 0), (1, 0, 0, 1, 1, 0),
+    (2, 0, 1, 2, 1, 0), (1, 0, 0, 0, 1, 1), (1, 1, 1, 1, 1, 1),
+    (2, 0, 0, 1, 2, 1), (3, 1, 1, 2, 2, 1), (1, 0, 0, 0, 1, 1),
+    (1, 0, 2, 1, 1, 1), (1, 1, 0, 1, 2, 1), (2, 1, 2, 2, 2, 1),
+    (2, 0, 0, 0, 2, 2), (2, 1, 2, 1, 2, 2), (3, 1, 0, 1, 3, 2),
+    (4, 2, 2, 2, 3, 2), (1, 0, 0, 1, 1, 0), (1, 0, 1, 3, 1, 0),
+    (1, 0, 1, 2, 2, 0), (2, 0, 2, 4, 2, 0), (1, 1, 0, 1, 2, 1),
+    (1, 2, 1, 3, 2, 1), (2, 1, 1, 2, 3, 1), (3, 2, 2, 4, 3, 1),
+    (2, 0, 0, 1, 2, 1), (2, 0, 2, 3, 2, 1), (2, 1, 1, 2, 3, 1),
+    (3, 1, 3, 4, 3, 1), (3, 1, 0, 1, 3, 2), (3, 2, 2, 3, 3, 2),
+    (4, 2, 1, 2, 4, 2), (5, 3, 3, 4, 4, 2), (1, 0, 1, 1, 0, 0),
+    (1, 0, 2, 2, 1, 0), (1, 0, 1, 3, 1, 0), (2, 0, 2, 4, 2, 0),
+    (1, 0, 2, 1, 1, 1), (1, 1, 3, 2, 2, 1), (2, 0, 2, 3, 2, 1),
+    (3, 1, 3, 4, 3, 1), (1, 1, 1, 1, 1, 1), (1, 1, 3, 2, 2, 1),
+    (1, 2, 1, 3, 2, 1), (2, 2, 3, 4, 3, 1), (2, 1, 2, 1, 2, 2),
+    (2, 2, 4, 2, 3, 2), (3, 2, 2, 3, 3, 2), (4, 3, 4, 4, 4, 2),
+    (2, 0, 1, 2, 1, 0), (2, 0, 2, 4, 2, 0), (2, 0, 2, 4, 2, 0),
+    (3, 0, 3, 6, 3, 0), (2, 1, 2, 2, 2, 1), (2, 2, 3, 4, 3, 1),
+    (3, 1, 3, 4, 3, 1), (4, 2, 4, 6, 4, 1), (3, 1, 1, 2, 2, 1),
+    (3, 1, 3, 4, 3, 1), (3, 2, 2, 4, 3, 1), (4, 2, 4, 6, 4, 1),
+    (4, 2, 2, 2, 3, 2), (4, 3, 4, 4, 4, 2), (5, 3, 3, 4, 4, 2),
+    (6, 4, 5, 6, 5, 2), (1, 1, 1, 0, 0, 0), (1, 1, 2, 1, 0, 1),
+    (1, 1, 1, 1, 2, 0), (2, 1, 2, 2, 2, 1), (1, 1, 1, 1, 1, 1),
+    (1, 2, 2, 2, 1, 2), (2, 1, 1, 2, 3, 1), (3, 2, 2, 3, 3, 2),
+    (1, 1, 2, 0, 1, 1), (1, 1, 4, 1, 1, 2), (1, 2, 2, 1, 3, 1),
+    (2, 2, 4, 2, 3, 2), (2, 1, 2, 1, 2, 2), (2, 2, 4, 2, 2, 3),
+    (3, 2, 2, 2, 4, 2), (4, 3, 4, 3, 4, 3), (1, 2, 1, 1, 1, 0),
+    (1, 2, 2, 3, 1, 1), (1, 2, 2, 2, 3, 0), (2, 2, 3, 4, 3, 1),
+    (1, 3, 1, 2, 2, 1), (1, 4, 2, 4, 2, 2), (2, 3, 2, 3, 4, 1),
+    (3, 4, 3, 5, 4, 2), (2, 2, 2, 1, 2, 1), (2, 2, 4, 3, 2, 2),
+    (2, 3, 3, 2, 4, 1), (3, 3, 5, 4, 4, 2), (3, 3, 2, 2, 3, 2),
+    (3, 4, 4, 4, 3, 3), (4, 4, 3, 3, 5, 2), (5, 5, 5, 5, 5, 3),
+    (2, 1, 2, 1, 0, 0), (2, 1, 3, 2, 1, 1), (2, 1, 2, 3, 2, 0),
+    (3, 1, 3, 4, 3, 1), (2, 1, 3, 2, 1, 1), (2, 2, 4, 3, 2, 2),
+    (3, 1, 3, 4, 3, 1), (4, 2, 4, 5, 4, 2), (2, 2, 3, 1, 1, 1),
+    (2, 2, 5, 2, 2, 2), (2, 3, 3, 3, 3, 1), (3, 3, 5, 4, 4, 2),
+    (3, 2, 4, 2, 2, 2), (3, 3, 6, 3, 3, 3), (4, 3, 4, 4, 4, 2),
+    (5, 4, 6, 5, 5, 3), (3, 2, 2, 2, 1, 0), (3, 2, 3, 4, 2, 1),
+    (3, 2, 3, 4, 3, 0), (4, 2, 4, 6, 4, 1), (3, 3, 3, 3, 2, 1),
+    (3, 4, 4, 5, 3, 2), (4, 3, 4, 5, 4, 1), (5, 4, 5, 7, 5, 2),
+    (4, 3, 3, 2, 2, 1), (4, 3, 5, 4, 3, 2), (4, 4, 4, 4, 4, 1),
+    (5, 4, 6, 6, 5, 2), (5, 4, 4, 3, 3, 2), (5, 5, 6, 5, 4, 3),
+    (6, 5, 5, 5, 5, 2), (7, 6, 7, 7, 6, 3), (2, 1, 0, 0, 0, 0),
+    (2, 1, 1, 1, 1, 0), (2, 1, 0, 1, 1, 1), (3, 1, 1, 2, 2, 1),
+    (2, 1, 0, 0, 2, 1), (2, 2, 1, 1, 3, 1), (3, 1, 0, 1, 3, 2),
+    (4, 2, 1, 2, 4, 2), (2, 1, 0, 1, 1, 1), (2, 1, 2, 2, 2, 1),
+    (2, 2, 0, 2, 2, 2), (3, 2, 2, 3, 3, 2), (3, 1, 0, 1, 3, 2),
+    (3, 2, 2, 2, 4, 2), (4, 2, 0, 2, 4, 3), (5, 3, 2, 3, 5, 3),
+    (2, 1, 1, 1, 1, 0), (2, 1, 2, 3, 2, 0), (2, 1, 2, 2, 2, 1),
+    (3, 1, 3, 4, 3, 1), (2, 2, 1, 1, 3, 1), (2, 3, 2, 3, 4, 1),
+    (3, 2, 2, 2, 4, 2), (4, 3, 3, 4, 5, 2), (3, 1, 1, 2, 2, 1),
+    (3, 1, 3, 4, 3, 1), (3, 2, 2, 3, 3, 2), (4, 2, 4, 5, 4, 2),
+    (4, 2, 1, 2, 4, 2), (4, 3, 3, 4, 5, 2), (5, 3, 2, 3, 5, 3),
+    (6, 4, 4, 5, 6, 3), (2, 2, 1, 1, 0, 0), (2, 2, 2, 2, 2, 0),
+    (2, 2, 1, 3, 1, 1), (3, 2, 2, 4, 3, 1), (2, 2, 2, 1, 2, 1),
+    (2, 3, 3, 2, 4, 1), (3, 2, 2, 3, 3, 2), (4, 3, 3, 4, 5, 2),
+    (2, 3, 1, 2, 1, 1), (2, 3, 3, 3, 3, 1), (2, 4, 1, 4, 2, 2),
+    (3, 4, 3, 5, 4, 2), (3, 3, 2, 2, 3, 2), (3, 4, 4, 3, 5, 2),
+    (4, 4, 2, 4, 4, 3), (5, 5, 4, 5, 6, 3), (3, 2, 2, 2, 1, 0),
+    (3, 2, 3, 4, 3, 0), (3, 2, 3, 4, 2, 1), (4, 2, 4, 6, 4, 1),
+    (3, 3, 3, 2, 3, 1), (3, 4, 4, 4, 5, 1), (4, 3, 4, 4, 4, 2),
+    (5, 4, 5, 6, 6, 2), (4, 3, 2, 3, 2, 1), (4, 3, 4, 5, 4, 1),
+    (4, 4, 3, 5, 3, 2), (5, 4, 5, 7, 5, 2), (5, 4, 3, 3, 4, 2),
+    (5, 5, 5, 5, 6, 2), (6, 5, 4, 5, 5, 3), (7, 6, 6, 7, 7, 3),
+    (3, 2, 1, 0, 0, 0), (3, 2, 2, 1, 1, 1), (3, 2, 1, 1, 2, 1),
+    (4, 2, 2, 2, 3, 2), (3, 2, 1, 1, 2, 1), (3, 3, 2, 2, 3, 2),
+    (4, 2, 1, 2, 4, 2), (5, 3, 2, 3, 5, 3), (3, 2, 2, 1, 1, 1),
+    (3, 2, 4, 2, 2, 2), (3, 3, 2, 2, 3, 2), (4, 3, 4, 3, 4, 3),
+    (4, 2, 2, 2, 3, 2), (4, 3, 4, 3, 4, 3), (5, 3, 2, 3, 5, 3),
+    (6, 4, 4, 4, 6, 4), (3, 3, 2, 1, 1, 0), (3, 3, 3, 3, 2, 1),
+    (3, 3, 3, 2, 3, 1), (4, 3, 4, 4, 4, 2), (3, 4, 2, 2, 3, 1),
+    (3, 5, 3, 4, 4, 2), (4, 4, 3, 3, 5, 2), (5, 5, 4, 5, 6, 3),
+    (4, 3, 3, 2, 2, 1), (4, 3, 5, 4, 3, 2), (4, 4, 4, 3, 4, 2),
+    (5, 4, 6, 5, 5, 3), (5, 4, 3, 3, 4, 2), (5, 5, 5, 5, 5, 3),
+    (6, 5, 4, 4, 6, 3), (7, 6, 6, 6, 7, 4), (4, 3, 2, 1, 0, 0),
+    (4, 3, 3, 2, 2, 1), (4, 3, 2, 3, 2, 1), (5, 3, 3, 4, 4, 2),
+    (4, 3, 3, 2, 2, 1), (4, 4, 4, 3, 4, 2), (5, 3, 3, 4, 4, 2),
+    (6, 4, 4, 5, 6, 3), (4, 4, 3, 2, 1, 1), (4, 4, 5, 3, 3, 2),
+    (4, 5, 3, 4, 3, 2), (5, 5, 5, 5, 5, 3), (5, 4, 4, 3, 3, 2),
+    (5, 5, 6, 4, 5, 3), (6, 5, 4, 5, 5, 3), (7, 6, 6, 6, 7, 4),
+    (5, 4, 3, 2, 1, 0), (5, 4, 4, 4, 3, 1), (5, 4, 4, 4, 3, 1),
+    (6, 4, 5, 6, 5, 2), (5, 5, 4, 3, 3, 1), (5, 6, 5, 5, 5, 2),
+    (6, 5, 5, 5, 5, 2), (7, 6, 6, 7, 7, 3), (6, 5, 4, 3, 2, 1),
+    (6, 5, 6, 5, 4, 2), (6, 6, 5, 5, 4, 2), (7, 6, 7, 7, 6, 3),
+    (7, 6, 5, 4, 4, 2), (7, 7, 7, 6, 6, 3), (8, 7, 6, 6, 6, 3),
+    (9, 8, 8, 8, 8, 4), (0, 0, 0, 0, 0, 0), (0, 1, 0, 0, 0, 0),
+    (0, 0, 1, 0, 0, 0), (1, 1, 1, 0, 0, 0), (0, 0, 0, 1, 0, 0),
+    (0, 2, 0, 1, 0, 0), (1, 0, 1, 1, 0, 0), (2, 2, 1, 1, 0, 0),
+    (0, 0, 0, 0, 1, 0), (0, 1, 1, 0, 1, 0), (0, 1, 1, 0, 1, 0),
+    (1, 2, 2, 0, 1, 0), (1, 0, 0, 1, 1, 0), (1, 2, 1, 1, 1, 0),
+    (2, 1, 1, 1, 1, 0), (3, 3, 2, 1, 1, 0), (0, 0, 0, 0, 0, 1),
+    (0, 1, 0, 1, 0, 1), (0, 0, 2, 0, 0, 1), (1, 1, 2, 1, 0, 1),
+    (0, 1, 0, 1, 0, 1), (0, 3, 0, 2, 0, 1), (1, 1, 2, 1, 0, 1),
+    (2, 3, 2, 2, 0, 1), (1, 0, 0, 0, 1, 1), (1, 1, 1, 1, 1, 1),
+    (1, 1, 2, 0, 1, 1), (2, 2, 3, 1, 1, 1), (2, 1, 0, 1, 1, 1),
+    (2, 3, 1, 2, 1, 1), (3, 2, 2, 1, 1, 1), (4, 4, 3, 2, 1, 1),
+    (0, 0, 0, 0, 1, 0), (0, 1, 0, 0, 2, 0), (0, 0, 1, 1, 1, 0),
+    (1, 1, 1, 1, 2, 0), (0, 0, 1, 1, 1, 0), (0, 2, 1, 1, 2, 0),
+    (1, 0, 2, 2, 1, 0), (2, 2, 2, 2, 2, 0), (0, 1, 0, 0, 2, 0),
+    (0, 2, 1, 0, 3, 0), (0, 2, 1, 1, 2, 0), (1, 3, 2, 1, 3, 0),
+    (1, 1, 1, 1, 2, 0), (1, 3, 2, 1, 3, 0), (2, 2, 2, 2, 2, 0),
+    (3, 4, 3, 2, 3, 0), (1, 0, 0, 0, 1, 1), (1, 1, 0, 1, 2, 1),
+    (1, 0, 2, 1, 1, 1), (2, 1, 2, 2, 2, 1), (1, 1, 1, 1, 1, 1),
+    (1, 3, 1, 2, 2, 1), (2, 1, 3, 2, 1, 1), (3, 3, 3, 3, 2, 1),
+    (2, 1, 0, 0, 2, 1), (2, 2, 1, 1, 3, 1), (2, 2, 2, 1, 2, 1),
+    (3, 3, 3, 2, 3, 1), (3, 2, 1, 1, 2, 1), (3, 4, 2, 2, 3, 1),
+    (4, 3, 3, 2, 2, 1), (5, 5, 4, 3, 3, 1), (0, 0, 0, 1, 0, 0),
+    (0, 1, 0, 1, 0, 1), (0, 0, 1, 1, 1, 0), (1, 1, 1, 1, 1, 1),
+    (0, 0, 0, 3, 0, 0), (0, 2, 0, 3, 0, 1), (1, 0, 1, 3, 1, 0),
+    (2, 2, 1, 3, 1, 1), (0, 0, 1, 1, 1, 0), (0, 1, 2, 1, 1, 1),
+    (0, 1, 2, 1, 2, 0), (1, 2, 3, 1, 2, 1), (1, 0, 1, 3, 1, 0),
+    (1, 2, 2, 3, 1, 1), (2, 1, 2, 3, 2, 0), (3, 3, 3, 3, 2, 1),
+    (0, 1, 0, 1, 0, 1), (0, 2, 0, 2, 0, 2), (0, 1, 2, 1, 1, 1),
+    (1, 2, 2, 2, 1, 2), (0, 2, 0, 3, 0, 1), (0, 4, 0, 4, 0, 2),
+    (1, 2, 2, 3, 1, 1), (2, 4, 2, 4, 1, 2), (1, 1, 1, 1, 1, 1),
+    (1, 2, 2, 2, 1, 2), (1, 2, 3, 1, 2, 1), (2, 3, 4, 2, 2, 2),
+    (2, 2, 1, 3, 1, 1), (2, 4, 2, 4, 1, 2), (3, 3, 3, 3, 2, 1),
+    (4, 5, 4, 4, 2, 2), (1, 0, 0, 1, 1, 0), (1, 1, 0, 1, 2, 1),
+    (1, 0, 1, 2, 2, 0), (2, 1, 1, 2, 3, 1), (1, 0, 1, 3, 1, 0),
+    (1, 2, 1, 3, 2, 1), (2, 0, 2, 4, 2, 0), (3, 2, 2, 4, 3, 1),
+    (1, 1, 1, 1, 2, 0), (1, 2, 2, 1, 3, 1), (1, 2, 2, 2, 3, 0),
+    (2, 3, 3, 2, 4, 1), (2, 1, 2, 3, 2, 0), (2, 3, 3, 3, 3, 1),
+    (3, 2, 3, 4, 3, 0), (4, 4, 4, 4, 4, 1), (2, 1, 0, 1, 1, 1),
+    (2, 2, 0, 2, 2, 2), (2, 1, 2, 2, 2, 1), (3, 2, 2, 3, 3, 2),
+    (2, 2, 1, 3, 1, 1), (2, 4, 1, 4, 2, 2), (3, 2, 3, 4, 2, 1),
+    (4, 4, 3, 5, 3, 2), (3, 2, 1, 1, 2, 1), (3, 3, 2, 2, 3, 2),
+    (3, 3, 3, 2, 3, 1), (4, 4, 4, 3, 4, 2), (4, 3, 2, 3, 2, 1),
+    (4, 5, 3, 4, 3, 2), (5, 4, 4, 4, 3, 1), (6, 6, 5, 5, 4, 2),
+    (0, 0, 1, 0, 0, 0), (0, 1, 1, 0, 1, 0), (0, 0, 2, 0, 0, 1),
+    (1, 1, 2, 0, 1, 1), (0, 0, 1, 1, 1, 0), (0, 2, 1, 1, 2, 0),
+    (1, 0, 2, 1, 1, 1), (2, 2, 2, 1, 2, 1), (0, 0, 1, 1, 1, 0),
+    (0, 1, 2, 1, 2, 0), (0, 1, 2, 1, 1, 1), (1, 2, 3, 1, 2, 1),
+    (1, 0, 1, 2, 2, 0), (1, 2, 2, 2, 3, 0), (2, 1, 2, 2, 2, 1),
+    (3, 3, 3, 2, 3, 1), (0, 0, 2, 0, 0, 1), (0, 1, 2, 1, 1, 1),
+    (0, 0, 4, 0, 0, 2), (1, 1, 4, 1, 1, 2), (0, 1, 2, 1, 1, 1),
+    (0, 3, 2, 2, 2, 1), (1, 1, 4, 1, 1, 2), (2, 3, 4, 2, 2, 2),
+    (1, 0, 2, 1, 1, 1), (1, 1, 3, 2, 2, 1), (1, 1, 4, 1, 1, 2),
+    (2, 2, 5, 2, 2, 2), (2, 1, 2, 2, 2, 1), (2, 3, 3, 3, 3, 1),
+    (3, 2, 4, 2, 2, 2), (4, 4, 5, 3, 3, 2), (0, 1, 1, 0, 1, 0),
+    (0, 2, 1, 0, 3, 0), (0, 1, 2, 1, 1, 1), (1, 2, 2, 1, 3, 1),
+    (0, 1, 2, 1, 2, 0), (0, 3, 2, 1, 4, 0), (1, 1, 3, 2, 2, 1),
+    (2, 3, 3, 2, 4, 1), (0, 2, 1, 1, 2, 0), (0, 3, 2, 1, 4, 0),
+    (0, 3, 2, 2, 2, 1), (1, 4, 3, 2, 4, 1), (1, 2, 2, 2, 3, 0),
+    (1, 4, 3, 2, 5, 0), (2, 3, 3, 3, 3, 1), (3, 5, 4, 3, 5, 1),
+    (1, 1, 2, 0, 1, 1), (1, 2, 2, 1, 3, 1), (1, 1, 4, 1, 1, 2),
+    (2, 2, 4, 2, 3, 2), (1, 2, 3, 1, 2, 1), (1, 4, 3, 2, 4, 1),
+    (2, 2, 5, 2, 2, 2), (3, 4, 5, 3, 4, 2), (2, 2, 2, 1, 2, 1),
+    (2, 3, 3, 2, 4, 1), (2, 3, 4, 2, 2, 2), (3, 4, 5, 3, 4, 2),
+    (3, 3, 3, 2, 3, 1), (3, 5, 4, 3, 5, 1), (4, 4, 5, 3, 3, 2),
+    (5, 6, 6, 4, 5, 2), (1, 0, 1, 1, 0, 0), (1, 1, 1, 1, 1, 1),
+    (1, 0, 2, 1, 1, 1), (2, 1, 2, 1, 2, 2), (1, 0, 1, 3, 1, 0),
+    (1, 2, 1, 3, 2, 1), (2, 0, 2, 3, 2, 1), (3, 2, 2, 3, 3, 2),
+    (1, 0, 2, 2, 1, 0), (1, 1, 3, 2, 2, 1), (1, 1, 3, 2, 2, 1),
+    (2, 2, 4, 2, 3, 2), (2, 0, 2, 4, 2, 0), (2, 2, 3, 4, 3, 1),
+    (3, 1, 3, 4, 3, 1), (4, 3, 4, 4, 4, 2), (1, 1, 2, 1, 0, 1),
+    (1, 2, 2, 2, 1, 2), (1, 1, 4, 1, 1, 2), (2, 2, 4, 2, 2, 3),
+    (1, 2, 2, 3, 1, 1), (1, 4, 2, 4, 2, 2), (2, 2, 4, 3, 2, 2),
+    (3, 4, 4, 4, 3, 3), (2, 1, 3, 2, 1, 1), (2, 2, 4, 3, 2, 2),
+    (2, 2, 5, 2, 2, 2), (3, 3, 6, 3, 3, 3), (3, 2, 3, 4, 2, 1),
+    (3, 4, 4, 5, 3, 2), (4, 3, 5, 4, 3, 2), (5, 5, 6, 5, 4, 3),
+    (2, 1, 1, 1, 1, 0), (2, 2, 1, 1, 3, 1), (2, 1, 2, 2, 2, 1),
+    (3, 2, 2, 2, 4, 2), (2, 1, 2, 3, 2, 0), (2, 3, 2, 3, 4, 1),
+    (3, 1, 3, 4, 3, 1), (4, 3, 3, 4, 5, 2), (2, 2, 2, 2, 2, 0),
+    (2, 3, 3, 2, 4, 1), (2, 3, 3, 3, 3, 1), (3, 4, 4, 3, 5, 2),
+    (3, 2, 3, 4, 3, 0), (3, 4, 4, 4, 5, 1), (4, 3, 4, 5, 4, 1),
+    (5, 5, 5, 5, 6, 2), (3, 2, 2, 1, 1, 1), (3, 3, 2, 2, 3, 2),
+    (3, 2, 4, 2, 2, 2), (4, 3, 4, 3, 4, 3), (3, 3, 3, 3, 2, 1),
+    (3, 5, 3, 4, 4, 2), (4, 3, 5, 4, 3, 2), (5, 5, 5, 5, 5, 3),
+    (4, 3, 3, 2, 2, 1), (4, 4, 4, 3, 4, 2), (4, 4, 5, 3, 3, 2),
+    (5, 5, 6, 4, 5, 3), (5, 4, 4, 4, 3, 1), (5, 6, 5, 5, 5, 2),
+    (6, 5, 6, 5, 4, 2), (7, 7, 7, 6, 6, 3), (0, 1, 0, 0, 0, 0),
+    (0, 2, 0, 1, 0, 0), (0, 1, 1, 0, 1, 0), (1, 2, 1, 1, 1, 0),
+    (0, 1, 0, 1, 0, 1), (0, 3, 0, 2, 0, 1), (1, 1, 1, 1, 1, 1),
+    (2, 3, 1, 2, 1, 1), (0, 1, 0, 0, 2, 0), (0, 2, 1, 1, 2, 0),
+    (0, 2, 1, 0, 3, 0), (1, 3, 2, 1, 3, 0), (1, 1, 0, 1, 2, 1),
+    (1, 3, 1, 2, 2, 1), (2, 2, 1, 1, 3, 1), (3, 4, 2, 2, 3, 1),
+    (0, 1, 0, 1, 0, 1), (0, 2, 0, 3, 0, 1), (0, 1, 2, 1, 1, 1),
+    (1, 2, 2, 3, 1, 1), (0, 2, 0, 2, 0, 2), (0, 4, 0, 4, 0, 2),
+    (1, 2, 2, 2, 1, 2), (2, 4, 2, 4, 1, 2), (1, 1, 0, 1, 2, 1),
+    (1, 2, 1, 3, 2, 1), (1, 2, 2, 1, 3, 1), (2, 3, 3, 3, 3, 1),
+    (2, 2, 0, 2, 2, 2), (2, 4, 1, 4, 2, 2), (3, 3, 2, 2, 3, 2),
+    (4, 5, 3, 4, 3, 2), (0, 1, 1, 0, 1, 0), (0, 2, 1, 1, 2, 0),
+    (0, 1, 2, 1, 2, 0), (1, 2, 2, 2, 3, 0), (0, 1, 2, 1, 1, 1),
+    (0, 3, 2, 2, 2, 1), (1, 1, 3, 2, 2, 1), (2, 3, 3, 3, 3, 1),
+    (0, 2, 1, 0, 3, 0), (0, 3, 2, 1, 4, 0), (0, 3, 2, 1, 4, 0),
+    (1, 4, 3, 2, 5, 0), (1, 2, 2, 1, 3, 1), (1, 4, 3, 2, 4, 1),
+    (2, 3, 3, 2, 4, 1), (3, 5, 4, 3, 5, 1), (1, 1, 1, 1, 1, 1),
+    (1, 2, 1, 3, 2, 1), (1, 1, 3, 2, 2, 1), (2, 2, 3, 4, 3, 1),
+    (1, 2, 2, 2, 1, 2), (1, 4, 2, 4, 2, 2), (2, 2, 4, 3, 2, 2),
+    (3, 4, 4, 5, 3, 2), (2, 2, 1, 1, 3, 1), (2, 3, 2, 3, 4, 1),
+    (2, 3, 3, 2, 4, 1), (3, 4, 4, 4, 5, 1), (3, 3, 2, 2, 3, 2),
+    (3, 5, 3, 4, 4, 2), (4, 4, 4, 3, 4, 2), (5, 6, 5, 5, 5, 2),
+    (0, 2, 0, 1, 0, 0), (0, 3, 0, 2, 0, 1), (0, 2, 1, 1, 2, 0),
+    (1, 3, 1, 2, 2, 1), (0, 2, 0, 3, 0, 1), (0, 4, 0, 4, 0, 2),
+    (1, 2, 1, 3, 2, 1), (2, 4, 1, 4, 2, 2), (0, 2, 1, 1, 2, 0),
+    (0, 3, 2, 2, 2, 1), (0, 3, 2, 1, 4, 0), (1, 4, 3, 2, 4, 1),
+    (1, 2, 1, 3, 2, 1), (1, 4, 2, 4, 2, 2), (2, 3, 2, 3, 4, 1),
+    (3, 5, 3, 4, 4, 2), (0, 3, 0, 2, 0, 1), (0, 4, 0, 4, 0, 2),
+    (0, 3, 2, 2, 2, 1), (1, 4, 2, 4, 2, 2), (0, 4, 0, 4, 0, 2),
+    (0, 6, 0, 6, 0, 3), (1, 4, 2, 4, 2, 2), (2, 6, 2, 6, 2, 3),
+    (1, 3, 1, 2, 2, 1), (1, 4, 2, 4, 2, 2), (1, 4, 3, 2, 4, 1),
+    (2, 5, 4, 4, 4, 2), (2, 4, 1, 4, 2, 2), (2, 6, 2, 6, 2, 3),
+    (3, 5, 3, 4, 4, 2), (4, 7, 4, 6, 4, 3), (1, 2, 1, 1, 1, 0),
+    (1, 3, 1, 2, 2, 1), (1, 2, 2, 2, 3, 0), (2, 3, 2, 3, 4, 1),
+    (1, 2, 2, 3, 1, 1), (1, 4, 2, 4, 2, 2), (2, 2, 3, 4, 3, 1),
+    (3, 4, 3, 5, 4, 2), (1, 3, 2, 1, 3, 0), (1, 4, 3, 2, 4, 1),
+    (1, 4, 3, 2, 5, 0), (2, 5, 4, 3, 6, 1), (2, 3, 3, 3, 3, 1),
+    (2, 5, 4, 4, 4, 2), (3, 4, 4, 4, 5, 1), (4, 6, 5, 5, 6, 2),
+    (2, 3, 1, 2, 1, 1), (2, 4, 1, 4, 2, 2), (2, 3, 3, 3, 3, 1),
+    (3, 4, 3, 5, 4, 2), (2, 4, 2, 4, 1, 2), (2, 6, 2, 6, 2, 3),
+    (3, 4, 4, 5, 3, 2), (4, 6, 4, 7, 4, 3), (3, 4, 2, 2, 3, 1),
+    (3, 5, 3, 4, 4, 2), (3, 5, 4, 3, 5, 1), (4, 6, 5, 5, 6, 2),
+    (4, 5, 3, 4, 3, 2), (4, 7, 4, 6, 4, 3), (5, 6, 5, 5, 5, 2),
+    (6, 8, 6, 7, 6, 3), (1, 1, 1, 0, 0, 0), (1, 2, 1, 1, 1, 0),
+    (1, 1, 2, 0, 1, 1), (2, 2, 2, 1, 2, 1), (1, 1, 1, 1, 1, 1),
+    (1, 3, 1, 2, 2, 1), (2, 1, 2, 1, 2, 2), (3, 3, 2, 2, 3, 2),
+    (1, 1, 1, 1, 2, 0), (1, 2, 2, 2, 3, 0), (1, 2, 2, 1, 3, 1),
+    (2, 3, 3, 2, 4, 1), (2, 1, 1, 2, 3, 1), (2, 3, 2, 3, 4, 1),
+    (3, 2, 2, 2, 4, 2), (4, 4, 3, 3, 5, 2), (1, 1, 2, 1, 0, 1),
+    (1, 2, 2, 3, 1, 1), (1, 1, 4, 1, 1, 2), (2, 2, 4, 3, 2, 2),
+    (1, 2, 2, 2, 1, 2), (1, 4, 2, 4, 2, 2), (2, 2, 4, 2, 2, 3),
+    (3, 4, 4, 4, 3, 3), (2, 1, 2, 2, 2, 1), (2, 2, 3, 4, 3, 1),
+    (2, 2, 4, 2, 3, 2), (3, 3, 5, 4, 4, 2), (3, 2, 2, 3, 3, 2),
+    (3, 4, 3, 5, 4, 2), (4, 3, 4, 3, 4, 3), (5, 5, 5, 5, 5, 3),
+    (1, 2, 2, 0, 1, 0), (1, 3, 2, 1, 3, 0), (1, 2, 3, 1, 2, 1),
+    (2, 3, 3, 2, 4, 1), (1, 2, 3, 1, 2, 1), (1, 4, 3, 2, 4, 1),
+    (2, 2, 4, 2, 3, 2), (3, 4, 4, 3, 5, 2), (1, 3, 2, 1, 3, 0),
+    (1, 4, 3, 2, 5, 0), (1, 4, 3, 2, 4, 1), (2, 5, 4, 3, 6, 1),
+    (2, 3, 3, 2, 4, 1), (2, 5, 4, 3, 6, 1), (3, 4, 4, 3, 5, 2),
+    (4, 6, 5, 4, 7, 2), (2, 2, 3, 1, 1, 1), (2, 3, 3, 3, 3, 1),
+    (2, 2, 5, 2, 2, 2), (3, 3, 5, 4, 4, 2), (2, 3, 4, 2, 2, 2),
+    (2, 5, 4, 4, 4, 2), (3, 3, 6, 3, 3, 3), (4, 5, 6, 5, 5, 3),
+    (3, 3, 3, 2, 3, 1), (3, 4, 4, 4, 5, 1), (3, 4, 5, 3, 4, 2),
+    (4, 5, 6, 5, 6, 2), (4, 4, 4, 3, 4, 2), (4, 6, 5, 5, 6, 2),
+    (5, 5, 6, 4, 5, 3), (6, 7, 7, 6, 7, 3), (2, 2, 1, 1, 0, 0),
+    (2, 3, 1, 2, 1, 1), (2, 2, 2, 1, 2, 1), (3, 3, 2, 2, 3, 2),
+    (2, 2, 1, 3, 1, 1), (2, 4, 1, 4, 2, 2), (3, 2, 2, 3, 3, 2),
+    (4, 4, 2, 4, 4, 3), (2, 2, 2, 2, 2, 0), (2, 3, 3, 3, 3, 1),
+    (2, 3, 3, 2, 4, 1), (3, 4, 4, 3, 5, 2), (3, 2, 2, 4, 3, 1),
+    (3, 4, 3, 5, 4, 2), (4, 3, 3, 4, 5, 2), (5, 5, 4, 5, 6, 3),
+    (2, 3, 2, 2, 0, 1), (2, 4, 2, 4, 1, 2), (2, 3, 4, 2, 2, 2),
+    (3, 4, 4, 4, 3, 3), (2, 4, 2, 4, 1, 2), (2, 6, 2, 6, 2, 3),
+    (3, 4, 4, 4, 3, 3), (4, 6, 4, 6, 4, 4), (3, 3, 3, 3, 2, 1),
+    (3, 4, 4, 5, 3, 2), (3, 4, 5, 3, 4, 2), (4, 5, 6, 5, 5, 3),
+    (4, 4, 3, 5, 3, 2), (4, 6, 4, 7, 4, 3), (5, 5, 5, 5, 5, 3),
+    (6, 7, 6, 7, 6, 4), (3, 3, 2, 1, 1, 0), (3, 4, 2, 2, 3, 1),
+    (3, 3, 3, 2, 3, 1), (4, 4, 3, 3, 5, 2), (3, 3, 3, 3, 2, 1),
+    (3, 5, 3, 4, 4, 2), (4, 3, 4, 4, 4, 2), (5, 5, 4, 5, 6, 3),
+    (3, 4, 3, 2, 3, 0), (3, 5, 4, 3, 5, 1), (3, 5, 4, 3, 5, 1),
+    (4, 6, 5, 4, 7, 2), (4, 4, 4, 4, 4, 1), (4, 6, 5, 5, 6, 2),
+    (5, 5, 5, 5, 6, 2), (6, 7, 6, 6, 8, 3), (4, 4, 3, 2, 1, 1),
+    (4, 5, 3, 4, 3, 2), (4, 4, 5, 3, 3, 2), (5, 5, 5, 5, 5, 3),
+    (4, 5, 4, 4, 2, 2), (4, 7, 4, 6, 4, 3), (5, 5, 6, 5, 4, 3),
+    (6, 7, 6, 7, 6, 4), (5, 5, 4, 3, 3, 1), (5, 6, 5, 5, 5, 2),
+    (5, 6, 6, 4, 5, 2), (6, 7, 7, 6, 7, 3), (6, 6, 5, 5, 4, 2),
+    (6, 8, 6, 7, 6, 3), (7, 7, 7, 6, 6, 3), (8, 9, 8, 8, 8, 4),
+    (1, 0, 0, 0, 0, 0), (1, 1, 1, 0, 0, 0), (1, 0, 1, 1, 0, 0),
+    (2, 1, 2, 1, 0, 0), (1, 0, 0, 1, 1, 0), (1, 2, 1, 1, 1, 0),
+    (2, 0, 1, 2, 1, 0), (3, 2, 2, 2, 1, 0), (1, 0, 0, 0, 1, 1),
+    (1, 1, 2, 0, 1, 1), (1, 1, 1, 1, 1, 1), (2, 2, 3, 1, 1, 1),
+    (2, 0, 0, 1, 2, 1), (2, 2, 2, 1, 2, 1), (3, 1, 1, 2, 2, 1),
+    (4, 3, 3, 2, 2, 1), (1, 0, 0, 0, 1, 1), (1, 1, 1, 1, 1, 1),
+    (1, 0, 2, 1, 1, 1), (2, 1, 3, 2, 1, 1), (1, 1, 0, 1, 2, 1),
+    (1, 3, 1, 2, 2, 1), (2, 1, 2, 2, 2, 1), (3, 3, 3, 3, 2, 1),
+    (2, 0, 0, 0, 2, 2), (2, 1, 2, 1, 2, 2), (2, 1, 2, 1, 2, 2),
+    (3, 2, 4, 2, 2, 2), (3, 1, 0, 1, 3, 2), (3, 3, 2, 2, 3, 2),
+    (4, 2, 2, 2, 3, 2), (5, 4, 4, 3, 3, 2), (1, 0, 0, 1, 1, 0),
+    (1, 1, 1, 1, 2, 0), (1, 0, 1, 3, 1, 0), (2, 1, 2, 3, 2, 0),
+    (1, 0, 1, 2, 2, 0), (1, 2, 2, 2, 3, 0), (2, 0, 2, 4, 2, 0),
+    (3, 2, 3, 4, 3, 0), (1, 1, 0, 1, 2, 1), (1, 2, 2, 1, 3, 1),
+    (1, 2, 1, 3, 2, 1), (2, 3, 3, 3, 3, 1), (2, 1, 1, 2, 3, 1),
+    (2, 3, 3, 2, 4, 1), (3, 2, 2, 4, 3, 1), (4, 4, 4, 4, 4, 1),
+    (2, 0, 0, 1, 2, 1), (2, 1, 1, 2, 3, 1), (2, 0, 2, 3, 2, 1),
+    (3, 1, 3, 4, 3, 1), (2, 1, 1, 2, 3, 1), (2, 3, 2, 3, 4, 1),
+    (3, 1, 3, 4, 3, 1), (4, 3, 4, 5, 4, 1), (3, 1, 0, 1, 3, 2),
+    (3, 2, 2, 2, 4, 2), (3, 2, 2, 3, 3, 2), (4, 3, 4, 4, 4, 2),
+    (4, 2, 1, 2, 4, 2), (4, 4, 3, 3, 5, 2), (5, 3, 3, 4, 4, 2),
+    (6, 5, 5, 5, 5, 2), (1, 0, 1, 1, 0, 0), (1, 1, 2, 1, 0, 1),
+    (1, 0, 2, 2, 1, 0), (2, 1, 3, 2, 1, 1), (1, 0, 1, 3, 1, 0),
+    (1, 2, 2, 3, 1, 1), (2, 0, 2, 4, 2, 0), (3, 2, 3, 4, 2, 1),
+    (1, 0, 2, 1, 1, 1), (1, 1, 4, 1, 1, 2), (1, 1, 3, 2, 2, 1),
+    (2, 2, 5, 2, 2, 2), (2, 0, 2, 3, 2, 1), (2, 2, 4, 3, 2, 2),
+    (3, 1, 3, 4, 3, 1), (4, 3, 5, 4, 3, 2), (1, 1, 1, 1, 1, 1),
+    (1, 2, 2, 2, 1, 2), (1, 1, 3, 2, 2, 1), (2, 2, 4, 3, 2, 2),
+    (1, 2, 1, 3, 2, 1), (1, 4, 2, 4, 2, 2), (2, 2, 3, 4, 3, 1),
+    (3, 4, 4, 5, 3, 2), (2, 1, 2, 1, 2, 2), (2, 2, 4, 2, 2, 3),
+    (2, 2, 4, 2, 3, 2), (3, 3, 6, 3, 3, 3), (3, 2, 2, 3, 3, 2),
+    (3, 4, 4, 4, 3, 3), (4, 3, 4, 4, 4, 2), (5, 5, 6, 5, 4, 3),
+    (2, 0, 1, 2, 1, 0), (2, 1, 2, 2, 2, 1), (2, 0, 2, 4, 2, 0),
+    (3, 1, 3, 4, 3, 1), (2, 0, 2, 4, 2, 0), (2, 2, 3, 4, 3, 1),
+    (3, 0, 3, 6, 3, 0), (4, 2, 4, 6, 4, 1), (2, 1, 2, 2, 2, 1),
+    (2, 2, 4, 2, 3, 2), (2, 2, 3, 4, 3, 1), (3, 3, 5, 4, 4, 2),
+    (3, 1, 3, 4, 3, 1), (3, 3, 5, 4, 4, 2), (4, 2, 4, 6, 4, 1),
+    (5, 4, 6, 6, 5, 2), (3, 1, 1, 2, 2, 1), (3, 2, 2, 3, 3, 2),
+    (3, 1, 3, 4, 3, 1), (4, 2, 4, 5, 4, 2), (3, 2, 2, 4, 3, 1),
+    (3, 4, 3, 5, 4, 2), (4, 2, 4, 6, 4, 1), (5, 4, 5, 7, 5, 2),
+    (4, 2, 2, 2, 3, 2), (4, 3, 4, 3, 4, 3), (4, 3, 4, 4, 4, 2),
+    (5, 4, 6, 5, 5, 3), (5, 3, 3, 4, 4, 2), (5, 5, 5, 5, 5, 3),
+    (6, 4, 5, 6, 5, 2), (7, 6, 7, 7, 6, 3), (1, 1, 1, 0, 0, 0),
+    (1, 2, 2, 0, 1, 0), (1, 1, 2, 1, 0, 1), (2, 2, 3, 1, 1, 1),
+    (1, 1, 1, 1, 2, 0), (1, 3, 2, 1, 3, 0), (2, 1, 2, 2, 2, 1),
+    (3, 3, 3, 2, 3, 1), (1, 1, 1, 1, 1, 1), (1, 2, 3, 1, 2, 1),
+    (1, 2, 2, 2, 1, 2), (2, 3, 4, 2, 2, 2), (2, 1, 1, 2, 3, 1),
+    (2, 3, 3, 2, 4, 1), (3, 2, 2, 3, 3, 2), (4, 4, 4, 3, 4, 2),
+    (1, 1, 2, 0, 1, 1), (1, 2, 3, 1, 2, 1), (1, 1, 4, 1, 1, 2),
+    (2, 2, 5, 2, 2, 2), (1, 2, 2, 1, 3, 1), (1, 4, 3, 2, 4, 1),
+    (2, 2, 4, 2, 3, 2), (3, 4, 5, 3, 4, 2), (2, 1, 2, 1, 2, 2),
+    (2, 2, 4, 2, 3, 2), (2, 2, 4, 2, 2, 3), (3, 3, 6, 3, 3, 3),
+    (3, 2, 2, 2, 4, 2), (3, 4, 4, 3, 5, 2), (4, 3, 4, 3, 4, 3),
+    (5, 5, 6, 4, 5, 3), (1, 2, 1, 1, 1, 0), (1, 3, 2, 1, 3, 0),
+    (1, 2, 2, 3, 1, 1), (2, 3, 3, 3, 3, 1), (1, 2, 2, 2, 3, 0),
+    (1, 4, 3, 2, 5, 0), (2, 2, 3, 4, 3, 1), (3, 4, 4, 4, 5, 1),
+    (1, 3, 1, 2, 2, 1), (1, 4, 3, 2, 4, 1), (1, 4, 2, 4, 2, 2),
+    (2, 5, 4, 4, 4, 2), (2, 3, 2, 3, 4, 1), (2, 5, 4, 3, 6, 1),
+    (3, 4, 3, 5, 4, 2), (4, 6, 5, 5, 6, 2), (2, 2, 2, 1, 2, 1),
+    (2, 3, 3, 2, 4, 1), (2, 2, 4, 3, 2, 2), (3, 3, 5, 4, 4, 2),
+    (2, 3, 3, 2, 4, 1), (2, 5, 4, 3, 6, 1), (3, 3, 5, 4, 4, 2),
+    (4, 5, 6, 5, 6, 2), (3, 3, 2, 2, 3, 2), (3, 4, 4, 3, 5, 2),
+    (3, 4, 4, 4, 3, 3), (4, 5, 6, 5, 5, 3), (4, 4, 3, 3, 5, 2),
+    (4, 6, 5, 4, 7, 2), (5, 5, 5, 5, 5, 3), (6, 7, 7, 6, 7, 3),
+    (2, 1, 2, 1, 0, 0), (2, 2, 3, 1, 1, 1), (2, 1, 3, 2, 1, 1),
+    (3, 2, 4, 2, 2, 2), (2, 1, 2, 3, 2, 0), (2, 3, 3, 3, 3, 1),
+    (3, 1, 3, 4, 3, 1), (4, 3, 4, 4, 4, 2), (2, 1, 3, 2, 1, 1),
+    (2, 2, 5, 2, 2, 2), (2, 2, 4, 3, 2, 2), (3, 3, 6, 3, 3, 3),
+    (3, 1, 3, 4, 3, 1), (3, 3, 5, 4, 4, 2), (4, 2, 4, 5, 4, 2),
+    (5, 4, 6, 5, 5, 3), (2, 2, 3, 1, 1, 1), (2, 3, 4, 2, 2, 2),
+    (2, 2, 5, 2, 2, 2), (3, 3, 6, 3, 3, 3), (2, 3, 3, 3, 3, 1),
+    (2, 5, 4, 4, 4, 2), (3, 3, 5, 4, 4, 2), (4, 5, 6, 5, 5, 3),
+    (3, 2, 4, 2, 2, 2), (3, 3, 6, 3, 3, 3), (3, 3, 6, 3, 3, 3),
+    (4, 4, 8, 4, 4, 4), (4, 3, 4, 4, 4, 2), (4, 5, 6, 5, 5, 3),
+    (5, 4, 6, 5, 5, 3), (6, 6, 8, 6, 6, 4), (3, 2, 2, 2, 1, 0),
+    (3, 3, 3, 2, 3, 1), (3, 2, 3, 4, 2, 1), (4, 3, 4, 4, 4, 2),
+    (3, 2, 3, 4, 3, 0), (3, 4, 4, 4, 5, 1), (4, 2, 4, 6, 4, 1),
+    (5, 4, 5, 6, 6, 2), (3, 3, 3, 3, 2, 1), (3, 4, 5, 3, 4, 2),
+    (3, 4, 4, 5, 3, 2), (4, 5, 6, 5, 5, 3), (4, 3, 4, 5, 4, 1),
+    (4, 5, 6, 5, 6, 2), (5, 4, 5, 7, 5, 2), (6, 6, 7, 7, 7, 3),
+    (4, 3, 3, 2, 2, 1), (4, 4, 4, 3, 4, 2), (4, 3, 5, 4, 3, 2),
+    (5, 4, 6, 5, 5, 3), (4, 4, 4, 4, 4, 1), (4, 6, 5, 5, 6, 2),
+    (5, 4, 6, 6, 5, 2), (6, 6, 7, 7, 7, 3), (5, 4, 4, 3, 3, 2),
+    (5, 5, 6, 4, 5, 3), (5, 5, 6, 5, 4, 3), (6, 6, 8, 6, 6, 4),
+    (6, 5, 5, 5, 5, 2), (6, 7, 7, 6, 7, 3), (7, 6, 7, 7, 6, 3),
+    (8, 8, 9, 8, 8, 4), (2, 1, 0, 0, 0, 0), (2, 2, 1, 1, 0, 0),
+    (2, 1, 1, 1, 1, 0), (3, 2, 2, 2, 1, 0), (2, 1, 0, 1, 1, 1),
+    (2, 3, 1, 2, 1, 1), (3, 1, 1, 2, 2, 1), (4, 3, 2, 3, 2, 1),
+    (2, 1, 0, 0, 2, 1), (2, 2, 2, 1, 2, 1), (2, 2, 1, 1, 3, 1),
+    (3, 3, 3, 2, 3, 1), (3, 1, 0, 1, 3, 2), (3, 3, 2, 2, 3, 2),
+    (4, 2, 1, 2, 4, 2), (5, 4, 3, 3, 4, 2), (2, 1, 0, 1, 1, 1),
+    (2, 2, 1, 3, 1, 1), (2, 1, 2, 2, 2, 1), (3, 2, 3, 4, 2, 1),
+    (2, 2, 0, 2, 2, 2), (2, 4, 1, 4, 2, 2), (3, 2, 2, 3, 3, 2),
+    (4, 4, 3, 5, 3, 2), (3, 1, 0, 1, 3, 2), (3, 2, 2, 3, 3, 2),
+    (3, 2, 2, 2, 4, 2), (4, 3, 4, 4, 4, 2), (4, 2, 0, 2, 4, 3),
+    (4, 4, 2, 4, 4, 3), (5, 3, 2, 3, 5, 3), (6, 5, 4, 5, 5, 3),
+    (2, 1, 1, 1, 1, 0), (2, 2, 2, 2, 2, 0), (2, 1, 2, 3, 2, 0),
+    (3, 2, 3, 4, 3, 0), (2, 1, 2, 2, 2, 1), (2, 3, 3, 3, 3, 1),
+    (3, 1, 3, 4, 3, 1), (4, 3, 4, 5, 4, 1), (2, 2, 1, 1, 3, 1),
+    (2, 3, 3, 2, 4, 1), (2, 3, 2, 3, 4, 1), (3, 4, 4, 4, 5, 1),
+    (3, 2, 2, 2, 4, 2), (3, 4, 4, 3, 5, 2), (4, 3, 3, 4, 5, 2),
+    (5, 5, 5, 5, 6, 2), (3, 1, 1, 2, 2, 1), (3, 2, 2, 4, 3, 1),
+    (3, 1, 3, 4, 3, 1), (4, 2, 4, 6, 4, 1), (3, 2, 2, 3, 3, 2),
+    (3, 4, 3, 5, 4, 2), (4, 2, 4, 5, 4, 2), (5, 4, 5, 7, 5, 2),
+    (4, 2, 1, 2, 4, 2), (4, 3, 3, 4, 5, 2), (4, 3, 3, 4, 5, 2),
+    (5, 4, 5, 6, 6, 2), (5, 3, 2, 3, 5, 3), (5, 5, 4, 5, 6, 3),
+    (6, 4, 4, 5, 6, 3), (7, 6, 6, 7, 7, 3), (2, 2, 1, 1, 0, 0),
+    (2, 3, 2, 2, 0, 1), (2, 2, 2, 2, 2, 0), (3, 3, 3, 3, 2, 1),
+    (2, 2, 1, 3, 1, 1), (2, 4, 2, 4, 1, 2), (3, 2, 2, 4, 3, 1),
+    (4, 4, 3, 5, 3, 2), (2, 2, 2, 1, 2, 1), (2, 3, 4, 2, 2, 2),
+    (2, 3, 3, 2, 4, 1), (3, 4, 5, 3, 4, 2), (3, 2, 2, 3, 3, 2),
+    (3, 4, 4, 4, 3, 3), (4, 3, 3, 4, 5, 2), (5, 5, 5, 5, 5, 3),
+    (2, 3, 1, 2, 1, 1), (2, 4, 2, 4, 1, 2), (2, 3, 3, 3, 3, 1),
+    (3, 4, 4, 5, 3, 2), (2, 4, 1, 4, 2, 2), (2, 6, 2, 6, 2, 3),
+    (3, 4, 3, 5, 4, 2), (4, 6, 4, 7, 4, 3), (3, 3, 2, 2, 3, 2),
+    (3, 4, 4, 4, 3, 3), (3, 4, 4, 3, 5, 2), (4, 5, 6, 5, 5, 3),
+    (4, 4, 2, 4, 4, 3), (4, 6, 4, 6, 4, 4), (5, 5, 4, 5, 6, 3),
+    (6, 7, 6, 7, 6, 4), (3, 2, 2, 2, 1, 0), (3, 3, 3, 3, 2, 1),
+    (3, 2, 3, 4, 3, 0), (4, 3, 4, 5, 4, 1), (3, 2, 3, 4, 2, 1),
+    (3, 4, 4, 5, 3, 2), (4, 2, 4, 6, 4, 1), (5, 4, 5, 7, 5, 2),
+    (3, 3, 3, 2, 3, 1), (3, 4, 5, 3, 4, 2), (3, 4, 4, 4, 5, 1),
+    (4, 5, 6, 5, 6, 2), (4, 3, 4, 4, 4, 2), (4, 5, 6, 5, 5, 3),
+    (5, 4, 5, 6, 6, 2), (6, 6, 7, 7, 7, 3), (4, 3, 2, 3, 2, 1),
+    (4, 4, 3, 5, 3, 2), (4, 3, 4, 5, 4, 1), (5, 4, 5, 7, 5, 2),
+    (4, 4, 3, 5, 3, 2), (4, 6, 4, 7, 4, 3), (5, 4, 5, 7, 5, 2),
+    (6, 6, 6, 9, 6, 3), (5, 4, 3, 3, 4, 2), (5, 5, 5, 5, 5, 3),
+    (5, 5, 5, 5, 6, 2), (6, 6, 7, 7, 7, 3), (6, 5, 4, 5, 5, 3),
+    (6, 7, 6, 7, 6, 4), (7, 6, 6, 7, 7, 3), (8, 8, 8, 9, 8, 4),
+    (3, 2, 1, 0, 0, 0), (3, 3, 2, 1, 1, 0), (3, 2, 2, 1, 1, 1),
+    (4, 3, 3, 2, 2, 1), (3, 2, 1, 1, 2, 1), (3, 4, 2, 2, 3, 1),
+    (4, 2, 2, 2, 3, 2), (5, 4, 3, 3, 4, 2), (3, 2, 1, 1, 2, 1),
+    (3, 3, 3, 2, 3, 1), (3, 3, 2, 2, 3, 2), (4, 4, 4, 3, 4, 2),
+    (4, 2, 1, 2, 4, 2), (4, 4, 3, 3, 5, 2), (5, 3, 2, 3, 5, 3),
+    (6, 5, 4, 4, 6, 3), (3, 2, 2, 1, 1, 1), (3, 3, 3, 3, 2, 1),
+    (3, 2, 4, 2, 2, 2), (4, 3, 5, 4, 3, 2), (3, 3, 2, 2, 3, 2),
+    (3, 5, 3, 4, 4, 2), (4, 3, 4, 3, 4, 3), (5, 5, 5, 5, 5, 3),
+    (4, 2, 2, 2, 3, 2), (4, 3, 4, 4, 4, 2), (4, 3, 4, 3, 4, 3),
+    (5, 4, 6, 5, 5, 3), (5, 3, 2, 3, 5, 3), (5, 5, 4, 5, 6, 3),
+    (6, 4, 4, 4, 6, 4), (7, 6, 6, 6, 7, 4), (3, 3, 2, 1, 1, 0),
+    (3, 4, 3, 2, 3, 0), (3, 3, 3, 3, 2, 1), (4, 4, 4, 4, 4, 1),
+    (3, 3, 3, 2, 3, 1), (3, 5, 4, 3, 5, 1), (4, 3, 4, 4, 4, 2),
+    (5, 5, 5, 5, 6, 2), (3, 4, 2, 2, 3, 1), (3, 5, 4, 3, 5, 1),
+    (3, 5, 3, 4, 4, 2), (4, 6, 5, 5, 6, 2), (4, 4, 3, 3, 5, 2),
+    (4, 6, 5, 4, 7, 2), (5, 5, 4, 5, 6, 3), (6, 7, 6, 6, 8, 3),
+    (4, 3, 3, 2, 2, 1), (4, 4, 4, 4, 4, 1), (4, 3, 5, 4, 3, 2),
+    (5, 4, 6, 6, 5, 2), (4, 4, 4, 3, 4, 2), (4, 6, 5, 5, 6, 2),
+    (5, 4, 6, 5, 5, 3), (6, 6, 7, 7, 7, 3), (5, 4, 3, 3, 4, 2),
+    (5, 5, 5, 5, 6, 2), (5, 5, 5, 5, 5, 3), (6, 6, 7, 7, 7, 3),
+    (6, 5, 4, 4, 6, 3), (6, 7, 6, 6, 8, 3), (7, 6, 6, 6, 7, 4),
+    (8, 8, 8, 8, 9, 4), (4, 3, 2, 1, 0, 0), (4, 4, 3, 2, 1, 1),
+    (4, 3, 3, 2, 2, 1), (5, 4, 4, 3, 3, 2), (4, 3, 2, 3, 2, 1),
+    (4, 5, 3, 4, 3, 2), (5, 3, 3, 4, 4, 2), (6, 5, 4, 5, 5, 3),
+    (4, 3, 3, 2, 2, 1), (4, 4, 5, 3, 3, 2), (4, 4, 4, 3, 4, 2),
+    (5, 5, 6, 4, 5, 3), (5, 3, 3, 4, 4, 2), (5, 5, 5, 5, 5, 3),
+    (6, 4, 4, 5, 6, 3), (7, 6, 6, 6, 7, 4), (4, 4, 3, 2, 1, 1),
+    (4, 5, 4, 4, 2, 2), (4, 4, 5, 3, 3, 2), (5, 5, 6, 5, 4, 3),
+    (4, 5, 3, 4, 3, 2), (4, 7, 4, 6, 4, 3), (5, 5, 5, 5, 5, 3),
+    (6, 7, 6, 7, 6, 4), (5, 4, 4, 3, 3, 2), (5, 5, 6, 5, 4, 3),
+    (5, 5, 6, 4, 5, 3), (6, 6, 8, 6, 6, 4), (6, 5, 4, 5, 5, 3),
+    (6, 7, 6, 7, 6, 4), (7, 6, 6, 6, 7, 4), (8, 8, 8, 8, 8, 5),
+    (5, 4, 3, 2, 1, 0), (5, 5, 4, 3, 3, 1), (5, 4, 4, 4, 3, 1),
+    (6, 5, 5, 5, 5, 2), (5, 4, 4, 4, 3, 1), (5, 6, 5, 5, 5, 2),
+    (6, 4, 5, 6, 5, 2), (7, 6, 6, 7, 7, 3), (5, 5, 4, 3, 3, 1),
+    (5, 6, 6, 4, 5, 2), (5, 6, 5, 5, 5, 2), (6, 7, 7, 6, 7, 3),
+    (6, 5, 5, 5, 5, 2), (6, 7, 7, 6, 7, 3), (7, 6, 6, 7, 7, 3),
+    (8, 8, 8, 8, 9, 4), (6, 5, 4, 3, 2, 1), (6, 6, 5, 5, 4, 2),
+    (6, 5, 6, 5, 4, 2), (7, 6, 7, 7, 6, 3), (6, 6, 5, 5, 4, 2),
+    (6, 8, 6, 7, 6, 3), (7, 6, 7, 7, 6, 3), (8, 8, 8, 9, 8, 4),
+    (7, 6, 5, 4, 4, 2), (7, 7, 7, 6, 6, 3), (7, 7, 7, 6, 6, 3),
+    (8, 8, 9, 8, 8, 4), (8, 7, 6, 6, 6, 3), (8, 9, 8, 8, 8, 4),
+    (9, 8, 8, 8, 8, 4), (10, 10, 10, 10, 10, 5), (0, 0, 0, 0, 0, 0),
+    (1, 0, 0, 0, 0, 0), (0, 1, 0, 0, 0, 0), (2, 1, 0, 0, 0, 0),
+    (0, 0, 1, 0, 0, 0), (1, 1, 1, 0, 0, 0), (1, 1, 1, 0, 0, 0),
+    (3, 2, 1, 0, 0, 0), (0, 0, 0, 1, 0, 0), (1, 0, 1, 1, 0, 0),
+    (0, 2, 0, 1, 0, 0), (2, 2, 1, 1, 0, 0), (1, 0, 1, 1, 0, 0),
+    (2, 1, 2, 1, 0, 0), (2, 2, 1, 1, 0, 0), (4, 3, 2, 1, 0, 0),
+    (0, 0, 0, 0, 1, 0), (1, 0, 0, 1, 1, 0), (0, 1, 1, 0, 1, 0),
+    (2, 1, 1, 1, 1, 0), (0, 1, 1, 0, 1, 0), (1, 2, 1, 1, 1, 0),
+    (1, 2, 2, 0, 1, 0), (3, 3, 2, 1, 1, 0), (1, 0, 0, 1, 1, 0),
+    (2, 0, 1, 2, 1, 0), (1, 2, 1, 1, 1, 0), (3, 2, 2, 2, 1, 0),
+    (2, 1, 1, 1, 1, 0), (3, 2, 2, 2, 1, 0), (3, 3, 2, 1, 1, 0),
+    (5, 4, 3, 2, 1, 0), (0, 0, 0, 0, 0, 1), (1, 0, 0, 0, 1, 1),
+    (0, 1, 0, 1, 0, 1), (2, 1, 0, 1, 1, 1), (0, 0, 2, 0, 0, 1),
+    (1, 1, 2, 0, 1, 1), (1, 1, 2, 1, 0, 1), (3, 2, 2, 1, 1, 1),
+    (0, 1, 0, 1, 0, 1), (1, 1, 1, 1, 1, 1), (0, 3, 0, 2, 0, 1),
+    (2, 3, 1, 2, 1, 1), (1, 1, 2, 1, 0, 1), (2, 2, 3, 1, 1, 1),
+    (2, 3, 2, 2, 0, 1), (4, 4, 3, 2, 1, 1), (1, 0, 0, 0, 1, 1),
+    (2, 0, 0, 1, 2, 1), (1, 1, 1, 1, 1, 1), (3, 1, 1, 2, 2, 1),
+    (1, 1, 2, 0, 1, 1), (2, 2, 2, 1, 2, 1), (2, 2, 3, 1, 1, 1),
+    (4, 3, 3, 2, 2, 1), (2, 1, 0, 1, 1, 1), (3, 1, 1, 2, 2, 1),
+    (2, 3, 1, 2, 1, 1), (4, 3, 2, 3, 2, 1), (3, 2, 2, 1, 1, 1),
+    (4, 3, 3, 2, 2, 1), (4, 4, 3, 2, 1, 1), (6, 5, 4, 3, 2, 1),
+    (0, 0, 0, 0, 1, 0), (1, 0, 0, 0, 1, 1), (0, 1, 0, 0, 2, 0),
+    (2, 1, 0, 0, 2, 1), (0, 0, 1, 1, 1, 0), (1, 1, 1, 1, 1, 1),
+    (1, 1, 1, 1, 2, 0), (3, 2, 1, 1, 2, 1), (0, 0, 1, 1, 1, 0),
+    (1, 0, 2, 1, 1, 1), (0, 2, 1, 1, 2, 0), (2, 2, 2, 1, 2, 1),
+    (1, 0, 2, 2, 1, 0), (2, 1, 3, 2, 1, 1), (2, 2, 2, 2, 2, 0),
+    (4, 3, 3, 2, 2, 1), (0, 1, 0, 0, 2, 0), (1, 1, 0, 1, 2, 1),
+    (0, 2, 1, 0, 3, 0), (2, 2, 1, 1, 3, 1), (0, 2, 1, 1, 2, 0),
+    (1, 3, 1, 2, 2, 1), (1, 3, 2, 1, 3, 0), (3, 4, 2, 2, 3, 1),
+    (1, 1, 1, 1, 2, 0), (2, 1, 2, 2, 2, 1), (1, 3, 2, 1, 3, 0),
+    (3, 3, 3, 2, 3, 1), (2, 2, 2, 2, 2, 0), (3, 3, 3, 3, 2, 1),
+    (3, 4, 3, 2, 3, 0), (5, 5, 4, 3, 3, 1), (1, 0, 0, 0, 1, 1),
+    (2, 0, 0, 0, 2, 2), (1, 1, 0, 1, 2, 1), (3, 1, 0, 1, 3, 2),
+    (1, 0, 2, 1, 1, 1), (2, 1, 2, 1, 2, 2), (2, 1, 2, 2, 2, 1),
+    (4, 2, 2, 2, 3, 2), (1, 1, 1, 1, 1, 1), (2, 1, 2, 1, 2, 2),
+    (1, 3, 1, 2, 2, 1), (3, 3, 2, 2, 3, 2), (2, 1, 3, 2, 1, 1),
+    (3, 2, 4, 2, 2, 2), (3, 3, 3, 3, 2, 1), (5, 4, 4, 3, 3, 2),
+    (2, 1, 0, 0, 2, 1), (3, 1, 0, 1, 3, 2), (2, 2, 1, 1, 3, 1),
+    (4, 2, 1, 2, 4, 2), (2, 2, 2, 1, 2, 1), (3, 3, 2, 2, 3, 2),
+    (3, 3, 3, 2, 3, 1), (5, 4, 3, 3, 4, 2), (3, 2, 1, 1, 2, 1),
+    (4, 2, 2, 2, 3, 2), (3, 4, 2, 2, 3, 1), (5, 4, 3, 3, 4, 2),
+    (4, 3, 3, 2, 2, 1), (5, 4, 4, 3, 3, 2), (5, 5, 4, 3, 3, 1),
+    (7, 6, 5, 4, 4, 2), (0, 0, 0, 1, 0, 0), (1, 0, 0, 1, 1, 0),
+    (0, 1, 0, 1, 0, 1), (2, 1, 0, 1, 1, 1), (0, 0, 1, 1, 1, 0),
+    (1, 1, 1, 1, 2, 0), (1, 1, 1, 1, 1, 1), (3, 2, 1, 1, 2, 1),
+    (0, 0, 0, 3, 0, 0), (1, 0, 1, 3, 1, 0), (0, 2, 0, 3, 0, 1),
+    (2, 2, 1, 3, 1, 1), (1, 0, 1, 3, 1, 0), (2, 1, 2, 3, 2, 0),
+    (2, 2, 1, 3, 1, 1), (4, 3, 2, 3, 2, 1), (0, 0, 1, 1, 1, 0),
+    (1, 0, 1, 2, 2, 0), (0, 1, 2, 1, 1, 1), (2, 1, 2, 2, 2, 1),
+    (0, 1, 2, 1, 2, 0), (1, 2, 2, 2, 3, 0), (1, 2, 3, 1, 2, 1),
+    (3, 3, 3, 2, 3, 1), (1, 0, 1, 3, 1, 0), (2, 0, 2, 4, 2, 0),
+    (1, 2, 2, 3, 1, 1), (3, 2, 3, 4, 2, 1), (2, 1, 2, 3, 2, 0),
+    (3, 2, 3, 4, 3, 0), (3, 3, 3, 3, 2, 1), (5, 4, 4, 4, 3, 1),
+    (0, 1, 0, 1, 0, 1), (1, 1, 0, 1, 2, 1), (0, 2, 0, 2, 0, 2),
+    (2, 2, 0, 2, 2, 2), (0, 1, 2, 1, 1, 1), (1, 2, 2, 1, 3, 1),
+    (1, 2, 2, 2, 1, 2), (3, 3, 2, 2, 3, 2), (0, 2, 0, 3, 0, 1),
+    (1, 2, 1, 3, 2, 1), (0, 4, 0, 4, 0, 2), (2, 4, 1, 4, 2, 2),
+    (1, 2, 2, 3, 1, 1), (2, 3, 3, 3, 3, 1), (2, 4, 2, 4, 1, 2),
+    (4, 5, 3, 4, 3, 2), (1, 1, 1, 1, 1, 1), (2, 1, 1, 2, 3, 1),
+    (1, 2, 2, 2, 1, 2), (3, 2, 2, 3, 3, 2), (1, 2, 3, 1, 2, 1),
+    (2, 3, 3, 2, 4, 1), (2, 3, 4, 2, 2, 2), (4, 4, 4, 3, 4, 2),
+    (2, 2, 1, 3, 1, 1), (3, 2, 2, 4, 3, 1), (2, 4, 2, 4, 1, 2),
+    (4, 4, 3, 5, 3, 2), (3, 3, 3, 3, 2, 1), (4, 4, 4, 4, 4, 1),
+    (4, 5, 4, 4, 2, 2), (6, 6, 5, 5, 4, 2), (1, 0, 0, 1, 1, 0),
+    (2, 0, 0, 1, 2, 1), (1, 1, 0, 1, 2, 1), (3, 1, 0, 1, 3, 2),
+    (1, 0, 1, 2, 2, 0), (2, 1, 1, 2, 3, 1), (2, 1, 1, 2, 3, 1),
+    (4, 2, 1, 2, 4, 2), (1, 0, 1, 3, 1, 0), (2, 0, 2, 3, 2, 1),
+    (1, 2, 1, 3, 2, 1), (3, 2, 2, 3, 3, 2), (2, 0, 2, 4, 2, 0),
+    (3, 1, 3, 4, 3, 1), (3, 2, 2, 4, 3, 1), (5, 3, 3, 4, 4, 2),
+    (1, 1, 1, 1, 2, 0), (2, 1, 1, 2, 3, 1), (1, 2, 2, 1, 3, 1),
+    (3, 2, 2, 2, 4, 2), (1, 2, 2, 2, 3, 0), (2, 3, 2, 3, 4, 1),
+    (2, 3, 3, 2, 4, 1), (4, 4, 3, 3, 5, 2), (2, 1, 2, 3, 2, 0),
+    (3, 1, 3, 4, 3, 1), (2, 3, 3, 3, 3, 1), (4, 3, 4, 4, 4, 2),
+    (3, 2, 3, 4, 3, 0), (4, 3, 4, 5, 4, 1), (4, 4, 4, 4, 4, 1),
+    (6, 5, 5, 5, 5, 2), (2, 1, 0, 1, 1, 1), (3, 1, 0, 1, 3, 2),
+    (2, 2, 0, 2, 2, 2), (4, 2, 0, 2, 4, 3), (2, 1, 2, 2, 2, 1),
+    (3, 2, 2, 2, 4, 2), (3, 2, 2, 3, 3, 2), (5, 3, 2, 3, 5, 3),
+    (2, 2, 1, 3, 1, 1), (3, 2, 2, 3, 3, 2), (2, 4, 1, 4, 2, 2),
+    (4, 4, 2, 4, 4, 3), (3, 2, 3, 4, 2, 1), (4, 3, 4, 4, 4, 2),
+    (4, 4, 3, 5, 3, 2), (6, 5, 4, 5, 5, 3), (3, 2, 1, 1, 2, 1),
+    (4, 2, 1, 2, 4, 2), (3, 3, 2, 2, 3, 2), (5, 3, 2, 3, 5, 3),
+    (3, 3, 3, 2, 3, 1), (4, 4, 3, 3, 5, 2), (4, 4, 4, 3, 4, 2),
+    (6, 5, 4, 4, 6, 3), (4, 3, 2, 3, 2, 1), (5, 3, 3, 4, 4, 2),
+    (4, 5, 3, 4, 3, 2), (6, 5, 4, 5, 5, 3), (5, 4, 4, 4, 3, 1),
+    (6, 5, 5, 5, 5, 2), (6, 6, 5, 5, 4, 2), (8, 7, 6, 6, 6, 3),
+    (0, 0, 1, 0, 0, 0), (1, 0, 1, 1, 0, 0), (0, 1, 1, 0, 1, 0),
+    (2, 1, 1, 1, 1, 0), (0, 0, 2, 0, 0, 1), (1, 1, 2, 1, 0, 1),
+    (1, 1, 2, 0, 1, 1), (3, 2, 2, 1, 1, 1), (0, 0, 1, 1, 1, 0),
+    (1, 0, 2, 2, 1, 0), (0, 2, 1, 1, 2, 0), (2, 2, 2, 2, 2, 0),
+    (1, 0, 2, 1, 1, 1), (2, 1, 3, 2, 1, 1), (2, 2, 2, 1, 2, 1),
+    (4, 3, 3, 2, 2, 1), (0, 0, 1, 1, 1, 0), (1, 0, 1, 3, 1, 0),
+    (0, 1, 2, 1, 2, 0), (2, 1, 2, 3, 2, 0), (0, 1, 2, 1, 1, 1),
+    (1, 2, 2, 3, 1, 1), (1, 2, 3, 1, 2, 1), (3, 3, 3, 3, 2, 1),
+    (1, 0, 1, 2, 2, 0), (2, 0, 2, 4, 2, 0), (1, 2, 2, 2, 3, 0),
+    (3, 2, 3, 4, 3, 0), (2, 1, 2, 2, 2, 1), (3, 2, 3, 4, 2, 1),
+    (3, 3, 3, 2, 3, 1), (5, 4, 4, 4, 3, 1), (0, 0, 2, 0, 0, 1),
+    (1, 0, 2, 1, 1, 1), (0, 1, 2, 1, 1, 1), (2, 1, 2, 2, 2, 1),
+    (0, 0, 4, 0, 0, 2), (1, 1, 4, 1, 1, 2), (1, 1, 4, 1, 1, 2),
+    (3, 2, 4, 2, 2, 2), (0, 1, 2, 1, 1, 1), (1, 1, 3, 2, 2, 1),
+    (0, 3, 2, 2, 2, 1), (2, 3, 3, 3, 3, 1), (1, 1, 4, 1, 1, 2),
+    (2, 2, 5, 2, 2, 2), (2, 3, 4, 2, 2, 2), (4, 4, 5, 3, 3, 2),
+    (1, 0, 2, 1, 1, 1), (2, 0, 2, 3, 2, 1), (1, 1, 3, 2, 2, 1),
+    (3, 1, 3, 4, 3, 1), (1, 1, 4, 1, 1, 2), (2, 2, 4, 3, 2, 2),
+    (2, 2, 5, 2, 2, 2), (4, 3, 5, 4, 3, 2), (2, 1, 2, 2, 2, 1),
+    (3, 1, 3, 4, 3, 1), (2, 3, 3, 3, 3, 1), (4, 3, 4, 5, 4, 1),
+    (3, 2, 4, 2, 2, 2), (4, 3, 5, 4, 3, 2), (4, 4, 5, 3, 3, 2),
+    (6, 5, 6, 5, 4, 2), (0, 1, 1, 0, 1, 0), (1, 1, 1, 1, 1, 1),
+    (0, 2, 1, 0, 3, 0), (2, 2, 1, 1, 3, 1), (0, 1, 2, 1, 1, 1),
+    (1, 2, 2, 2, 1, 2), (1, 2, 2, 1, 3, 1), (3, 3, 2, 2, 3, 2),
+    (0, 1, 2, 1, 2, 0), (1, 1, 3, 2, 2, 1), (0, 3, 2, 1, 4, 0),
+    (2, 3, 3, 2, 4, 1), (1, 1, 3, 2, 2, 1), (2, 2, 4, 3, 2, 2),
+    (2, 3, 3, 2, 4, 1), (4, 4, 4, 3, 4, 2), (0, 2, 1, 1, 2, 0),
+    (1, 2, 1, 3, 2, 1), (0, 3, 2, 1, 4, 0), (2, 3, 2, 3, 4, 1),
+    (0, 3, 2, 2, 2, 1), (1, 4, 2, 4, 2, 2), (1, 4, 3, 2, 4, 1),
+    (3, 5, 3, 4, 4, 2), (1, 2, 2, 2, 3, 0), (2, 2, 3, 4, 3, 1),
+    (1, 4, 3, 2, 5, 0), (3, 4, 4, 4, 5, 1), (2, 3, 3, 3, 3, 1),
+    (3, 4, 4, 5, 3, 2), (3, 5, 4, 3, 5, 1), (5, 6, 5, 5, 5, 2),
+    (1, 1, 2, 0, 1, 1), (2, 1, 2, 1, 2, 2), (1, 2, 2, 1, 3, 1),
+    (3, 2, 2, 2, 4, 2), (1, 1, 4, 1, 1, 2), (2, 2, 4, 2, 2, 3),
+    (2, 2, 4, 2, 3, 2), (4, 3, 4, 3, 4, 3), (1, 2, 3, 1, 2, 1),
+    (2, 2, 4, 2, 3, 2), (1, 4, 3, 2, 4, 1), (3, 4, 4, 3, 5, 2),
+    (2, 2, 5, 2, 2, 2), (3, 3, 6, 3, 3, 3), (3, 4, 5, 3, 4, 2),
+    (5, 5, 6, 4, 5, 3), (2, 2, 2, 1, 2, 1), (3, 2, 2, 3, 3, 2),
+    (2, 3, 3, 2, 4, 1), (4, 3, 3, 4, 5, 2), (2, 3, 4, 2, 2, 2),
+    (3, 4, 4, 4, 3, 3), (3, 4, 5, 3, 4, 2), (5, 5, 5, 5, 5, 3),
+    (3, 3, 3, 2, 3, 1), (4, 3, 4, 4, 4, 2), (3, 5, 4, 3, 5, 1),
+    (5, 5, 5, 5, 6, 2), (4, 4, 5, 3, 3, 2), (5, 5, 6, 5, 4, 3),
+    (5, 6, 6, 4, 5, 2), (7, 7, 7, 6, 6, 3), (1, 0, 1, 1, 0, 0),
+    (2, 0, 1, 2, 1, 0), (1, 1, 1, 1, 1, 1), (3, 1, 1, 2, 2, 1),
+    (1, 0, 2, 1, 1, 1), (2, 1, 2, 2, 2, 1), (2, 1, 2, 1, 2, 2),
+    (4, 2, 2, 2, 3, 2), (1, 0, 1, 3, 1, 0), (2, 0, 2, 4, 2, 0),
+    (1, 2, 1, 3, 2, 1), (3, 2, 2, 4, 3, 1), (2, 0, 2, 3, 2, 1),
+    (3, 1, 3, 4, 3, 1), (3, 2, 2, 3, 3, 2), (5, 3, 3, 4, 4, 2),
+    (1, 0, 2, 2, 1, 0), (2, 0, 2, 4, 2, 0), (1, 1, 3, 2, 2, 1),
+    (3, 1, 3, 4, 3, 1), (1, 1, 3, 2, 2, 1), (2, 2, 3, 4, 3, 1),
+    (2, 2, 4, 2, 3, 2), (4, 3, 4, 4, 4, 2), (2, 0, 2, 4, 2, 0),
+    (3, 0, 3, 6, 3, 0), (2, 2, 3, 4, 3, 1), (4, 2, 4, 6, 4, 1),
+    (3, 1, 3, 4, 3, 1), (4, 2, 4, 6, 4, 1), (4, 3, 4, 4, 4, 2),
+    (6, 4, 5, 6, 5, 2), (1, 1, 2, 1, 0, 1), (2, 1, 2, 2, 2, 1),
+    (1, 2, 2, 2, 1, 2), (3, 2, 2, 3, 3, 2), (1, 1, 4, 1, 1, 2),
+    (2, 2, 4, 2, 3, 2), (2, 2, 4, 2, 2, 3), (4, 3, 4, 3, 4, 3),
+    (1, 2, 2, 3, 1, 1), (2, 2, 3, 4, 3, 1), (1, 4, 2, 4, 2, 2),
+    (3, 4, 3, 5, 4, 2), (2, 2, 4, 3, 2, 2), (3, 3, 5, 4, 4, 2),
+    (3, 4, 4, 4, 3, 3), (5, 5, 5, 5, 5, 3), (2, 1, 3, 2, 1, 1),
+    (3, 1, 3, 4, 3, 1), (2, 2, 4, 3, 2, 2), (4, 2, 4, 5, 4, 2),
+    (2, 2, 5, 2, 2, 2), (3, 3, 5, 4, 4, 2), (3, 3, 6, 3, 3, 3),
+    (5, 4, 6, 5, 5, 3), (3, 2, 3, 4, 2, 1), (4, 2, 4, 6, 4, 1),
+    (3, 4, 4, 5, 3, 2), (5, 4, 5, 7, 5, 2), (4, 3, 5, 4, 3, 2),
+    (5, 4, 6, 6, 5, 2), (5, 5, 6, 5, 4, 3), (7, 6, 7, 7, 6, 3),
+    (2, 1, 1, 1, 1, 0), (3, 1, 1, 2, 2, 1), (2, 2, 1, 1, 3, 1),
+    (4, 2, 1, 2, 4, 2), (2, 1, 2, 2, 2, 1), (3, 2, 2, 3, 3, 2),
+    (3, 2, 2, 2, 4, 2), (5, 3, 2, 3, 5, 3), (2, 1, 2, 3, 2, 0),
+    (3, 1, 3, 4, 3, 1), (2, 3, 2, 3, 4, 1), (4, 3, 3, 4, 5, 2),
+    (3, 1, 3, 4, 3, 1), (4, 2, 4, 5, 4, 2), (4, 3, 3, 4, 5, 2),
+    (6, 4, 4, 5, 6, 3), (2, 2, 2, 2, 2, 0), (3, 2, 2, 4, 3, 1),
+    (2, 3, 3, 2, 4, 1), (4, 3, 3, 4, 5, 2), (2, 3, 3, 3, 3, 1),
+    (3, 4, 3, 5, 4, 2), (3, 4, 4, 3, 5, 2), (5, 5, 4, 5, 6, 3),
+    (3, 2, 3, 4, 3, 0), (4, 2, 4, 6, 4, 1), (3, 4, 4, 4, 5, 1),
+    (5, 4, 5, 6, 6, 2), (4, 3, 4, 5, 4, 1), (5, 4, 5, 7, 5, 2),
+    (5, 5, 5, 5, 6, 2), (7, 6, 6, 7, 7, 3), (3, 2, 2, 1, 1, 1),
+    (4, 2, 2, 2, 3, 2), (3, 3, 2, 2, 3, 2), (5, 3, 2, 3, 5, 3),
+    (3, 2, 4, 2, 2, 2), (4, 3, 4, 3, 4, 3), (4, 3, 4, 3, 4, 3),
+    (6, 4, 4, 4, 6, 4), (3, 3, 3, 3, 2, 1), (4, 3, 4, 4, 4, 2),
+    (3, 5, 3, 4, 4, 2), (5, 5, 4, 5, 6, 3), (4, 3, 5, 4, 3, 2),
+    (5, 4, 6, 5, 5, 3), (5, 5, 5, 5, 5, 3), (7, 6, 6, 6, 7, 4),
+    (4, 3, 3, 2, 2, 1), (5, 3, 3, 4, 4, 2), (4, 4, 4, 3, 4, 2),
+    (6, 4, 4, 5, 6, 3), (4, 4, 5, 3, 3, 2), (5, 5, 5, 5, 5, 3),
+    (5, 5, 6, 4, 5, 3), (7, 6, 6, 6, 7, 4), (5, 4, 4, 4, 3, 1),
+    (6, 4, 5, 6, 5, 2), (5, 6, 5, 5, 5, 2), (7, 6, 6, 7, 7, 3),
+    (6, 5, 6, 5, 4, 2), (7, 6, 7, 7, 6, 3), (7, 7, 7, 6, 6, 3),
+    (9, 8, 8, 8, 8, 4), (0, 1, 0, 0, 0, 0), (1, 1, 1, 0, 0, 0),
+    (0, 2, 0, 1, 0, 0), (2, 2, 1, 1, 0, 0), (0, 1, 1, 0, 1, 0),
+    (1, 2, 2, 0, 1, 0), (1, 2, 1, 1, 1, 0), (3, 3, 2, 1, 1, 0),
+    (0, 1, 0, 1, 0, 1), (1, 1, 2, 1, 0, 1), (0, 3, 0, 2, 0, 1),
+    (2, 3, 2, 2, 0, 1), (1, 1, 1, 1, 1, 1), (2, 2, 3, 1, 1, 1),
+    (2, 3, 1, 2, 1, 1), (4, 4, 3, 2, 1, 1), (0, 1, 0, 0, 2, 0),
+    (1, 1, 1, 1, 2, 0), (0, 2, 1, 1, 2, 0), (2, 2, 2, 2, 2, 0),
+    (0, 2, 1, 0, 3, 0), (1, 3, 2, 1, 3, 0), (1, 3, 2, 1, 3, 0),
+    (3, 4, 3, 2, 3, 0), (1, 1, 0, 1, 2, 1), (2, 1, 2, 2, 2, 1),
+    (1, 3, 1, 2, 2, 1), (3, 3, 3, 3, 2, 1), (2, 2, 1, 1, 3, 1),
+    (3, 3, 3, 2, 3, 1), (3, 4, 2, 2, 3, 1), (5, 5, 4, 3, 3, 1),
+    (0, 1, 0, 1, 0, 1), (1, 1, 1, 1, 1, 1), (0, 2, 0, 3, 0, 1),
+    (2, 2, 1, 3, 1, 1), (0, 1, 2, 1, 1, 1), (1, 2, 3, 1, 2, 1),
+    (1, 2, 2, 3, 1, 1), (3, 3, 3, 3, 2, 1), (0, 2, 0, 2, 0, 2),
+    (1, 2, 2, 2, 1, 2), (0, 4, 0, 4, 0, 2), (2, 4, 2, 4, 1, 2),
+    (1, 2, 2, 2, 1, 2), (2, 3, 4, 2, 2, 2), (2, 4, 2, 4, 1, 2),
+    (4, 5, 4, 4, 2, 2), (1, 1, 0, 1, 2, 1), (2, 1, 1, 2, 3, 1),
+    (1, 2, 1, 3, 2, 1), (3, 2, 2, 4, 3, 1), (1, 2, 2, 1, 3, 1),
+    (2, 3, 3, 2, 4, 1), (2, 3, 3, 3, 3, 1), (4, 4, 4, 4, 4, 1),
+    (2, 2, 0, 2, 2, 2), (3, 2, 2, 3, 3, 2), (2, 4, 1, 4, 2, 2),
+    (4, 4, 3, 5, 3, 2), (3, 3, 2, 2, 3, 2), (4, 4, 4, 3, 4, 2),
+    (4, 5, 3, 4, 3, 2), (6, 6, 5, 5, 4, 2), (0, 1, 1, 0, 1, 0),
+    (1, 1, 2, 0, 1, 1), (0, 2, 1, 1, 2, 0), (2, 2, 2, 1, 2, 1),
+    (0, 1, 2, 1, 2, 0), (1, 2, 3, 1, 2, 1), (1, 2, 2, 2, 3, 0),
+    (3, 3, 3, 2, 3, 1), (0, 1, 2, 1, 1, 1), (1, 1, 4, 1, 1, 2),
+    (0, 3, 2, 2, 2, 1), (2, 3, 4, 2, 2, 2), (1, 1, 3, 2, 2, 1),
+    (2, 2, 5, 2, 2, 2), (2, 3, 3, 3, 3, 1), (4, 4, 5, 3, 3, 2),
+    (0, 2, 1, 0, 3, 0), (1, 2, 2, 1, 3, 1), (0, 3, 2, 1, 4, 0),
+    (2, 3, 3, 2, 4, 1), (0, 3, 2, 1, 4, 0), (1, 4, 3, 2, 4, 1),
+    (1, 4, 3, 2, 5, 0), (3, 5, 4, 3, 5, 1), (1, 2, 2, 1, 3, 1),
+    (2, 2, 4, 2, 3, 2), (1, 4, 3, 2, 4, 1), (3, 4, 5, 3, 4, 2),
+    (2, 3, 3, 2, 4, 1), (3, 4, 5, 3, 4, 2), (3, 5, 4, 3, 5, 1),
+    (5, 6, 6, 4, 5, 2), (1, 1, 1, 1, 1, 1), (2, 1, 2, 1, 2, 2),
+    (1, 2, 1, 3, 2, 1), (3, 2, 2, 3, 3, 2), (1, 1, 3, 2, 2, 1),
+    (2, 2, 4, 2, 3, 2), (2, 2, 3, 4, 3, 1), (4, 3, 4, 4, 4, 2),
+    (1, 2, 2, 2, 1, 2), (2, 2, 4, 2, 2, 3), (1, 4, 2, 4, 2, 2),
+    (3, 4, 4, 4, 3, 3), (2, 2, 4, 3, 2, 2), (3, 3, 6, 3, 3, 3),
+    (3, 4, 4, 5, 3, 2), (5, 5, 6, 5, 4, 3), (2, 2, 1, 1, 3, 1),
+    (3, 2, 2, 2, 4, 2), (2, 3, 2, 3, 4, 1), (4, 3, 3, 4, 5, 2),
+    (2, 3, 3, 2, 4, 1), (3, 4, 4, 3, 5, 2), (3, 4, 4, 4, 5, 1),
+    (5, 5, 5, 5, 6, 2), (3, 3, 2, 2, 3, 2), (4, 3, 4, 3, 4, 3),
+    (3, 5, 3, 4, 4, 2), (5, 5, 5, 5, 5, 3), (4, 4, 4, 3, 4, 2),
+    (5, 5, 6, 4, 5, 3), (5, 6, 5, 5, 5, 2), (7, 7, 7, 6, 6, 3),
+    (0, 2, 0, 1, 0, 0), (1, 2, 1, 1, 1, 0), (0, 3, 0, 2, 0, 1),
+    (2, 3, 1, 2, 1, 1), (0, 2, 1, 1, 2, 0), (1, 3, 2, 1, 3, 0),
+    (1, 3, 1, 2, 2, 1), (3, 4, 2, 2, 3, 1), (0, 2, 0, 3, 0, 1),
+    (1, 2, 2, 3, 1, 1), (0, 4, 0, 4, 0, 2), (2, 4, 2, 4, 1, 2),
+    (1, 2, 1, 3, 2, 1), (2, 3, 3, 3, 3, 1), (2, 4, 1, 4, 2, 2),
+    (4, 5, 3, 4, 3, 2), (0, 2, 1, 1, 2, 0), (1, 2, 2, 2, 3, 0),
+    (0, 3, 2, 2, 2, 1), (2, 3, 3, 3, 3, 1), (0, 3, 2, 1, 4, 0),
+    (1, 4, 3, 2, 5, 0), (1, 4, 3, 2, 4, 1), (3, 5, 4, 3, 5, 1),
+    (1, 2, 1, 3, 2, 1), (2, 2, 3, 4, 3, 1), (1, 4, 2, 4, 2, 2),
+    (3, 4, 4, 5, 3, 2), (2, 3, 2, 3, 4, 1), (3, 4, 4, 4, 5, 1),
+    (3, 5, 3, 4, 4, 2), (5, 6, 5, 5, 5, 2), (0, 3, 0, 2, 0, 1),
+    (1, 3, 1, 2, 2, 1), (0, 4, 0, 4, 0, 2), (2, 4, 1, 4, 2, 2),
+    (0, 3, 2, 2, 2, 1), (1, 4, 3, 2, 4, 1), (1, 4, 2, 4, 2, 2),
+    (3, 5, 3, 4, 4, 2), (0, 4, 0, 4, 0, 2), (1, 4, 2, 4, 2, 2),
+    (0, 6, 0, 6, 0, 3), (2, 6, 2, 6, 2, 3), (1, 4, 2, 4, 2, 2),
+    (2, 5, 4, 4, 4, 2), (2, 6, 2, 6, 2, 3), (4, 7, 4, 6, 4, 3),
+    (1, 3, 1, 2, 2, 1), (2, 3, 2, 3, 4, 1), (1, 4, 2, 4, 2, 2),
+    (3, 4, 3, 5, 4, 2), (1, 4, 3, 2, 4, 1), (2, 5, 4, 3, 6, 1),
+    (2, 5, 4, 4, 4, 2), (4, 6, 5, 5, 6, 2), (2, 4, 1, 4, 2, 2),
+    (3, 4, 3, 5, 4, 2), (2, 6, 2, 6, 2, 3), (4, 6, 4, 7, 4, 3),
+    (3, 5, 3, 4, 4, 2), (4, 6, 5, 5, 6, 2), (4, 7, 4, 6, 4, 3),
+    (6, 8, 6, 7, 6, 3), (1, 2, 1, 1, 1, 0), (2, 2, 2, 1, 2, 1),
+    (1, 3, 1, 2, 2, 1), (3, 3, 2, 2, 3, 2), (1, 2, 2, 2, 3, 0),
+    (2, 3, 3, 2, 4, 1), (2, 3, 2, 3, 4, 1), (4, 4, 3, 3, 5, 2),
+    (1, 2, 2, 3, 1, 1), (2, 2, 4, 3, 2, 2), (1, 4, 2, 4, 2, 2),
+    (3, 4, 4, 4, 3, 3), (2, 2, 3, 4, 3, 1), (3, 3, 5, 4, 4, 2),
+    (3, 4, 3, 5, 4, 2), (5, 5, 5, 5, 5, 3), (1, 3, 2, 1, 3, 0),
+    (2, 3, 3, 2, 4, 1), (1, 4, 3, 2, 4, 1), (3, 4, 4, 3, 5, 2),
+    (1, 4, 3, 2, 5, 0), (2, 5, 4, 3, 6, 1), (2, 5, 4, 3, 6, 1),
+    (4, 6, 5, 4, 7, 2), (2, 3, 3, 3, 3, 1), (3, 3, 5, 4, 4, 2),
+    (2, 5, 4, 4, 4, 2), (4, 5, 6, 5, 5, 3), (3, 4, 4, 4, 5, 1),
+    (4, 5, 6, 5, 6, 2), (4, 6, 5, 5, 6, 2), (6, 7, 7, 6, 7, 3),
+    (2, 3, 1, 2, 1, 1), (3, 3, 2, 2, 3, 2), (2, 4, 1, 4, 2, 2),
+    (4, 4, 2, 4, 4, 3), (2, 3, 3, 3, 3, 1), (3, 4, 4, 3, 5, 2),
+    (3, 4, 3, 5, 4, 2), (5, 5, 4, 5, 6, 3), (2, 4, 2, 4, 1, 2),
+    (3, 4, 4, 4, 3, 3), (2, 6, 2, 6, 2, 3), (4, 6, 4, 6, 4, 4),
+    (3, 4, 4, 5, 3, 2), (4, 5, 6, 5, 5, 3), (4, 6, 4, 7, 4, 3),
+    (6, 7, 6, 7, 6, 4), (3, 4, 2, 2, 3, 1), (4, 4, 3, 3, 5, 2),
+    (3, 5, 3, 4, 4, 2), (5, 5, 4, 5, 6, 3), (3, 5, 4, 3, 5, 1),
+    (4, 6, 5, 4, 7, 2), (4, 6, 5, 5, 6, 2), (6, 7, 6, 6, 8, 3),
+    (4, 5, 3, 4, 3, 2), (5, 5, 5, 5, 5, 3), (4, 7, 4, 6, 4, 3),
+    (6, 7, 6, 7, 6, 4), (5, 6, 5, 5, 5, 2), (6, 7, 7, 6, 7, 3),
+    (6, 8, 6, 7, 6, 3), (8, 9, 8, 8, 8, 4), (1, 1, 1, 0, 0, 0),
+    (2, 1, 2, 1, 0, 0), (1, 2, 1, 1, 1, 0), (3, 2, 2, 2, 1, 0),
+    (1, 1, 2, 0, 1, 1), (2, 2, 3, 1, 1, 1), (2, 2, 2, 1, 2, 1),
+    (4, 3, 3, 2, 2, 1), (1, 1, 1, 1, 1, 1), (2, 1, 3, 2, 1, 1),
+    (1, 3, 1, 2, 2, 1), (3, 3, 3, 3, 2, 1), (2, 1, 2, 1, 2, 2),
+    (3, 2, 4, 2, 2, 2), (3, 3, 2, 2, 3, 2), (5, 4, 4, 3, 3, 2),
+    (1, 1, 1, 1, 2, 0), (2, 1, 2, 3, 2, 0), (1, 2, 2, 2, 3, 0),
+    (3, 2, 3, 4, 3, 0), (1, 2, 2, 1, 3, 1), (2, 3, 3, 3, 3, 1),
+    (2, 3, 3, 2, 4, 1), (4, 4, 4, 4, 4, 1), (2, 1, 1, 2, 3, 1),
+    (3, 1, 3, 4, 3, 1), (2, 3, 2, 3, 4, 1), (4, 3, 4, 5, 4, 1),
+    (3, 2, 2, 2, 4, 2), (4, 3, 4, 4, 4, 2), (4, 4, 3, 3, 5, 2),
+    (6, 5, 5, 5, 5, 2), (1, 1, 2, 1, 0, 1), (2, 1, 3, 2, 1, 1),
+    (1, 2, 2, 3, 1, 1), (3, 2, 3, 4, 2, 1), (1, 1, 4, 1, 1, 2),
+    (2, 2, 5, 2, 2, 2), (2, 2, 4, 3, 2, 2), (4, 3, 5, 4, 3, 2),
+    (1, 2, 2, 2, 1, 2), (2, 2, 4, 3, 2, 2), (1, 4, 2, 4, 2, 2),
+    (3, 4, 4, 5, 3, 2), (2, 2, 4, 2, 2, 3), (3, 3, 6, 3, 3, 3),
+    (3, 4, 4, 4, 3, 3), (5, 5, 6, 5, 4, 3), (2, 1, 2, 2, 2, 1),
+    (3, 1, 3, 4, 3, 1), (2, 2, 3, 4, 3, 1), (4, 2, 4, 6, 4, 1),
+    (2, 2, 4, 2, 3, 2), (3, 3, 5, 4, 4, 2), (3, 3, 5, 4, 4, 2),
+    (5, 4, 6, 6, 5, 2), (3, 2, 2, 3, 3, 2), (4, 2, 4, 5, 4, 2),
+    (3, 4, 3, 5, 4, 2), (5, 4, 5, 7, 5, 2), (4, 3, 4, 3, 4, 3),
+    (5, 4, 6, 5, 5, 3), (5, 5, 5, 5, 5, 3), (7, 6, 7, 7, 6, 3),
+    (1, 2, 2, 0, 1, 0), (2, 2, 3, 1, 1, 1), (1, 3, 2, 1, 3, 0),
+    (3, 3, 3, 2, 3, 1), (1, 2, 3, 1, 2, 1), (2, 3, 4, 2, 2, 2),
+    (2, 3, 3, 2, 4, 1), (4, 4, 4, 3, 4, 2), (1, 2, 3, 1, 2, 1),
+    (2, 2, 5, 2, 2, 2), (1, 4, 3, 2, 4, 1), (3, 4, 5, 3, 4, 2),
+    (2, 2, 4, 2, 3, 2), (3, 3, 6, 3, 3, 3), (3, 4, 4, 3, 5, 2),
+    (5, 5, 6, 4, 5, 3), (1, 3, 2, 1, 3, 0), (2, 3, 3, 3, 3, 1),
+    (1, 4, 3, 2, 5, 0), (3, 4, 4, 4, 5, 1), (1, 4, 3, 2, 4, 1),
+    (2, 5, 4, 4, 4, 2), (2, 5, 4, 3, 6, 1), (4, 6, 5, 5, 6, 2),
+    (2, 3, 3, 2, 4, 1), (3, 3, 5, 4, 4, 2), (2, 5, 4, 3, 6, 1),
+    (4, 5, 6, 5, 6, 2), (3, 4, 4, 3, 5, 2), (4, 5, 6, 5, 5, 3),
+    (4, 6, 5, 4, 7, 2), (6, 7, 7, 6, 7, 3), (2, 2, 3, 1, 1, 1),
+    (3, 2, 4, 2, 2, 2), (2, 3, 3, 3, 3, 1), (4, 3, 4, 4, 4, 2),
+    (2, 2, 5, 2, 2, 2), (3, 3, 6, 3, 3, 3), (3, 3, 5, 4, 4, 2),
+    (5, 4, 6, 5, 5, 3), (2, 3, 4, 2, 2, 2), (3, 3, 6, 3, 3, 3),
+    (2, 5, 4, 4, 4, 2), (4, 5, 6, 5, 5, 3), (3, 3, 6, 3, 3, 3),
+    (4, 4, 8, 4, 4, 4), (4, 5, 6, 5, 5, 3), (6, 6, 8, 6, 6, 4),
+    (3, 3, 3, 2, 3, 1), (4, 3, 4, 4, 4, 2), (3, 4, 4, 4, 5, 1),
+    (5, 4, 5, 6, 6, 2), (3, 4, 5, 3, 4, 2), (4, 5, 6, 5, 5, 3),
+    (4, 5, 6, 5, 6, 2), (6, 6, 7, 7, 7, 3), (4, 4, 4, 3, 4, 2),
+    (5, 4, 6, 5, 5, 3), (4, 6, 5, 5, 6, 2), (6, 6, 7, 7, 7, 3),
+    (5, 5, 6, 4, 5, 3), (6, 6, 8, 6, 6, 4), (6, 7, 7, 6, 7, 3),
+    (8, 8, 9, 8, 8, 4), (2, 2, 1, 1, 0, 0), (3, 2, 2, 2, 1, 0),
+    (2, 3, 1, 2, 1, 1), (4, 3, 2, 3, 2, 1), (2, 2, 2, 1, 2, 1),
+    (3, 3, 3, 2, 3, 1), (3, 3, 2, 2, 3, 2), (5, 4, 3, 3, 4, 2),
+    (2, 2, 1, 3, 1, 1), (3, 2, 3, 4, 2, 1), (2, 4, 1, 4, 2, 2),
+    (4, 4, 3, 5, 3, 2), (3, 2, 2, 3, 3, 2), (4, 3, 4, 4, 4, 2),
+    (4, 4, 2, 4, 4, 3), (6, 5, 4, 5, 5, 3), (2, 2, 2, 2, 2, 0),
+    (3, 2, 3, 4, 3, 0), (2, 3, 3, 3, 3, 1), (4, 3, 4, 5, 4, 1),
+    (2, 3, 3, 2, 4, 1), (3, 4, 4, 4, 5, 1), (3, 4, 4, 3, 5, 2),
+    (5, 5, 5, 5, 6, 2), (3, 2, 2, 4, 3, 1), (4, 2, 4, 6, 4, 1),
+    (3, 4, 3, 5, 4, 2), (5, 4, 5, 7, 5, 2), (4, 3, 3, 4, 5, 2),
+    (5, 4, 5, 6, 6, 2), (5, 5, 4, 5, 6, 3), (7, 6, 6, 7, 7, 3),
+    (2, 3, 2, 2, 0, 1), (3, 3, 3, 3, 2, 1), (2, 4, 2, 4, 1, 2),
+    (4, 4, 3, 5, 3, 2), (2, 3, 4, 2, 2, 2), (3, 4, 5, 3, 4, 2),
+    (3, 4, 4, 4, 3, 3), (5, 5, 5, 5, 5, 3), (2, 4, 2, 4, 1, 2),
+    (3, 4, 4, 5, 3, 2), (2, 6, 2, 6, 2, 3), (4, 6, 4, 7, 4, 3),
+    (3, 4, 4, 4, 3, 3), (4, 5, 6, 5, 5, 3), (4, 6, 4, 6, 4, 4),
+    (6, 7, 6, 7, 6, 4), (3, 3, 3, 3, 2, 1), (4, 3, 4, 5, 4, 1),
+    (3, 4, 4, 5, 3, 2), (5, 4, 5, 7, 5, 2), (3, 4, 5, 3, 4, 2),
+    (4, 5, 6, 5, 6, 2), (4, 5, 6, 5, 5, 3), (6, 6, 7, 7, 7, 3),
+    (4, 4, 3, 5, 3, 2), (5, 4, 5, 7, 5, 2), (4, 6, 4, 7, 4, 3),
+    (6, 6, 6, 9, 6, 3), (5, 5, 5, 5, 5, 3), (6, 6, 7, 7, 7, 3),
+    (6, 7, 6, 7, 6, 4), (8, 8, 8, 9, 8, 4), (3, 3, 2, 1, 1, 0),
+    (4, 3, 3, 2, 2, 1), (3, 4, 2, 2, 3, 1), (5, 4, 3, 3, 4, 2),
+    (3, 3, 3, 2, 3, 1), (4, 4, 4, 3, 4, 2), (4, 4, 3, 3, 5, 2),
+    (6, 5, 4, 4, 6, 3), (3, 3, 3, 3, 2, 1), (4, 3, 5, 4, 3, 2),
+    (3, 5, 3, 4, 4, 2), (5, 5, 5, 5, 5, 3), (4, 3, 4, 4, 4, 2),
+    (5, 4, 6, 5, 5, 3), (5, 5, 4, 5, 6, 3), (7, 6, 6, 6, 7, 4),
+    (3, 4, 3, 2, 3, 0), (4, 4, 4, 4, 4, 1), (3, 5, 4, 3, 5, 1),
+    (5, 5, 5, 5, 6, 2), (3, 5, 4, 3, 5, 1), (4, 6, 5, 5, 6, 2),
+    (4, 6, 5, 4, 7, 2), (6, 7, 6, 6, 8, 3), (4, 4, 4, 4, 4, 1),
+    (5, 4, 6, 6, 5, 2), (4, 6, 5, 5, 6, 2), (6, 6, 7, 7, 7, 3),
+    (5, 5, 5, 5, 6, 2), (6, 6, 7, 7, 7, 3), (6, 7, 6, 6, 8, 3),
+    (8, 8, 8, 8, 9, 4), (4, 4, 3, 2, 1, 1), (5, 4, 4, 3, 3, 2),
+    (4, 5, 3, 4, 3, 2), (6, 5, 4, 5, 5, 3), (4, 4, 5, 3, 3, 2),
+    (5, 5, 6, 4, 5, 3), (5, 5, 5, 5, 5, 3), (7, 6, 6, 6, 7, 4),
+    (4, 5, 4, 4, 2, 2), (5, 5, 6, 5, 4, 3), (4, 7, 4, 6, 4, 3),
+    (6, 7, 6, 7, 6, 4), (5, 5, 6, 5, 4, 3), (6, 6, 8, 6, 6, 4),
+    (6, 7, 6, 7, 6, 4), (8, 8, 8, 8, 8, 5), (5, 5, 4, 3, 3, 1),
+    (6, 5, 5, 5, 5, 2), (5, 6, 5, 5, 5, 2), (7, 6, 6, 7, 7, 3),
+    (5, 6, 6, 4, 5, 2), (6, 7, 7, 6, 7, 3), (6, 7, 7, 6, 7, 3),
+    (8, 8, 8, 8, 9, 4), (6, 6, 5, 5, 4, 2), (7, 6, 7, 7, 6, 3),
+    (6, 8, 6, 7, 6, 3), (8, 8, 8, 9, 8, 4), (7, 7, 7, 6, 6, 3),
+    (8, 8, 9, 8, 8, 4), (8, 9, 8, 8, 8, 4), (10, 10, 10, 10, 10, 5),
+    (1, 0, 0, 0, 0, 0), (2, 1, 0, 0, 0, 0), (1, 1, 1, 0, 0, 0),
+    (3, 2, 1, 0, 0, 0), (1, 0, 1, 1, 0, 0), (2, 2, 1, 1, 0, 0),
+    (2, 1, 2, 1, 0, 0), (4, 3, 2, 1, 0, 0), (1, 0, 0, 1, 1, 0),
+    (2, 1, 1, 1, 1, 0), (1, 2, 1, 1, 1, 0), (3, 3, 2, 1, 1, 0),
+    (2, 0, 1, 2, 1, 0), (3, 2, 2, 2, 1, 0), (3, 2, 2, 2, 1, 0),
+    (5, 4, 3, 2, 1, 0), (1, 0, 0, 0, 1, 1), (2, 1, 0, 1, 1, 1),
+    (1, 1, 2, 0, 1, 1), (3, 2, 2, 1, 1, 1), (1, 1, 1, 1, 1, 1),
+    (2, 3, 1, 2, 1, 1), (2, 2, 3, 1, 1, 1), (4, 4, 3, 2, 1, 1),
+    (2, 0, 0, 1, 2, 1), (3, 1, 1, 2, 2, 1), (2, 2, 2, 1, 2, 1),
+    (4, 3, 3, 2, 2, 1), (3, 1, 1, 2, 2, 1), (4, 3, 2, 3, 2, 1),
+    (4, 3, 3, 2, 2, 1), (6, 5, 4, 3, 2, 1), (1, 0, 0, 0, 1, 1),
+    (2, 1, 0, 0, 2, 1), (1, 1, 1, 1, 1, 1), (3, 2, 1, 1, 2, 1),
+    (1, 0, 2, 1, 1, 1), (2, 2, 2, 1, 2, 1), (2, 1, 3, 2, 1, 1),
+    (4, 3, 3, 2, 2, 1), (1, 1, 0, 1, 2, 1), (2, 2, 1, 1, 3, 1),
+    (1, 3, 1, 2, 2, 1), (3, 4, 2, 2, 3, 1), (2, 1, 2, 2, 2, 1),
+    (3, 3, 3, 2, 3, 1), (3, 3, 3, 3, 2, 1), (5, 5, 4, 3, 3, 1),
+    (2, 0, 0, 0, 2, 2), (3, 1, 0, 1, 3, 2), (2, 1, 2, 1, 2, 2),
+    (4, 2, 2, 2, 3, 2), (2, 1, 2, 1, 2, 2), (3, 3, 2, 2, 3, 2),
+    (3, 2, 4, 2, 2, 2), (5, 4, 4, 3, 3, 2), (3, 1, 0, 1, 3, 2),
+    (4, 2, 1, 2, 4, 2), (3, 3, 2, 2, 3, 2), (5, 4, 3, 3, 4, 2),
+    (4, 2, 2, 2, 3, 2), (5, 4, 3, 3, 4, 2), (5, 4, 4, 3, 3, 2),
+    (7, 6, 5, 4, 4, 2), (1, 0, 0, 1, 1, 0), (2, 1, 0, 1, 1, 1),
+    (1, 1, 1, 1, 2, 0), (3, 2, 1, 1, 2, 1), (1, 0, 1, 3, 1, 0),
+    (2, 2, 1, 3, 1, 1), (2, 1, 2, 3, 2, 0), (4, 3, 2, 3, 2, 1),
+    (1, 0, 1, 2, 2, 0), (2, 1, 2, 2, 2, 1), (1, 2, 2, 2, 3, 0),
+    (3, 3, 3, 2, 3, 1), (2, 0, 2, 4, 2, 0), (3, 2, 3, 4, 2, 1),
+    (3, 2, 3, 4, 3, 0), (5, 4, 4, 4, 3, 1), (1, 1, 0, 1, 2, 1),
+    (2, 2, 0, 2, 2, 2), (1, 2, 2, 1, 3, 1), (3, 3, 2, 2, 3, 2),
+    (1, 2, 1, 3, 2, 1), (2, 4, 1, 4, 2, 2), (2, 3, 3, 3, 3, 1),
+    (4, 5, 3, 4, 3, 2), (2, 1, 1, 2, 3, 1), (3, 2, 2, 3, 3, 2),
+    (2, 3, 3, 2, 4, 1), (4, 4, 4, 3, 4, 2), (3, 2, 2, 4, 3, 1),
+    (4, 4, 3, 5, 3, 2), (4, 4, 4, 4, 4, 1), (6, 6, 5, 5, 4, 2),
+    (2, 0, 0, 1, 2, 1), (3, 1, 0, 1, 3, 2), (2, 1, 1, 2, 3, 1),
+    (4, 2, 1, 2, 4, 2), (2, 0, 2, 3, 2, 1), (3, 2, 2, 3, 3, 2),
+    (3, 1, 3, 4, 3, 1), (5, 3, 3, 4, 4, 2), (2, 1, 1, 2, 3, 1),
+    (3, 2, 2, 2, 4, 2), (2, 3, 2, 3, 4, 1), (4, 4, 3, 3, 5, 2),
+    (3, 1, 3, 4, 3, 1), (4, 3, 4, 4, 4, 2), (4, 3, 4, 5, 4, 1),
+    (6, 5, 5, 5, 5, 2), (3, 1, 0, 1, 3, 2), (4, 2, 0, 2, 4, 3),
+    (3, 2, 2, 2, 4, 2), (5, 3, 2, 3, 5, 3), (3, 2, 2, 3, 3, 2),
+    (4, 4, 2, 4, 4, 3), (4, 3, 4, 4, 4, 2), (6, 5, 4, 5, 5, 3),
+    (4, 2, 1, 2, 4, 2), (5, 3, 2, 3, 5, 3), (4, 4, 3, 3, 5, 2),
+    (6, 5, 4, 4, 6, 3), (5, 3, 3, 4, 4, 2), (6, 5, 4, 5, 5, 3),
+    (6, 5, 5, 5, 5, 2), (8, 7, 6, 6, 6, 3), (1, 0, 1, 1, 0, 0),
+    (2, 1, 1, 1, 1, 0), (1, 1, 2, 1, 0, 1), (3, 2, 2, 1, 1, 1),
+    (1, 0, 2, 2, 1, 0), (2, 2, 2, 2, 2, 0), (2, 1, 3, 2, 1, 1),
+    (4, 3, 3, 2, 2, 1), (1, 0, 1, 3, 1, 0), (2, 1, 2, 3, 2, 0),
+    (1, 2, 2, 3, 1, 1), (3, 3, 3, 3, 2, 1), (2, 0, 2, 4, 2, 0),
+    (3, 2, 3, 4, 3, 0), (3, 2, 3, 4, 2, 1), (5, 4, 4, 4, 3, 1),
+    (1, 0, 2, 1, 1, 1), (2, 1, 2, 2, 2, 1), (1, 1, 4, 1, 1, 2),
+    (3, 2, 4, 2, 2, 2), (1, 1, 3, 2, 2, 1), (2, 3, 3, 3, 3, 1),
+    (2, 2, 5, 2, 2, 2), (4, 4, 5, 3, 3, 2), (2, 0, 2, 3, 2, 1),
+    (3, 1, 3, 4, 3, 1), (2, 2, 4, 3, 2, 2), (4, 3, 5, 4, 3, 2),
+    (3, 1, 3, 4, 3, 1), (4, 3, 4, 5, 4, 1), (4, 3, 5, 4, 3, 2),
+    (6, 5, 6, 5, 4, 2), (1, 1, 1, 1, 1, 1), (2, 2, 1, 1, 3, 1),
+    (1, 2, 2, 2, 1, 2), (3, 3, 2, 2, 3, 2), (1, 1, 3, 2, 2, 1),
+    (2, 3, 3, 2, 4, 1), (2, 2, 4, 3, 2, 2), (4, 4, 4, 3, 4, 2),
+    (1, 2, 1, 3, 2, 1), (2, 3, 2, 3, 4, 1), (1, 4, 2, 4, 2, 2),
+    (3, 5, 3, 4, 4, 2), (2, 2, 3, 4, 3, 1), (3, 4, 4, 4, 5, 1),
+    (3, 4, 4, 5, 3, 2), (5, 6, 5, 5, 5, 2), (2, 1, 2, 1, 2, 2),
+    (3, 2, 2, 2, 4, 2), (2, 2, 4, 2, 2, 3), (4, 3, 4, 3, 4, 3),
+    (2, 2, 4, 2, 3, 2), (3, 4, 4, 3, 5, 2), (3, 3, 6, 3, 3, 3),
+    (5, 5, 6, 4, 5, 3), (3, 2, 2, 3, 3, 2), (4, 3, 3, 4, 5, 2),
+    (3, 4, 4, 4, 3, 3), (5, 5, 5, 5, 5, 3), (4, 3, 4, 4, 4, 2),
+    (5, 5, 5, 5, 6, 2), (5, 5, 6, 5, 4, 3), (7, 7, 7, 6, 6, 3),
+    (2, 0, 1, 2, 1, 0), (3, 1, 1, 2, 2, 1), (2, 1, 2, 2, 2, 1),
+    (4, 2, 2, 2, 3, 2), (2, 0, 2, 4, 2, 0), (3, 2, 2, 4, 3, 1),
+    (3, 1, 3, 4, 3, 1), (5, 3, 3, 4, 4, 2), (2, 0, 2, 4, 2, 0),
+    (3, 1, 3, 4, 3, 1), (2, 2, 3, 4, 3, 1), (4, 3, 4, 4, 4, 2),
+    (3, 0, 3, 6, 3, 0), (4, 2, 4, 6, 4, 1), (4, 2, 4, 6, 4, 1),
+    (6, 4, 5, 6, 5, 2), (2, 1, 2, 2, 2, 1), (3, 2, 2, 3, 3, 2),
+    (2, 2, 4, 2, 3, 2), (4, 3, 4, 3, 4, 3), (2, 2, 3, 4, 3, 1),
+    (3, 4, 3, 5, 4, 2), (3, 3, 5, 4, 4, 2), (5, 5, 5, 5, 5, 3),
+    (3, 1, 3, 4, 3, 1), (4, 2, 4, 5, 4, 2), (3, 3, 5, 4, 4, 2),
+    (5, 4, 6, 5, 5, 3), (4, 2, 4, 6, 4, 1), (5, 4, 5, 7, 5, 2),
+    (5, 4, 6, 6, 5, 2), (7, 6, 7, 7, 6, 3), (3, 1, 1, 2, 2, 1),
+    (4, 2, 1, 2, 4, 2), (3, 2, 2, 3, 3, 2), (5, 3, 2, 3, 5, 3),
+    (3, 1, 3, 4, 3, 1), (4, 3, 3, 4, 5, 2), (4, 2, 4, 5, 4, 2),
+    (6, 4, 4, 5, 6, 3), (3, 2, 2, 4, 3, 1), (4, 3, 3, 4, 5, 2),
+    (3, 4, 3, 5, 4, 2), (5, 5, 4, 5, 6, 3), (4, 2, 4, 6, 4, 1),
+    (5, 4, 5, 6, 6, 2), (5, 4, 5, 7, 5, 2), (7, 6, 6, 7, 7, 3),
+    (4, 2, 2, 2, 3, 2), (5, 3, 2, 3, 5, 3), (4, 3, 4, 3, 4, 3),
+    (6, 4, 4, 4, 6, 4), (4, 3, 4, 4, 4, 2), (5, 5, 4, 5, 6, 3),
+    (5, 4, 6, 5, 5, 3), (7, 6, 6, 6, 7, 4), (5, 3, 3, 4, 4, 2),
+    (6, 4, 4, 5, 6, 3), (5, 5, 5, 5, 5, 3), (7, 6, 6, 6, 7, 4),
+    (6, 4, 5, 6, 5, 2), (7, 6, 6, 7, 7, 3), (7, 6, 7, 7, 6, 3),
+    (9, 8, 8, 8, 8, 4), (1, 1, 1, 0, 0, 0), (2, 2, 1, 1, 0, 0),
+    (1, 2, 2, 0, 1, 0), (3, 3, 2, 1, 1, 0), (1, 1, 2, 1, 0, 1),
+    (2, 3, 2, 2, 0, 1), (2, 2, 3, 1, 1, 1), (4, 4, 3, 2, 1, 1),
+    (1, 1, 1, 1, 2, 0), (2, 2, 2, 2, 2, 0), (1, 3, 2, 1, 3, 0),
+    (3, 4, 3, 2, 3, 0), (2, 1, 2, 2, 2, 1), (3, 3, 3, 3, 2, 1),
+    (3, 3, 3, 2, 3, 1), (5, 5, 4, 3, 3, 1), (1, 1, 1, 1, 1, 1),
+    (2, 2, 1, 3, 1, 1), (1, 2, 3, 1, 2, 1), (3, 3, 3, 3, 2, 1),
+    (1, 2, 2, 2, 1, 2), (2, 4, 2, 4, 1, 2), (2, 3, 4, 2, 2, 2),
+    (4, 5, 4, 4, 2, 2), (2, 1, 1, 2, 3, 1), (3, 2, 2, 4, 3, 1),
+    (2, 3, 3, 2, 4, 1), (4, 4, 4, 4, 4, 1), (3, 2, 2, 3, 3, 2),
+    (4, 4, 3, 5, 3, 2), (4, 4, 4, 3, 4, 2), (6, 6, 5, 5, 4, 2),
+    (1, 1, 2, 0, 1, 1), (2, 2, 2, 1, 2, 1), (1, 2, 3, 1, 2, 1),
+    (3, 3, 3, 2, 3, 1), (1, 1, 4, 1, 1, 2), (2, 3, 4, 2, 2, 2),
+    (2, 2, 5, 2, 2, 2), (4, 4, 5, 3, 3, 2), (1, 2, 2, 1, 3, 1),
+    (2, 3, 3, 2, 4, 1), (1, 4, 3, 2, 4, 1), (3, 5, 4, 3, 5, 1),
+    (2, 2, 4, 2, 3, 2), (3, 4, 5, 3, 4, 2), (3, 4, 5, 3, 4, 2),
+    (5, 6, 6, 4, 5, 2), (2, 1, 2, 1, 2, 2), (3, 2, 2, 3, 3, 2),
+    (2, 2, 4, 2, 3, 2), (4, 3, 4, 4, 4, 2), (2, 2, 4, 2, 2, 3),
+    (3, 4, 4, 4, 3, 3), (3, 3, 6, 3, 3, 3), (5, 5, 6, 5, 4, 3),
+    (3, 2, 2, 2, 4, 2), (4, 3, 3, 4, 5, 2), (3, 4, 4, 3, 5, 2),
+    (5, 5, 5, 5, 6, 2), (4, 3, 4, 3, 4, 3), (5, 5, 5, 5, 5, 3),
+    (5, 5, 6, 4, 5, 3), (7, 7, 7, 6, 6, 3), (1, 2, 1, 1, 1, 0),
+    (2, 3, 1, 2, 1, 1), (1, 3, 2, 1, 3, 0), (3, 4, 2, 2, 3, 1),
+    (1, 2, 2, 3, 1, 1), (2, 4, 2, 4, 1, 2), (2, 3, 3, 3, 3, 1),
+    (4, 5, 3, 4, 3, 2), (1, 2, 2, 2, 3, 0), (2, 3, 3, 3, 3, 1),
+    (1, 4, 3, 2, 5, 0), (3, 5, 4, 3, 5, 1), (2, 2, 3, 4, 3, 1),
+    (3, 4, 4, 5, 3, 2), (3, 4, 4, 4, 5, 1), (5, 6, 5, 5, 5, 2),
+    (1, 3, 1, 2, 2, 1), (2, 4, 1, 4, 2, 2), (1, 4, 3, 2, 4, 1),
+    (3, 5, 3, 4, 4, 2), (1, 4, 2, 4, 2, 2), (2, 6, 2, 6, 2, 3),
+    (2, 5, 4, 4, 4, 2), (4, 7, 4, 6, 4, 3), (2, 3, 2, 3, 4, 1),
+    (3, 4, 3, 5, 4, 2), (2, 5, 4, 3, 6, 1), (4, 6, 5, 5, 6, 2),
+    (3, 4, 3, 5, 4, 2), (4, 6, 4, 7, 4, 3), (4, 6, 5, 5, 6, 2),
+    (6, 8, 6, 7, 6, 3), (2, 2, 2, 1, 2, 1), (3, 3, 2, 2, 3, 2),
+    (2, 3, 3, 2, 4, 1), (4, 4, 3, 3, 5, 2), (2, 2, 4, 3, 2, 2),
+    (3, 4, 4, 4, 3, 3), (3, 3, 5, 4, 4, 2), (5, 5, 5, 5, 5, 3),
+    (2, 3, 3, 2, 4, 1), (3, 4, 4, 3, 5, 2), (2, 5, 4, 3, 6, 1),
+    (4, 6, 5, 4, 7, 2), (3, 3, 5, 4, 4, 2), (4, 5, 6, 5, 5, 3),
+    (4, 5, 6, 5, 6, 2), (6, 7, 7, 6, 7, 3), (3, 3, 2, 2, 3, 2),
+    (4, 4, 2, 4, 4, 3), (3, 4, 4, 3, 5, 2), (5, 5, 4, 5, 6, 3),
+    (3, 4, 4, 4, 3, 3), (4, 6, 4, 6, 4, 4), (4, 5, 6, 5, 5, 3),
+    (6, 7, 6, 7, 6, 4), (4, 4, 3, 3, 5, 2), (5, 5, 4, 5, 6, 3),
+    (4, 6, 5, 4, 7, 2), (6, 7, 6, 6, 8, 3), (5, 5, 5, 5, 5, 3),
+    (6, 7, 6, 7, 6, 4), (6, 7, 7, 6, 7, 3), (8, 9, 8, 8, 8, 4),
+    (2, 1, 2, 1, 0, 0), (3, 2, 2, 2, 1, 0), (2, 2, 3, 1, 1, 1),
+    (4, 3, 3, 2, 2, 1), (2, 1, 3, 2, 1, 1), (3, 3, 3, 3, 2, 1),
+    (3, 2, 4, 2, 2, 2), (5, 4, 4, 3, 3, 2), (2, 1, 2, 3, 2, 0),
+    (3, 2, 3, 4, 3, 0), (2, 3, 3, 3, 3, 1), (4, 4, 4, 4, 4, 1),
+    (3, 1, 3, 4, 3, 1), (4, 3, 4, 5, 4, 1), (4, 3, 4, 4, 4, 2),
+    (6, 5, 5, 5, 5, 2), (2, 1, 3, 2, 1, 1), (3, 2, 3, 4, 2, 1),
+    (2, 2, 5, 2, 2, 2), (4, 3, 5, 4, 3, 2), (2, 2, 4, 3, 2, 2),
+    (3, 4, 4, 5, 3, 2), (3, 3, 6, 3, 3, 3), (5, 5, 6, 5, 4, 3),
+    (3, 1, 3, 4, 3, 1), (4, 2, 4, 6, 4, 1), (3, 3, 5, 4, 4, 2),
+    (5, 4, 6, 6, 5, 2), (4, 2, 4, 5, 4, 2), (5, 4, 5, 7, 5, 2),
+    (5, 4, 6, 5, 5, 3), (7, 6, 7, 7, 6, 3), (2, 2, 3, 1, 1, 1),
+    (3, 3, 3, 2, 3, 1), (2, 3, 4, 2, 2, 2), (4, 4, 4, 3, 4, 2),
+    (2, 2, 5, 2, 2, 2), (3, 4, 5, 3, 4, 2), (3, 3, 6, 3, 3, 3),
+    (5, 5, 6, 4, 5, 3), (2, 3, 3, 3, 3, 1), (3, 4, 4, 4, 5, 1),
+    (2, 5, 4, 4, 4, 2), (4, 6, 5, 5, 6, 2), (3, 3, 5, 4, 4, 2),
+    (4, 5, 6, 5, 6, 2), (4, 5, 6, 5, 5, 3), (6, 7, 7, 6, 7, 3),
+    (3, 2, 4, 2, 2, 2), (4, 3, 4, 4, 4, 2), (3, 3, 6, 3, 3, 3),
+    (5, 4, 6, 5, 5, 3), (3, 3, 6, 3, 3, 3), (4, 5, 6, 5, 5, 3),
+    (4, 4, 8, 4, 4, 4), (6, 6, 8, 6, 6, 4), (4, 3, 4, 4, 4, 2),
+    (5, 4, 5, 6, 6, 2), (4, 5, 6, 5, 5, 3), (6, 6, 7, 7, 7, 3),
+    (5, 4, 6, 5, 5, 3), (6, 6, 7, 7, 7, 3), (6, 6, 8, 6, 6, 4),
+    (8, 8, 9, 8, 8, 4), (3, 2, 2, 2, 1, 0), (4, 3, 2, 3, 2, 1),
+    (3, 3, 3, 2, 3, 1), (5, 4, 3, 3, 4, 2), (3, 2, 3, 4, 2, 1),
+    (4, 4, 3, 5, 3, 2), (4, 3, 4, 4, 4, 2), (6, 5, 4, 5, 5, 3),
+    (3, 2, 3, 4, 3, 0), (4, 3, 4, 5, 4, 1), (3, 4, 4, 4, 5, 1),
+    (5, 5, 5, 5, 6, 2), (4, 2, 4, 6, 4, 1), (5, 4, 5, 7, 5, 2),
+    (5, 4, 5, 6, 6, 2), (7, 6, 6, 7, 7, 3), (3, 3, 3, 3, 2, 1),
+    (4, 4, 3, 5, 3, 2), (3, 4, 5, 3, 4, 2), (5, 5, 5, 5, 5, 3),
+    (3, 4, 4, 5, 3, 2), (4, 6, 4, 7, 4, 3), (4, 5, 6, 5, 5, 3),
+    (6, 7, 6, 7, 6, 4), (4, 3, 4, 5, 4, 1), (5, 4, 5, 7, 5, 2),
+    (4, 5, 6, 5, 6, 2), (6, 6, 7, 7, 7, 3), (5, 4, 5, 7, 5, 2),
+    (6, 6, 6, 9, 6, 3), (6, 6, 7, 7, 7, 3), (8, 8, 8, 9, 8, 4),
+    (4, 3, 3, 2, 2, 1), (5, 4, 3, 3, 4, 2), (4, 4, 4, 3, 4, 2),
+    (6, 5, 4, 4, 6, 3), (4, 3, 5, 4, 3, 2), (5, 5, 5, 5, 5, 3),
+    (5, 4, 6, 5, 5, 3), (7, 6, 6, 6, 7, 4), (4, 4, 4, 4, 4, 1),
+    (5, 5, 5, 5, 6, 2), (4, 6, 5, 5, 6, 2), (6, 7, 6, 6, 8, 3),
+    (5, 4, 6, 6, 5, 2), (6, 6, 7, 7, 7, 3), (6, 6, 7, 7, 7, 3),
+    (8, 8, 8, 8, 9, 4), (5, 4, 4, 3, 3, 2), (6, 5, 4, 5, 5, 3),
+    (5, 5, 6, 4, 5, 3), (7, 6, 6, 6, 7, 4), (5, 5, 6, 5, 4, 3),
+    (6, 7, 6, 7, 6, 4), (6, 6, 8, 6, 6, 4), (8, 8, 8, 8, 8, 5),
+    (6, 5, 5, 5, 5, 2), (7, 6, 6, 7, 7, 3), (6, 7, 7, 6, 7, 3),
+    (8, 8, 8, 8, 9, 4), (7, 6, 7, 7, 6, 3), (8, 8, 8, 9, 8, 4),
+    (8, 8, 9, 8, 8, 4), (10, 10, 10, 10, 10, 5), (2, 1, 0, 0, 0, 0),
+    (3, 2, 1, 0, 0, 0), (2, 2, 1, 1, 0, 0), (4, 3, 2, 1, 0, 0),
+    (2, 1, 1, 1, 1, 0), (3, 3, 2, 1, 1, 0), (3, 2, 2, 2, 1, 0),
+    (5, 4, 3, 2, 1, 0), (2, 1, 0, 1, 1, 1), (3, 2, 2, 1, 1, 1),
+    (2, 3, 1, 2, 1, 1), (4, 4, 3, 2, 1, 1), (3, 1, 1, 2, 2, 1),
+    (4, 3, 3, 2, 2, 1), (4, 3, 2, 3, 2, 1), (6, 5, 4, 3, 2, 1),
+    (2, 1, 0, 0, 2, 1), (3, 2, 1, 1, 2, 1), (2, 2, 2, 1, 2, 1),
+    (4, 3, 3, 2, 2, 1), (2, 2, 1, 1, 3, 1), (3, 4, 2, 2, 3, 1),
+    (3, 3, 3, 2, 3, 1), (5, 5, 4, 3, 3, 1), (3, 1, 0, 1, 3, 2),
+    (4, 2, 2, 2, 3, 2), (3, 3, 2, 2, 3, 2), (5, 4, 4, 3, 3, 2),
+    (4, 2, 1, 2, 4, 2), (5, 4, 3, 3, 4, 2), (5, 4, 3, 3, 4, 2),
+    (7, 6, 5, 4, 4, 2), (2, 1, 0, 1, 1, 1), (3, 2, 1, 1, 2, 1),
+    (2, 2, 1, 3, 1, 1), (4, 3, 2, 3, 2, 1), (2, 1, 2, 2, 2, 1),
+    (3, 3, 3, 2, 3, 1), (3, 2, 3, 4, 2, 1), (5, 4, 4, 4, 3, 1),
+    (2, 2, 0, 2, 2, 2), (3, 3, 2, 2, 3, 2), (2, 4, 1, 4, 2, 2),
+    (4, 5, 3, 4, 3, 2), (3, 2, 2, 3, 3, 2), (4, 4, 4, 3, 4, 2),
+    (4, 4, 3, 5, 3, 2), (6, 6, 5, 5, 4, 2), (3, 1, 0, 1, 3, 2),
+    (4, 2, 1, 2, 4, 2), (3, 2, 2, 3, 3, 2), (5, 3, 3, 4, 4, 2),
+    (3, 2, 2, 2, 4, 2), (4, 4, 3, 3, 5, 2), (4, 3, 4, 4, 4, 2),
+    (6, 5, 5, 5, 5, 2), (4, 2, 0, 2, 4, 3), (5, 3, 2, 3, 5, 3),
+    (4, 4, 2, 4, 4, 3), (6, 5, 4, 5, 5, 3), (5, 3, 2, 3, 5, 3),
+    (6, 5, 4, 4, 6, 3), (6, 5, 4, 5, 5, 3), (8, 7, 6, 6, 6, 3),
+    (2, 1, 1, 1, 1, 0), (3, 2, 2, 1, 1, 1), (2, 2, 2, 2, 2, 0),
+    (4, 3, 3, 2, 2, 1), (2, 1, 2, 3, 2, 0), (3, 3, 3, 3, 2, 1),
+    (3, 2, 3, 4, 3, 0), (5, 4, 4, 4, 3, 1), (2, 1, 2, 2, 2, 1),
+    (3, 2, 4, 2, 2, 2), (2, 3, 3, 3, 3, 1), (4, 4, 5, 3, 3, 2),
+    (3, 1, 3, 4, 3, 1), (4, 3, 5, 4, 3, 2), (4, 3, 4, 5, 4, 1),
+    (6, 5, 6, 5, 4, 2), (2, 2, 1, 1, 3, 1), (3, 3, 2, 2, 3, 2),
+    (2, 3, 3, 2, 4, 1), (4, 4, 4, 3, 4, 2), (2, 3, 2, 3, 4, 1),
+    (3, 5, 3, 4, 4, 2), (3, 4, 4, 4, 5, 1), (5, 6, 5, 5, 5, 2),
+    (3, 2, 2, 2, 4, 2), (4, 3, 4, 3, 4, 3), (3, 4, 4, 3, 5, 2),
+    (5, 5, 6, 4, 5, 3), (4, 3, 3, 4, 5, 2), (5, 5, 5, 5, 5, 3),
+    (5, 5, 5, 5, 6, 2), (7, 7, 7, 6, 6, 3), (3, 1, 1, 2, 2, 1),
+    (4, 2, 2, 2, 3, 2), (3, 2, 2, 4, 3, 1), (5, 3, 3, 4, 4, 2),
+    (3, 1, 3, 4, 3, 1), (4, 3, 4, 4, 4, 2), (4, 2, 4, 6, 4, 1),
+    (6, 4, 5, 6, 5, 2), (3, 2, 2, 3, 3, 2), (4, 3, 4, 3, 4, 3),
+    (3, 4, 3, 5, 4, 2), (5, 5, 5, 5, 5, 3), (4, 2, 4, 5, 4, 2),
+    (5, 4, 6, 5, 5, 3), (5, 4, 5, 7, 5, 2), (7, 6, 7, 7, 6, 3),
+    (4, 2, 1, 2, 4, 2), (5, 3, 2, 3, 5, 3), (4, 3, 3, 4, 5, 2),
+    (6, 4, 4, 5, 6, 3), (4, 3, 3, 4, 5, 2), (5, 5, 4, 5, 6, 3),
+    (5, 4, 5, 6, 6, 2), (7, 6, 6, 7, 7, 3), (5, 3, 2, 3, 5, 3),
+    (6, 4, 4, 4, 6, 4), (5, 5, 4, 5, 6, 3), (7, 6, 6, 6, 7, 4),
+    (6, 4, 4, 5, 6, 3), (7, 6, 6, 6, 7, 4), (7, 6, 6, 7, 7, 3),
+    (9, 8, 8, 8, 8, 4), (2, 2, 1, 1, 0, 0), (3, 3, 2, 1, 1, 0),
+    (2, 3, 2, 2, 0, 1), (4, 4, 3, 2, 1, 1), (2, 2, 2, 2, 2, 0),
+    (3, 4, 3, 2, 3, 0), (3, 3, 3, 3, 2, 1), (5, 5, 4, 3, 3, 1),
+    (2, 2, 1, 3, 1, 1), (3, 3, 3, 3, 2, 1), (2, 4, 2, 4, 1, 2),
+    (4, 5, 4, 4, 2, 2), (3, 2, 2, 4, 3, 1), (4, 4, 4, 4, 4, 1),
+    (4, 4, 3, 5, 3, 2), (6, 6, 5, 5, 4, 2), (2, 2, 2, 1, 2, 1),
+    (3, 3, 3, 2, 3, 1), (2, 3, 4, 2, 2, 2), (4, 4, 5, 3, 3, 2),
+    (2, 3, 3, 2, 4, 1), (3, 5, 4, 3, 5, 1), (3, 4, 5, 3, 4, 2),
+    (5, 6, 6, 4, 5, 2), (3, 2, 2, 3, 3, 2), (4, 3, 4, 4, 4, 2),
+    (3, 4, 4, 4, 3, 3), (5, 5, 6, 5, 4, 3), (4, 3, 3, 4, 5, 2),
+    (5, 5, 5, 5, 6, 2), (5, 5, 5, 5, 5, 3), (7, 7, 7, 6, 6, 3),
+    (2, 3, 1, 2, 1, 1), (3, 4, 2, 2, 3, 1), (2, 4, 2, 4, 1, 2),
+    (4, 5, 3, 4, 3, 2), (2, 3, 3, 3, 3, 1), (3, 5, 4, 3, 5, 1),
+    (3, 4, 4, 5, 3, 2), (5, 6, 5, 5, 5, 2), (2, 4, 1, 4, 2, 2),
+    (3, 5, 3, 4, 4, 2), (2, 6, 2, 6, 2, 3), (4, 7, 4, 6, 4, 3),
+    (3, 4, 3, 5, 4, 2), (4, 6, 5, 5, 6, 2), (4, 6, 4, 7, 4, 3),
+    (6, 8, 6, 7, 6, 3), (3, 3, 2, 2, 3, 2), (4, 4, 3, 3, 5, 2),
+    (3, 4, 4, 4, 3, 3), (5, 5, 5, 5, 5, 3), (3, 4, 4, 3, 5, 2),
+    (4, 6, 5, 4, 7, 2), (4, 5, 6, 5, 5, 3), (6, 7, 7, 6, 7, 3),
+    (4, 4, 2, 4, 4, 3), (5, 5, 4, 5, 6, 3), (4, 6, 4, 6, 4, 4),
+    (6, 7, 6, 7, 6, 4), (5, 5, 4, 5, 6, 3), (6, 7, 6, 6, 8, 3),
+    (6, 7, 6, 7, 6, 4), (8, 9, 8, 8, 8, 4), (3, 2, 2, 2, 1, 0),
+    (4, 3, 3, 2, 2, 1), (3, 3, 3, 3, 2, 1), (5, 4, 4, 3, 3, 2),
+    (3, 2, 3, 4, 3, 0), (4, 4, 4, 4, 4, 1), (4, 3, 4, 5, 4, 1),
+    (6, 5, 5, 5, 5, 2), (3, 2, 3, 4, 2, 1), (4, 3, 5, 4, 3, 2),
+    (3, 4, 4, 5, 3, 2), (5, 5, 6, 5, 4, 3), (4, 2, 4, 6, 4, 1),
+    (5, 4, 6, 6, 5, 2), (5, 4, 5, 7, 5, 2), (7, 6, 7, 7, 6, 3),
+    (3, 3, 3, 2, 3, 1), (4, 4, 4, 3, 4, 2), (3, 4, 5, 3, 4, 2),
+    (5, 5, 6, 4, 5, 3), (3, 4, 4, 4, 5, 1), (4, 6, 5, 5, 6, 2),
+    (4, 5, 6, 5, 6, 2), (6, 7, 7, 6, 7, 3), (4, 3, 4, 4, 4, 2),
+    (5, 4, 6, 5, 5, 3), (4, 5, 6, 5, 5, 3), (6, 6, 8, 6, 6, 4),
+    (5, 4, 5, 6, 6, 2), (6, 6, 7, 7, 7, 3), (6, 6, 7, 7, 7, 3),
+    (8, 8, 9, 8, 8, 4), (4, 3, 2, 3, 2, 1), (5, 4, 3, 3, 4, 2),
+    (4, 4, 3, 5, 3, 2), (6, 5, 4, 5, 5, 3), (4, 3, 4, 5, 4, 1),
+    (5, 5, 5, 5, 6, 2), (5, 4, 5, 7, 5, 2), (7, 6, 6, 7, 7, 3),
+    (4, 4, 3, 5, 3, 2), (5, 5, 5, 5, 5, 3), (4, 6, 4, 7, 4, 3),
+    (6, 7, 6, 7, 6, 4), (5, 4, 5, 7, 5, 2), (6, 6, 7, 7, 7, 3),
+    (6, 6, 6, 9, 6, 3), (8, 8, 8, 9, 8, 4), (5, 4, 3, 3, 4, 2),
+    (6, 5, 4, 4, 6, 3), (5, 5, 5, 5, 5, 3), (7, 6, 6, 6, 7, 4),
+    (5, 5, 5, 5, 6, 2), (6, 7, 6, 6, 8, 3), (6, 6, 7, 7, 7, 3),
+    (8, 8, 8, 8, 9, 4), (6, 5, 4, 5, 5, 3), (7, 6, 6, 6, 7, 4),
+    (6, 7, 6, 7, 6, 4), (8, 8, 8, 8, 8, 5), (7, 6, 6, 7, 7, 3),
+    (8, 8, 8, 8, 9, 4), (8, 8, 8, 9, 8, 4), (10, 10, 10, 10, 10, 5),
+    (3, 2, 1, 0, 0, 0), (4, 3, 2, 1, 0, 0), (3, 3, 2, 1, 1, 0),
+    (5, 4, 3, 2, 1, 0), (3, 2, 2, 1, 1, 1), (4, 4, 3, 2, 1, 1),
+    (4, 3, 3, 2, 2, 1), (6, 5, 4, 3, 2, 1), (3, 2, 1, 1, 2, 1),
+    (4, 3, 3, 2, 2, 1), (3, 4, 2, 2, 3, 1), (5, 5, 4, 3, 3, 1),
+    (4, 2, 2, 2, 3, 2), (5, 4, 4, 3, 3, 2), (5, 4, 3, 3, 4, 2),
+    (7, 6, 5, 4, 4, 2), (3, 2, 1, 1, 2, 1), (4, 3, 2, 3, 2, 1),
+    (3, 3, 3, 2, 3, 1), (5, 4, 4, 4, 3, 1), (3, 3, 2, 2, 3, 2),
+    (4, 5, 3, 4, 3, 2), (4, 4, 4, 3, 4, 2), (6, 6, 5, 5, 4, 2),
+    (4, 2, 1, 2, 4, 2), (5, 3, 3, 4, 4, 2), (4, 4, 3, 3, 5, 2),
+    (6, 5, 5, 5, 5, 2), (5, 3, 2, 3, 5, 3), (6, 5, 4, 5, 5, 3),
+    (6, 5, 4, 4, 6, 3), (8, 7, 6, 6, 6, 3), (3, 2, 2, 1, 1, 1),
+    (4, 3, 3, 2, 2, 1), (3, 3, 3, 3, 2, 1), (5, 4, 4, 4, 3, 1),
+    (3, 2, 4, 2, 2, 2), (4, 4, 5, 3, 3, 2), (4, 3, 5, 4, 3, 2),
+    (6, 5, 6, 5, 4, 2), (3, 3, 2, 2, 3, 2), (4, 4, 4, 3, 4, 2),
+    (3, 5, 3, 4, 4, 2), (5, 6, 5, 5, 5, 2), (4, 3, 4, 3, 4, 3),
+    (5, 5, 6, 4, 5, 3), (5, 5, 5, 5, 5, 3), (7, 7, 7, 6, 6, 3),
+    (4, 2, 2, 2, 3, 2), (5, 3, 3, 4, 4, 2), (4, 3, 4, 4, 4, 2),
+    (6, 4, 5, 6, 5, 2), (4, 3, 4, 3, 4, 3), (5, 5, 5, 5, 5, 3),
+    (5, 4, 6, 5, 5, 3), (7, 6, 7, 7, 6, 3), (5, 3, 2, 3, 5, 3),
+    (6, 4, 4, 5, 6, 3), (5, 5, 4, 5, 6, 3), (7, 6, 6, 7, 7, 3),
+    (6, 4, 4, 4, 6, 4), (7, 6, 6, 6, 7, 4), (7, 6, 6, 6, 7, 4),
+    (9, 8, 8, 8, 8, 4), (3, 3, 2, 1, 1, 0), (4, 4, 3, 2, 1, 1),
+    (3, 4, 3, 2, 3, 0), (5, 5, 4, 3, 3, 1), (3, 3, 3, 3, 2, 1),
+    (4, 5, 4, 4, 2, 2), (4, 4, 4, 4, 4, 1), (6, 6, 5, 5, 4, 2),
+    (3, 3, 3, 2, 3, 1), (4, 4, 5, 3, 3, 2), (3, 5, 4, 3, 5, 1),
+    (5, 6, 6, 4, 5, 2), (4, 3, 4, 4, 4, 2), (5, 5, 6, 5, 4, 3),
+    (5, 5, 5, 5, 6, 2), (7, 7, 7, 6, 6, 3), (3, 4, 2, 2, 3, 1),
+    (4, 5, 3, 4, 3, 2), (3, 5, 4, 3, 5, 1), (5, 6, 5, 5, 5, 2),
+    (3, 5, 3, 4, 4, 2), (4, 7, 4, 6, 4, 3), (4, 6, 5, 5, 6, 2),
+    (6, 8, 6, 7, 6, 3), (4, 4, 3, 3, 5, 2), (5, 5, 5, 5, 5, 3),
+    (4, 6, 5, 4, 7, 2), (6, 7, 7, 6, 7, 3), (5, 5, 4, 5, 6, 3),
+    (6, 7, 6, 7, 6, 4), (6, 7, 6, 6, 8, 3), (8, 9, 8, 8, 8, 4),
+    (4, 3, 3, 2, 2, 1), (5, 4, 4, 3, 3, 2), (4, 4, 4, 4, 4, 1),
+    (6, 5, 5, 5, 5, 2), (4, 3, 5, 4, 3, 2), (5, 5, 6, 5, 4, 3),
+    (5, 4, 6, 6, 5, 2), (7, 6, 7, 7, 6, 3), (4, 4, 4, 3, 4, 2),
+    (5, 5, 6, 4, 5, 3), (4, 6, 5, 5, 6, 2), (6, 7, 7, 6, 7, 3),
+    (5, 4, 6, 5, 5, 3), (6, 6, 8, 6, 6, 4), (6, 6, 7, 7, 7, 3),
+    (8, 8, 9, 8, 8, 4), (5, 4, 3, 3, 4, 2), (6, 5, 4, 5, 5, 3),
+    (5, 5, 5, 5, 6, 2), (7, 6, 6, 7, 7, 3), (5, 5, 5, 5, 5, 3),
+    (6, 7, 6, 7, 6, 4), (6, 6, 7, 7, 7, 3), (8, 8, 8, 9, 8, 4),
+    (6, 5, 4, 4, 6, 3), (7, 6, 6, 6, 7, 4), (6, 7, 6, 6, 8, 3),
+    (8, 8, 8, 8, 9, 4), (7, 6, 6, 6, 7, 4), (8, 8, 8, 8, 8, 5),
+    (8, 8, 8, 8, 9, 4), (10, 10, 10, 10, 10, 5), (4, 3, 2, 1, 0, 0),
+    (5, 4, 3, 2, 1, 0), (4, 4, 3, 2, 1, 1), (6, 5, 4, 3, 2, 1),
+    (4, 3, 3, 2, 2, 1), (5, 5, 4, 3, 3, 1), (5, 4, 4, 3, 3, 2),
+    (7, 6, 5, 4, 4, 2), (4, 3, 2, 3, 2, 1), (5, 4, 4, 4, 3, 1),
+    (4, 5, 3, 4, 3, 2), (6, 6, 5, 5, 4, 2), (5, 3, 3, 4, 4, 2),
+    (6, 5, 5, 5, 5, 2), (6, 5, 4, 5, 5, 3), (8, 7, 6, 6, 6, 3),
+    (4, 3, 3, 2, 2, 1), (5, 4, 4, 4, 3, 1), (4, 4, 5, 3, 3, 2),
+    (6, 5, 6, 5, 4, 2), (4, 4, 4, 3, 4, 2), (5, 6, 5, 5, 5, 2),
+    (5, 5, 6, 4, 5, 3), (7, 7, 7, 6, 6, 3), (5, 3, 3, 4, 4, 2),
+    (6, 4, 5, 6, 5, 2), (5, 5, 5, 5, 5, 3), (7, 6, 7, 7, 6, 3),
+    (6, 4, 4, 5, 6, 3), (7, 6, 6, 7, 7, 3), (7, 6, 6, 6, 7, 4),
+    (9, 8, 8, 8, 8, 4), (4, 4, 3, 2, 1, 1), (5, 5, 4, 3, 3, 1),
+    (4, 5, 4, 4, 2, 2), (6, 6, 5, 5, 4, 2), (4, 4, 5, 3, 3, 2),
+    (5, 6, 6, 4, 5, 2), (5, 5, 6, 5, 4, 3), (7, 7, 7, 6, 6, 3),
+    (4, 5, 3, 4, 3, 2), (5, 6, 5, 5, 5, 2), (4, 7, 4, 6, 4, 3),
+    (6, 8, 6, 7, 6, 3), (5, 5, 5, 5, 5, 3), (6, 7, 7, 6, 7, 3),
+    (6, 7, 6, 7, 6, 4), (8, 9, 8, 8, 8, 4), (5, 4, 4, 3, 3, 2),
+    (6, 5, 5, 5, 5, 2), (5, 5, 6, 5, 4, 3), (7, 6, 7, 7, 6, 3),
+    (5, 5, 6, 4, 5, 3), (6, 7, 7, 6, 7, 3), (6, 6, 8, 6, 6, 4),
+    (8, 8, 9, 8, 8, 4), (6, 5, 4, 5, 5, 3), (7, 6, 6, 7, 7, 3),
+    (6, 7, 6, 7, 6, 4), (8, 8, 8, 9, 8, 4), (7, 6, 6, 6, 7, 4),
+    (8, 8, 8, 8, 9, 4), (8, 8, 8, 8, 8, 5), (10, 10, 10, 10, 10, 5),
+    (5, 4, 3, 2, 1, 0), (6, 5, 4, 3, 2, 1), (5, 5, 4, 3, 3, 1),
+    (7, 6, 5, 4, 4, 2), (5, 4, 4, 4, 3, 1), (6, 6, 5, 5, 4, 2),
+    (6, 5, 5, 5, 5, 2), (8, 7, 6, 6, 6, 3), (5, 4, 4, 4, 3, 1),
+    (6, 5, 6, 5, 4, 2), (5, 6, 5, 5, 5, 2), (7, 7, 7, 6, 6, 3),
+    (6, 4, 5, 6, 5, 2), (7, 6, 7, 7, 6, 3), (7, 6, 6, 7, 7, 3),
+    (9, 8, 8, 8, 8, 4), (5, 5, 4, 3, 3, 1), (6, 6, 5, 5, 4, 2),
+    (5, 6, 6, 4, 5, 2), (7, 7, 7, 6, 6, 3), (5, 6, 5, 5, 5, 2),
+    (6, 8, 6, 7, 6, 3), (6, 7, 7, 6, 7, 3), (8, 9, 8, 8, 8, 4),
+    (6, 5, 5, 5, 5, 2), (7, 6, 7, 7, 6, 3), (6, 7, 7, 6, 7, 3),
+    (8, 8, 9, 8, 8, 4), (7, 6, 6, 7, 7, 3), (8, 8, 8, 9, 8, 4),
+    (8, 8, 8, 8, 9, 4), (10, 10, 10, 10, 10, 5), (6, 5, 4, 3, 2, 1),
+    (7, 6, 5, 4, 4, 2), (6, 6, 5, 5, 4, 2), (8, 7, 6, 6, 6, 3),
+    (6, 5, 6, 5, 4, 2), (7, 7, 7, 6, 6, 3), (7, 6, 7, 7, 6, 3),
+    (9, 8, 8, 8, 8, 4), (6, 6, 5, 5, 4, 2), (7, 7, 7, 6, 6, 3),
+    (6, 8, 6, 7, 6, 3), (8, 9, 8, 8, 8, 4), (7, 6, 7, 7, 6, 3),
+    (8, 8, 9, 8, 8, 4), (8, 8, 8, 9, 8, 4), (10, 10, 10, 10, 10, 5),
+    (7, 6, 5, 4, 4, 2), (8, 7, 6, 6, 6, 3), (7, 7, 7, 6, 6, 3),
+    (9, 8, 8, 8, 8, 4), (7, 7, 7, 6, 6, 3), (8, 9, 8, 8, 8, 4),
+    (8, 8, 9, 8, 8, 4), (10, 10, 10, 10, 10, 5), (8, 7, 6, 6, 6, 3),
+    (9, 8, 8, 8, 8, 4), (8, 9, 8, 8, 8, 4), (10, 10, 10, 10, 10, 5),
+    (9, 8, 8, 8, 8, 4), (10, 10, 10, 10, 10, 5), (10, 10, 10, 10, 10, 5),
+    (12, 12, 12, 12, 12, 6),
+)
+
+# First pcs of the normal forms
+NORMAL_TABLE = (
+    0, 0, 1, 0, 2, 0, 1, 0, 3, 0, 1, 0,
+    2, 0, 1, 0, 4, 0, 1, 0, 2, 0, 1, 0,
+    3, 0, 1, 0, 2, 0, 1, 0, 5, 0, 1, 0,
+    2, 0, 1, 0, 3, 0, 1, 0, 2, 0, 1, 0,
+    4, 0, 1, 0, 2, 0, 1, 0, 3, 0, 1, 0,
+    2, 0, 1, 0, 6, 0, 1, 0, 2, 0, 1, 0,
+    3, 0, 1, 0, 2, 0, 1, 0, 4, 0, 1, 0,
+    2, 0, 1, 0, 3, 0, 1, 0, 2, 0, 1, 0,
+    5, 0, 1, 0, 2, 0, 1, 0, 3, 0, 1, 0,
+    2, 0, 1, 0, 4, 0, 1, 0, 2, 0, 1, 0,
+    3, 0, 1, 0, 2, 0, 1, 0, 7, 7, 1, 7,
+    2, 0, 1, 0, 3, 0, 1, 0, 2, 0, 1, 0,
+    4, 0, 1, 0, 2, 0, 1, 0, 3, 0, 1, 0,
+    2, 0, 1, 0, 5, 5, 1, 0, 2, 0, 1, 0,
+    3, 0, 1, 0, 2, 0, 1, 0, 4, 0, 1, 0,
+    2, 0, 1, 0, 3, 0, 1, 0, 2, 0, 1, 0,
+    6, 6, 1, 0, 2, 0, 1, 0, 3, 0, 1, 0,
+    2, 0, 1, 0, 4, 0, 1, 0, 2, 0, 1, 0,
+    3, 0, 1, 0, 2, 0, 1, 0, 5, 5, 1, 0,
+    2, 0, 1, 0, 3, 0, 1, 0, 2, 0, 1, 0,
+    4, 0, 1, 0, 2, 0, 1, 0, 3, 0, 1, 0,
+    2, 0, 1, 0, 8, 8, 8, 8, 2, 8, 8, 8,
+    3, 8, 1, 8, 2, 8, 1, 8, 4, 0, 1, 0,
+    2, 0, 1, 0, 3, 0, 1, 0, 2, 0, 1, 0,
+    5, 5, 1, 0, 2, 0, 1, 0, 3, 0, 1, 0,
+    2, 0, 1, 0, 4, 4, 1, 0, 2, 0, 1, 0,
+    3, 0, 1, 0, 2, 0, 1, 0, 6, 6, 6, 6,
+    2, 0, 1, 0, 3, 0, 1, 0, 2, 0, 1, 0,
+    4, 4, 1, 0, 2, 0, 1, 0, 3, 0, 1, 0,
+    2, 0, 1, 0, 5, 5, 1, 0, 2, 0, 1, 0,
+    3, 0, 1, 0, 2, 0, 1, 0, 4, 4, 1, 0,
+    2, 0, 1, 0, 3, 0, 1, 0, 2, 0, 1, 0,
+    7, 7, 7, 7, 2, 7, 1, 7, 3, 7, 1, 7,
+    2, 0, 1, 0, 4, 4, 1, 0, 2, 0, 1, 0,
+    3, 0, 1, 0, 2, 0, 1, 0, 5, 5, 1, 5,
+    2, 0, 1, 0, 3, 0, 1, 0, 2, 0, 1, 0,
+    4, 4, 1, 0, 2, 0, 1, 0, 3, 0, 1, 0,
+    2, 0, 1, 0, 6, 6, 6, 6, 2, 6, 1, 0,
+    3, 0, 1, 0, 2, 0, 1, 0, 4, 4, 1, 0,
+    2, 0, 1, 0, 3, 0, 1, 0, 2, 0, 1, 0,
+    5, 5, 1, 5, 2, 0, 1, 0, 3, 0, 1, 0,
+    2, 0, 1, 0, 4, 4, 1, 0, 2, 0, 1, 0,
+    3, 0, 1, 0, 2, 0, 1, 0, 9, 9, 9, 9,
+    9, 9, 9, 9, 3, 9, 9, 9, 9, 9, 9, 9,
+    4, 9, 9, 9, 2, 9, 9, 9, 3, 9, 9, 9,
+    2, 9, 9, 9, 5, 5, 1, 9, 2, 9, 1, 9,
+    3, 9, 1, 9, 2, 9, 1, 9, 4, 4, 1, 9,
+    2, 9, 1, 9, 3, 9, 1, 9, 2, 9, 1, 9,
+    6, 6, 6, 6, 2, 6, 1, 6, 3, 0, 1, 0,
+    2, 0, 1, 0, 4, 4, 1, 0, 2, 0, 1, 0,
+    3, 3, 1, 0, 2, 0, 1, 0, 5, 5, 5, 5,
+    2, 0, 1, 0, 3, 3, 1, 0, 2, 0, 1, 0,
+    4, 4, 1, 0, 2, 0, 1, 0, 3, 3, 1, 0,
+    2, 0, 1, 0, 7, 7, 7, 7, 7, 7, 7, 7,
+    3, 7, 1, 7, 2, 7, 1, 7, 4, 4, 1, 7,
+    2, 0, 1, 0, 3, 3, 1, 0, 2, 0, 1, 0,
+    5, 5, 5, 5, 2, 5, 1, 0, 3, 3, 1, 0,
+    2, 0, 1, 0, 4, 4, 1, 0, 2, 0, 1, 0,
+    3, 3, 1, 0, 2, 0, 1, 0, 6, 6, 6, 6,
+    2, 6, 1, 6, 3, 6, 1, 0, 2, 0, 1, 0,
+    4, 4, 1, 0, 2, 0, 1, 0, 3, 3, 1, 0,
+    2, 0, 1, 0, 5, 5, 5, 5, 2, 5, 1, 0,
+    3, 3, 1, 0, 2, 0, 1, 0, 4, 4, 1, 0,
+    2, 0, 1, 0, 3, 3, 1, 0, 2, 0, 1, 0,
+    8, 8, 8, 8, 8, 8, 8, 8, 3, 8, 8, 8,
+    2, 8, 8, 8, 4, 8, 8, 8, 2, 8, 8, 8,
+    3, 8, 1, 8, 2, 8, 1, 8, 5, 5, 5, 5,
+    2, 8, 1, 8, 3, 3, 1, 8, 2, 8, 1, 8,
+    4, 4, 1, 0, 2, 0, 1, 0, 3, 3, 1, 0,
+    2, 0, 1, 0, 6, 6, 6, 6, 2, 6, 6, 6,
+    3, 6, 1, 6, 2, 0, 1, 0, 4, 4, 1, 4,
+    2, 0, 1, 0, 3, 3, 1, 0, 2, 0, 1, 0,
+    5, 5, 5, 5, 2, 5, 1, 0, 3, 3, 1, 0,
+    2, 0, 1, 0, 4, 4, 1, 4, 2, 0, 1, 0,
+    3, 3, 1, 0, 2, 0, 1, 0, 7, 7, 7, 7,
+    7, 7, 7, 7, 3, 7, 7, 7, 2, 7, 1, 7,
+    4, 4, 1, 7, 2, 7, 1, 7, 3, 3, 1, 7,
+    2, 0, 1, 0, 5, 5, 5, 5, 2, 5, 1, 5,
+    3, 3, 1, 0, 2, 0, 1, 0, 4, 4, 1, 4,
+    2, 0, 1, 0, 3, 3, 1, 0, 2, 0, 1, 0,
+    6, 6, 6, 6, 2, 6, 6, 6, 3, 6, 1, 6,
+    2, 6, 1, 0, 4, 4, 1, 4, 2, 0, 1, 0,
+    3, 3, 1, 0, 2, 0, 1, 0, 5, 5, 5, 5,
+    2, 5, 1, 5, 3, 3, 1, 0, 2, 0, 1, 0,
+    4, 4, 1, 4, 2, 0, 1, 0, 3, 3, 1, 0,
+    2, 0, 1, 0, 10, 10, 10, 10, 10, 10, 10, 10,
+    10, 10, 10, 10, 10, 10, 10, 10, 4, 10, 10, 10,
+    10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10,
+    5, 10, 10, 10, 10, 10, 10, 10, 3, 10, 10, 10,
+    10, 10, 10, 10, 4, 10, 10, 10, 10, 10, 10, 10,
+    3, 10, 10, 10, 10, 10, 10, 10, 6, 6, 6, 6,
+    2, 10, 10, 10, 3, 10, 10, 10, 2, 10, 10, 10,
+    4, 4, 10, 10, 2, 10, 10, 10, 3, 10, 10, 10,
+    2, 10, 10, 10, 5, 5, 5, 10, 2, 10, 10, 10,
+    3, 10, 10, 10, 2, 10, 10, 10, 4, 4, 10, 10,
+    2, 10, 10, 10, 3, 10, 10, 10, 2, 10, 10, 10,
+    7, 7, 7, 7, 7, 7, 7, 7, 3, 7, 7, 7,
+    2, 7, 7, 7, 4, 4, 1, 10, 2, 10, 1, 10,
+    3, 10, 1, 10, 2, 10, 1, 10, 5, 5, 5, 5,
+    2, 10, 1, 10, 3, 3, 1, 10, 2, 10, 1, 10,
+    4, 4, 4, 10, 2, 10, 1, 10, 3, 3, 1, 10,
+    2, 10, 1, 10, 6, 6, 6, 6, 6, 6, 6, 6,
+    3, 6, 1, 6, 2, 10, 1, 10, 4, 4, 4, 4,
+    2, 10, 1, 10, 3, 3, 1, 10, 2, 10, 1, 10,
+    5, 5, 5, 5, 2, 5, 1, 10, 3, 3, 1, 10,
+    2, 10, 1, 10, 4, 4, 4, 4, 2, 10, 1, 10,
+    3, 3, 1, 10, 2, 10, 1, 10, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    4, 8, 8, 8, 2, 8, 8, 8, 3, 8, 8, 8,
+    2, 8, 8, 8, 5, 5, 5, 5, 2, 8, 8, 8,
+    3, 8, 1, 8, 2, 8, 1, 8, 4, 4, 4, 8,
+    2, 8, 1, 8, 3, 3, 1, 8, 2, 8, 1, 8,
+    6, 6, 6, 6, 6, 6, 6, 6, 3, 6, 6, 6,
+    2, 6, 1, 6, 4, 4, 4, 4, 2, 0, 1, 0,
+    3, 3, 1, 0, 2, 2, 1, 0, 5, 5, 5, 5,
+    2, 5, 1, 5, 3, 3, 1, 0, 2, 2, 1, 0,
+    4, 4, 4, 4, 2, 4, 1, 0, 3, 3, 1, 0,
+    2, 2, 1, 0, 7, 7, 7, 7, 7, 7, 7, 7,
+    3, 7, 7, 7, 2, 7, 7, 7, 4, 4, 7, 7,
+    2, 7, 1, 7, 3, 3, 1, 7, 2, 7, 1, 7,
+    5, 5, 5, 5, 2, 5, 1, 5, 3, 3, 1, 7,
+    2, 2, 1, 0, 4, 4, 4, 4, 2, 4, 1, 0,
+    3, 3, 1, 0, 2, 2, 1, 0, 6, 6, 6, 6,
+    6, 6, 6, 6, 3, 6, 6, 6, 2, 6, 1, 6,
+    4, 4, 4, 4, 2, 6, 1, 0, 3, 3, 1, 0,
+    2, 2, 1, 0, 5, 5, 5, 5, 2, 5, 1, 5,
+    3, 3, 1, 5, 2, 2, 1, 0, 4, 4, 4, 4,
+    2, 4, 1, 0, 3, 3, 1, 0, 2, 2, 1, 0,
+    9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9,
+    9, 9, 9, 9, 4, 9, 9, 9, 9, 9, 9, 9,
+    3, 9, 9, 9, 9, 9, 9, 9, 5, 5, 9, 9,
+    9, 9, 9, 9, 3, 9, 9, 9, 9, 9, 9, 9,
+    4, 4, 9, 9, 2, 9, 9, 9, 3, 9, 9, 9,
+    2, 9, 9, 9, 6, 6, 6, 6, 6, 6, 6, 6,
+    3, 9, 9, 9, 2, 9, 9, 9, 4, 4, 4, 9,
+    2, 9, 9, 9, 3, 3, 9, 9, 2, 9, 9, 9,
+    5, 5, 5, 5, 2, 5, 1, 9, 3, 3, 1, 9,
+    2, 9, 1, 9, 4, 4, 4, 4, 2, 9, 1, 9,
+    3, 3, 1, 9, 2, 9, 1, 9, 7, 7, 7, 7,
+    7, 7, 7, 7, 3, 7, 7, 7, 7, 7, 7, 7,
+    4, 4, 7, 7, 2, 7, 7, 7, 3, 3, 1, 7,
+    2, 7, 1, 7, 5, 5, 5, 5, 2, 5, 5, 5,
+    3, 3, 1, 9, 2, 9, 1, 9, 4, 4, 4, 4,
+    2, 4, 1, 9, 3, 3, 1, 9, 2, 2, 1, 9,
+    6, 6, 6, 6, 6, 6, 6, 6, 3, 6, 6, 6,
+    2, 6, 1, 6, 4, 4, 4, 4, 2, 6, 1, 6,
+    3, 3, 1, 0, 2, 2, 1, 0, 5, 5, 5, 5,
+    2, 5, 5, 5, 3, 3, 1, 5, 2, 2, 1, 0,
+    4, 4, 4, 4, 2, 4, 1, 0, 3, 3, 1, 3,
+    2, 2, 1, 0, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 4, 8, 8, 8,
+    8, 8, 8, 8, 3, 8, 8, 8, 2, 8, 8, 8,
+    5, 5, 5, 5, 2, 8, 8, 8, 3, 8, 8, 8,
+    2, 8, 8, 8, 4, 4, 4, 8, 2, 8, 8, 8,
+    3, 3, 1, 8, 2, 8, 1, 8, 6, 6, 6, 6,
+    6, 6, 6, 6, 3, 6, 6, 6, 2, 6, 6, 6,
+    4, 4, 4, 4, 2, 8, 1, 8, 3, 3, 1, 8,
+    2, 2, 1, 8, 5, 5, 5, 5, 2, 5, 5, 5,
+    3, 3, 1, 5, 2, 2, 1, 8, 4, 4, 4, 4,
+    2, 4, 1, 0, 3, 3, 1, 3, 2, 2, 1, 0,
+    7, 7, 7, 7, 7, 7, 7, 7, 3, 7, 7, 7,
+    7, 7, 7, 7, 4, 4, 7, 7, 2, 7, 7, 7,
+    3, 3, 7, 7, 2, 7, 1, 7, 5, 5, 5, 5,
+    2, 5, 5, 5, 3, 3, 1, 7, 2, 7, 1, 7,
+    4, 4, 4, 4, 2, 4, 1, 7, 3, 3, 1, 3,
+    2, 2, 1, 0, 6, 6, 6, 6, 6, 6, 6, 6,
+    3, 6, 6, 6, 2, 6, 6, 6, 4, 4, 4, 4,
+    2, 6, 1, 6, 3, 3, 1, 6, 2, 2, 1, 0,
+    5, 5, 5, 5, 2, 5, 5, 5, 3, 3, 1, 5,
+    2, 2, 1, 5, 4, 4, 4, 4, 2, 4, 1, 4,
+    3, 3, 1, 3, 2, 2, 1, 0, 11, 11, 11, 11,
+    11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11,
+    11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11,
+    11, 11, 11, 11, 5, 11, 11, 11, 11, 11, 11, 11,
+    11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11,
+    11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11,
+    6, 6, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11,
+    11, 11, 11, 11, 4, 11, 11, 11, 11, 11, 11, 11,
+    11, 11, 11, 11, 11, 11, 11, 11, 5, 5, 11, 11,
+    11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11,
+    4, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11,
+    11, 11, 11, 11, 7, 7, 7, 7, 7, 7, 7, 7,
+    3, 11, 11, 11, 11, 11, 11, 11, 4, 11, 11, 11,
+    11, 11, 11, 11, 3, 11, 11, 11, 11, 11, 11, 11,
+    5, 5, 5, 11, 11, 11, 11, 11, 3, 11, 11, 11,
+    11, 11, 11, 11, 4, 11, 11, 11, 11, 11, 11, 11,
+    3, 11, 11, 11, 11, 11, 11, 11, 6, 6, 6, 6,
+    6, 6, 11, 11, 3, 11, 11, 11, 11, 11, 11, 11,
+    4, 4, 11, 11, 11, 11, 11, 11, 3, 11, 11, 11,
+    11, 11, 11, 11, 5, 5, 5, 5, 11, 11, 11, 11,
+    3, 11, 11, 11, 11, 11, 11, 11, 4, 4, 11, 11,
+    11, 11, 11, 11, 3, 11, 11, 11, 11, 11, 11, 11,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 4, 8, 8, 8, 8, 8, 8, 8,
+    3, 8, 8, 8, 8, 8, 8, 8, 5, 5, 5, 5,
+    2, 11, 11, 11, 3, 11, 11, 11, 2, 11, 11, 11,
+    4, 4, 11, 11, 2, 11, 11, 11, 3, 11, 11, 11,
+    2, 11, 11, 11, 6, 6, 6, 6, 6, 6, 6, 6,
+    3, 6, 11, 11, 2, 11, 11, 11, 4, 4, 4, 11,
+    2, 11, 11, 11, 3, 11, 11, 11, 2, 11, 11, 11,
+    5, 5, 5, 5, 5, 5, 11, 11, 3, 11, 11, 11,
+    2, 11, 11, 11, 4, 4, 4, 11, 2, 11, 11, 11,
+    3, 11, 11, 11, 2, 11, 11, 11, 7, 7, 7, 7,
+    7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7,
+    4, 4, 7, 7, 2, 7, 7, 7, 3, 3, 11, 11,
+    2, 11, 11, 11, 5, 5, 5, 5, 5, 5, 5, 11,
+    3, 3, 11, 11, 2, 11, 11, 11, 4, 4, 4, 11,
+    2, 11, 11, 11, 3, 3, 11, 11, 2, 11, 11, 11,
+    6, 6, 6, 6, 6, 6, 6, 6, 3, 6, 6, 6,
+    2, 6, 11, 11, 4, 4, 4, 4, 2, 11, 11, 11,
+    3, 3, 11, 11, 2, 11, 11, 11, 5, 5, 5, 5,
+    5, 5, 5, 5, 3, 3, 11, 11, 2, 11, 11, 11,
+    4, 4, 4, 4, 2, 11, 11, 11, 3, 3, 11, 11,
+    2, 11, 11, 11, 9, 9, 9, 9, 9, 9, 9, 9,
+    9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9,
+    9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9,
+    5, 5, 9, 9, 9, 9, 9, 9, 3, 9, 9, 9,
+    9, 9, 9, 9, 4, 9, 9, 9, 9, 9, 9, 9,
+    3, 9, 9, 9, 9, 9, 9, 9, 6, 6, 6, 6,
+    6, 6, 6, 6, 3, 9, 9, 9, 9, 9, 9, 9,
+    4, 4, 9, 9, 2, 9, 9, 9, 3, 9, 9, 9,
+    2, 9, 9, 9, 5, 5, 5, 5, 5, 5, 9, 9,
+    3, 3, 9, 9, 2, 9, 9, 9, 4, 4, 4, 9,
+    2, 9, 9, 9, 3, 3, 9, 9, 2, 9, 9, 9,
+    7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7,
+    7, 7, 7, 7, 4, 4, 7, 7, 7, 7, 7, 7,
+    3, 7, 7, 7, 2, 7, 7, 7, 5, 5, 5, 5,
+    5, 5, 5, 5, 3, 3, 1, 11, 2, 11, 1, 11,
+    4, 4, 4, 4, 2, 11, 1, 11, 3, 3, 3, 11,
+    2, 11, 1, 11, 6, 6, 6, 6, 6, 6, 6, 6,
+    3, 6, 6, 6, 2, 6, 6, 6, 4, 4, 4, 4,
+    2, 6, 1, 11, 3, 3, 3, 11, 2, 11, 1, 11,
+    5, 5, 5, 5, 5, 5, 5, 5, 3, 3, 5, 5,
+    2, 11, 1, 11, 4, 4, 4, 4, 2, 4, 1, 11,
+    3, 3, 3, 11, 2, 11, 1, 11, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    4, 8, 8, 8, 8, 8, 8, 8, 3, 8, 8, 8,
+    8, 8, 8, 8, 5, 5, 5, 5, 8, 8, 8, 8,
+    3, 8, 8, 8, 2, 8, 8, 8, 4, 4, 4, 8,
+    2, 8, 8, 8, 3, 3, 8, 8, 2, 8, 8, 8,
+    6, 6, 6, 6, 6, 6, 6, 6, 3, 6, 6, 6,
+    2, 6, 6, 6, 4, 4, 4, 4, 2, 8, 8, 8,
+    3, 3, 3, 8, 2, 8, 1, 8, 5, 5, 5, 5,
+    5, 5, 5, 5, 3, 3, 5, 5, 2, 2, 1, 11,
+    4, 4, 4, 4, 2, 4, 1, 11, 3, 3, 3, 11,
+    2, 2, 1, 11, 7, 7, 7, 7, 7, 7, 7, 7,
+    7, 7, 7, 7, 7, 7, 7, 7, 4, 4, 7, 7,
+    7, 7, 7, 7, 3, 7, 7, 7, 2, 7, 7, 7,
+    5, 5, 5, 5, 5, 5, 5, 5, 3, 3, 7, 7,
+    2, 7, 1, 7, 4, 4, 4, 4, 2, 4, 1, 7,
+    3, 3, 3, 3, 2, 2, 1, 11, 6, 6, 6, 6,
+    6, 6, 6, 6, 3, 6, 6, 6, 2, 6, 6, 6,
+    4, 4, 4, 4, 2, 6, 6, 6, 3, 3, 3, 6,
+    2, 2, 1, 11, 5, 5, 5, 5, 5, 5, 5, 5,
+    3, 3, 5, 5, 2, 5, 1, 5, 4, 4, 4, 4,
+    2, 4, 1, 4, 3, 3, 3, 3, 2, 2, 1, 11,
+    10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10,
+    10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10,
+    10, 10, 10, 10, 10, 10, 10, 10, 5, 10, 10, 10,
+    10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10,
+    4, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10,
+    10, 10, 10, 10, 6, 6, 6, 6, 10, 10, 10, 10,
+    10, 10, 10, 10, 10, 10, 10, 10, 4, 10, 10, 10,
+    10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10,
+    5, 5, 5, 10, 10, 10, 10, 10, 3, 10, 10, 10,
+    10, 10, 10, 10, 4, 4, 10, 10, 10, 10, 10, 10,
+    3, 10, 10, 10, 10, 10, 10, 10, 7, 7, 7, 7,
+    7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7,
+    4, 4, 10, 10, 10, 10, 10, 10, 3, 10, 10, 10,
+    10, 10, 10, 10, 5, 5, 5, 5, 5, 10, 10, 10,
+    3, 10, 10, 10, 10, 10, 10, 10, 4, 4, 4, 10,
+    10, 10, 10, 10, 3, 10, 10, 10, 10, 10, 10, 10,
+    6, 6, 6, 6, 6, 6, 6, 6, 3, 6, 6, 6,
+    2, 10, 10, 10, 4, 4, 4, 10, 2, 10, 10, 10,
+    3, 10, 10, 10, 2, 10, 10, 10, 5, 5, 5, 5,
+    5, 5, 5, 10, 3, 3, 10, 10, 2, 10, 10, 10,
+    4, 4, 4, 4, 2, 10, 10, 10, 3, 3, 10, 10,
+    2, 10, 10, 10, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 4, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    5, 5, 5, 5, 8, 8, 8, 8, 3, 8, 8, 8,
+    8, 8, 8, 8, 4, 4, 4, 8, 2, 8, 8, 8,
+    3, 8, 8, 8, 2, 8, 8, 8, 6, 6, 6, 6,
+    6, 6, 6, 6, 3, 6, 6, 6, 6, 6, 6, 6,
+    4, 4, 4, 4, 2, 10, 10, 10, 3, 3, 10, 10,
+    2, 10, 10, 10, 5, 5, 5, 5, 5, 5, 5, 5,
+    3, 3, 5, 10, 2, 10, 10, 10, 4, 4, 4, 4,
+    2, 4, 10, 10, 3, 3, 3, 10, 2, 10, 10, 10,
+    7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7,
+    7, 7, 7, 7, 4, 4, 7, 7, 7, 7, 7, 7,
+    3, 7, 7, 7, 2, 7, 7, 7, 5, 5, 5, 5,
+    5, 5, 5, 5, 3, 3, 7, 7, 2, 7, 7, 7,
+    4, 4, 4, 4, 2, 4, 1, 10, 3, 3, 3, 10,
+    2, 10, 1, 10, 6, 6, 6, 6, 6, 6, 6, 6,
+    3, 6, 6, 6, 6, 6, 6, 6, 4, 4, 4, 4,
+    2, 6, 6, 6, 3, 3, 3, 6, 2, 2, 1, 10,
+    5, 5, 5, 5, 5, 5, 5, 5, 3, 3, 5, 5,
+    2, 5, 1, 10, 4, 4, 4, 4, 2, 4, 4, 4,
+    3, 3, 3, 3, 2, 2, 1, 10, 9, 9, 9, 9,
+    9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9,
+    9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9,
+    9, 9, 9, 9, 5, 5, 9, 9, 9, 9, 9, 9,
+    9, 9, 9, 9, 9, 9, 9, 9, 4, 9, 9, 9,
+    9, 9, 9, 9, 3, 9, 9, 9, 9, 9, 9, 9,
+    6, 6, 6, 6, 6, 6, 6, 6, 3, 9, 9, 9,
+    9, 9, 9, 9, 4, 4, 9, 9, 9, 9, 9, 9,
+    3, 9, 9, 9, 9, 9, 9, 9, 5, 5, 5, 5,
+    5, 5, 9, 9, 3, 9, 9, 9, 9, 9, 9, 9,
+    4, 4, 4, 9, 2, 9, 9, 9, 3, 3, 9, 9,
+    2, 9, 9, 9, 7, 7, 7, 7, 7, 7, 7, 7,
+    7, 7, 7, 7, 7, 7, 7, 7, 4, 4, 7, 7,
+    7, 7, 7, 7, 3, 7, 7, 7, 7, 7, 7, 7,
+    5, 5, 5, 5, 5, 5, 5, 5, 3, 3, 9, 9,
+    2, 9, 9, 9, 4, 4, 4, 4, 2, 9, 9, 9,
+    3, 3, 3, 9, 2, 9, 9, 9, 6, 6, 6, 6,
+    6, 6, 6, 6, 3, 6, 6, 6, 6, 6, 6, 6,
+    4, 4, 4, 4, 2, 6, 6, 6, 3, 3, 3, 9,
+    2, 9, 9, 9, 5, 5, 5, 5, 5, 5, 5, 5,
+    3, 3, 5, 5, 2, 5, 1, 9, 4, 4, 4, 4,
+    2, 4, 4, 9, 3, 3, 3, 3, 2, 2, 1, 9,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 4, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 5, 5, 5, 5,
+    8, 8, 8, 8, 3, 8, 8, 8, 8, 8, 8, 8,
+    4, 4, 4, 8, 8, 8, 8, 8, 3, 8, 8, 8,
+    2, 8, 8, 8, 6, 6, 6, 6, 6, 6, 6, 6,
+    3, 6, 6, 6, 6, 6, 6, 6, 4, 4, 4, 4,
+    2, 8, 8, 8, 3, 3, 8, 8, 2, 8, 8, 8,
+    5, 5, 5, 5, 5, 5, 5, 5, 3, 3, 5, 5,
+    2, 8, 8, 8, 4, 4, 4, 4, 2, 4, 4, 8,
+    3, 3, 3, 8, 2, 2, 1, 8, 7, 7, 7, 7,
+    7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7,
+    4, 4, 7, 7, 7, 7, 7, 7, 3, 7, 7, 7,
+    7, 7, 7, 7, 5, 5, 5, 5, 5, 5, 5, 5,
+    3, 3, 7, 7, 2, 7, 7, 7, 4, 4, 4, 4,
+    2, 4, 7, 7, 3, 3, 3, 7, 2, 7, 1, 7,
+    6, 6, 6, 6, 6, 6, 6, 6, 3, 6, 6, 6,
+    6, 6, 6, 6, 4, 4, 4, 4, 2, 6, 6, 6,
+    3, 3, 3, 6, 2, 6, 6, 6, 5, 5, 5, 5,
+    5, 5, 5, 5, 3, 3, 5, 5, 2, 5, 5, 5,
+    4, 4, 4, 4, 2, 4, 4, 4, 3, 3, 3, 3,
+    2, 2, 1, 0,
+)
+
+# Bitmasks of the prime forms
+PRIME_TABLE = (
+    0, 1, 1, 3, 1, 5, 3, 7, 1, 9, 5, 11,
+    3, 11, 7, 15, 1, 17, 9, 19, 5, 21, 11, 23,
+    3, 19, 11, 27, 7, 23, 15, 31, 1, 33, 17, 35,
+    9, 37, 19, 39, 5, 37, 21, 43, 11, 45, 23, 47,
+    3, 35, 19, 51, 11, 43, 27, 55, 7, 39, 23, 55,
+    15, 47, 31, 63, 1, 65, 33, 67, 17, 69, 35, 71,
+    9, 73, 37, 75, 19, 77, 39, 79, 5, 69, 37, 83,
+    21, 85, 43, 87, 11, 77, 45, 91, 23, 93, 47, 95,
+    3, 67, 35, 99, 19, 83, 51, 103, 11, 75, 43, 107,
+    27, 91, 55, 111, 7, 71, 39, 103, 23, 87, 55, 119,
+    15, 79, 47, 111, 31, 95, 63, 127, 1, 33, 65, 67,
+    33, 133, 67, 135, 17, 137, 69, 139, 35, 141, 71, 143,
+    9, 137, 73, 147, 37, 149, 75, 151, 19, 153, 77, 155,
+    39, 157, 79, 159, 5, 133, 69, 163, 37, 165, 83, 167,
+    21, 149, 85, 171, 43, 173, 87, 175, 11, 141, 77, 179,
+    45, 173, 91, 183, 23, 157, 93, 187, 47, 189, 95, 191,
+    3, 67, 67, 195, 35, 163, 99, 199, 19, 147, 83, 203,
+    51, 179, 103, 207, 11, 139, 75, 203, 43, 171, 107, 215,
+    27, 155, 91, 219, 55, 187, 111, 223, 7, 135, 71, 199,
+    39, 167, 103, 231, 23, 151, 87, 215, 55, 183, 119, 239,
+    15, 143, 79, 207, 47, 175, 111, 239, 31, 159, 95, 223,
+    63, 191, 127, 255, 1, 17, 33, 35, 65, 69, 67, 71,
+    33, 137, 133, 141, 67, 139, 135, 143, 17, 273, 137, 275,
+    69, 277, 139, 279, 35, 275, 141, 283, 71, 279, 143, 287,
+    9, 137, 137, 291, 73, 293, 147, 295, 37, 297, 149, 299,
+    75, 301, 151, 303, 19, 275, 153, 307, 77, 309, 155, 311,
+    39, 313, 157, 315, 79, 317, 159, 319, 5, 69, 133, 163,
+    69, 325, 163, 327, 37, 293, 165, 331, 83, 333, 167, 335,
+    21, 277, 149, 339, 85, 341, 171, 343, 43, 309, 173, 347,
+    87, 349, 175, 351, 11, 139, 141, 355, 77, 333, 179, 359,
+    45, 301, 173, 363, 91, 365, 183, 367, 23, 279, 157, 371,
+    93, 349, 187, 375, 47, 317, 189, 379, 95, 381, 191, 383,
+    3, 35, 67, 99, 67, 163, 195, 199, 35, 291, 163, 355,
+    99, 355, 199, 399, 19, 275, 147, 403, 83, 339, 203, 407,
+    51, 307, 179, 411, 103, 371, 207, 415, 11, 141, 139, 355,
+    75, 331, 203, 423, 43, 299, 171, 427, 107, 363, 215, 431,
+    27, 283, 155, 411, 91, 347, 219, 439, 55, 315, 187, 443,
+    111, 379, 223, 447, 7, 71, 135, 199, 71, 327, 199, 455,
+    39, 295, 167, 423, 103, 359, 231, 463, 23, 279, 151, 407,
+    87, 343, 215, 471, 55, 311, 183, 439, 119, 375, 239, 479,
+    15, 143, 143, 399, 79, 335, 207, 463, 47, 303, 175, 431,
+    111, 367, 239, 495, 31, 287, 159, 415, 95, 351, 223, 479,
+    63, 319, 191, 447, 127, 383, 255, 511, 1, 9, 17, 19,
+    33, 37, 35, 39, 65, 73, 69, 77, 67, 75, 71, 79,
+    33, 137, 137, 153, 133, 149, 141, 157, 67, 147, 139, 155,
+    135, 151, 143, 159, 17, 137, 273, 275, 137, 297, 275, 313,
+    69, 293, 277, 309, 139, 301, 279, 317, 35, 291, 275, 307,
+    141, 299, 283, 315, 71, 295, 279, 311, 143, 303, 287, 319,
+    9, 73, 137, 147, 137, 293, 291, 295, 73, 585, 293, 587,
+    147, 587, 295, 591, 37, 293, 297, 595, 149, 597, 299, 599,
+    75, 587, 301, 603, 151, 605, 303, 607, 19, 147, 275, 403,
+    153, 595, 307, 615, 77, 587, 309, 619, 155, 603, 311, 623,
+    39, 295, 313, 615, 157, 599, 315, 631, 79, 591, 317, 623,
+    159, 607, 319, 639, 5, 37, 69, 83, 133, 165, 163, 167,
+    69, 293, 325, 333, 163, 331, 327, 335, 37, 297, 293, 595,
+    165, 661, 331, 663, 83, 595, 333, 667, 167, 663, 335, 671,
+    21, 149, 277, 339, 149, 661, 339, 679, 85, 597, 341, 683,
+    171, 685, 343, 687, 43, 299, 309, 691, 173, 693, 347, 695,
+    87, 599, 349, 699, 175, 701, 351, 703, 11, 75, 139, 203,
+    141, 331, 355, 423, 77, 587, 333, 715, 179, 717, 359, 719,
+    45, 301, 301, 723, 173, 685, 363, 727, 91, 603, 365, 731,
+    183, 733, 367, 735, 23, 151, 279, 407, 157, 663, 371, 743,
+    93, 605, 349, 747, 187, 733, 375, 751, 47, 303, 317, 755,
+    189, 701, 379, 759, 95, 607, 381, 763, 191, 765, 383, 767,
+    3, 19, 35, 51, 67, 83, 99, 103, 67, 147, 163, 179,
+    195, 203, 199, 207, 35, 275, 291, 307, 163, 339, 355, 371,
+    99, 403, 355, 411, 199, 407, 399, 415, 19, 153, 275, 307,
+    147, 595, 403, 615, 83, 595, 339, 691, 203, 723, 407, 755,
+    51, 307, 307, 819, 179, 691, 411, 823, 103, 615, 371, 823,
+    207, 755, 415, 831, 11, 77, 141, 179, 139, 333, 355, 359,
+    75, 587, 331, 717, 203, 715, 423, 719, 43, 309, 299, 691,
+    171, 683, 427, 855, 107, 619, 363, 859, 215, 747, 431, 863,
+    27, 155, 283, 411, 155, 667, 411, 871, 91, 603, 347, 859,
+    219, 731, 439, 879, 55, 311, 315, 823, 187, 699, 443, 887,
+    111, 623, 379, 891, 223, 763, 447, 895, 7, 39, 71, 103,
+    135, 167, 199, 231, 71, 295, 327, 359, 199, 423, 455, 463,
+    39, 313, 295, 615, 167, 679, 423, 743, 103, 615, 359, 871,
+    231, 743, 463, 927, 23, 157, 279, 371, 151, 663, 407, 743,
+    87, 599, 343, 855, 215, 727, 471, 943, 55, 315, 311, 823,
+    183, 695, 439, 951, 119, 631, 375, 887, 239, 759, 479, 959,
+    15, 79, 143, 207, 143, 335, 399, 463, 79, 591, 335, 719,
+    207, 719, 463, 975, 47, 317, 303, 755, 175, 687, 431, 943,
+    111, 623, 367, 879, 239, 751, 495, 991, 31, 159, 287, 415,
+    159, 671, 415, 927, 95, 607, 351, 863, 223, 735, 479, 991,
+    63, 319, 319, 831, 191, 703, 447, 959, 127, 639, 383, 895,
+    255, 767, 511, 1023, 1, 5, 9, 11, 17, 21, 19, 23,
+    33, 37, 37, 45, 35, 43, 39, 47, 65, 69, 73, 77,
+    69, 85, 77, 93, 67, 83, 75, 91, 71, 87, 79, 95,
+    33, 133, 137, 141, 137, 149, 153, 157, 133, 165, 149, 173,
+    141, 173, 157, 189, 67, 163, 147, 179, 139, 171, 155, 187,
+    135, 167, 151, 183, 143, 175, 159, 191, 17, 69, 137, 139,
+    273, 277, 275, 279, 137, 293, 297, 301, 275, 309, 313, 317,
+    69, 325, 293, 333, 277, 341, 309, 349, 139, 333, 301, 365,
+    279, 349, 317, 381, 35, 163, 291, 355, 275, 339, 307, 371,
+    141, 331, 299, 363, 283, 347, 315, 379, 71, 327, 295, 359,
+    279, 343, 311, 375, 143, 335, 303, 367, 287, 351, 319, 383,
+    9, 37, 73, 75, 137, 149, 147, 151, 137, 297, 293, 301,
+    291, 299, 295, 303, 73, 293, 585, 587, 293, 597, 587, 605,
+    147, 595, 587, 603, 295, 599, 591, 607, 37, 165, 293, 331,
+    297, 661, 595, 663, 149, 661, 597, 685, 299, 693, 599, 701,
+    75, 331, 587, 717, 301, 685, 603, 733, 151, 663, 605, 733,
+    303, 701, 607, 765, 19, 83, 147, 203, 275, 339, 403, 407,
+    153, 595, 595, 723, 307, 691, 615, 755, 77, 333, 587, 715,
+    309, 683, 619, 747, 155, 667, 603, 731, 311, 699, 623, 763,
+    39, 167, 295, 423, 313, 679, 615, 743, 157, 663, 599, 727,
+    315, 695, 631, 759, 79, 335, 591, 719, 317, 687, 623, 751,
+    159, 671, 607, 735, 319, 703, 639, 767, 5, 21, 37, 43,
+    69, 85, 83, 87, 133, 149, 165, 173, 163, 171, 167, 175,
+    69, 277, 293, 309, 325, 341, 333, 349, 163, 339, 331, 347,
+    327, 343, 335, 351, 37, 149, 297, 299, 293, 597, 595, 599,
+    165, 661, 661, 693, 331, 685, 663, 701, 83, 339, 595, 691,
+    333, 683, 667, 699, 167, 679, 663, 695, 335, 687, 671, 703,
+    21, 85, 149, 171, 277, 341, 339, 343, 149, 597, 661, 685,
+    339, 683, 679, 687, 85, 341, 597, 683, 341, 1365, 683, 1367,
+    171, 683, 685, 1371, 343, 1367, 687, 1375, 43, 171, 299, 427,
+    309, 683, 691, 855, 173, 685, 693, 1387, 347, 1371, 695, 1391,
+    87, 343, 599, 855, 349, 1367, 699, 1399, 175, 687, 701, 1391,
+    351, 1375, 703, 1407, 11, 43, 75, 107, 139, 171, 203, 215,
+    141, 299, 331, 363, 355, 427, 423, 431, 77, 309, 587, 619,
+    333, 683, 715, 747, 179, 691, 717, 859, 359, 855, 719, 863,
+    45, 173, 301, 363, 301, 685, 723, 727, 173, 693, 685, 1387,
+    363, 1387, 727, 1455, 91, 347, 603, 859, 365, 1371, 731, 1463,
+    183, 695, 733, 1467, 367, 1391, 735, 1471, 23, 87, 151, 215,
+    279, 343, 407, 471, 157, 599, 663, 727, 371, 855, 743, 943,
+    93, 349, 605, 747, 349, 1367, 747, 1495, 187, 699, 733, 1463,
+    375, 1399, 751, 1503, 47, 175, 303, 431, 317, 687, 755, 943,
+    189, 701, 701, 1455, 379, 1391, 759, 1519, 95, 351, 607, 863,
+    381, 1375, 763, 1503, 191, 703, 765, 1471, 383, 1407, 767, 1535,
+    3, 11, 19, 27, 35, 43, 51, 55, 67, 75, 83, 91,
+    99, 107, 103, 111, 67, 139, 147, 155, 163, 171, 179, 187,
+    195, 203, 203, 219, 199, 215, 207, 223, 35, 141, 275, 283,
+    291, 299, 307, 315, 163, 331, 339, 347, 355, 363, 371, 379,
+    99, 355, 403, 411, 355, 427, 411, 443, 199, 423, 407, 439,
+    399, 431, 415, 447, 19, 77, 153, 155, 275, 309, 307, 311,
+    147, 587, 595, 603, 403, 619, 615, 623, 83, 333, 595, 667,
+    339, 683, 691, 699, 203, 715, 723, 731, 407, 747, 755, 763,
+    51, 179, 307, 411, 307, 691, 819, 823, 179, 717, 691, 859,
+    411, 859, 823, 891, 103, 359, 615, 871, 371, 855, 823, 887,
+    207, 719, 755, 879, 415, 863, 831, 895, 11, 45, 77, 91,
+    141, 173, 179, 183, 139, 301, 333, 365, 355, 363, 359, 367,
+    75, 301, 587, 603, 331, 685, 717, 733, 203, 723, 715, 731,
+    423, 727, 719, 735, 43, 173, 309, 347, 299, 693, 691, 695,
+    171, 685, 683, 1371, 427, 1387, 855, 1391, 107, 363, 619, 859,
+    363, 1387, 859, 1467, 215, 727, 747, 1463, 431, 1455, 863, 1471,
+    27, 91, 155, 219, 283, 347, 411, 439, 155, 603, 667, 731,
+    411, 859, 871, 879, 91, 365, 603, 731, 347, 1371, 859, 1463,
+    219, 731, 731, 1755, 439, 1463, 879, 1759, 55, 183, 311, 439,
+    315, 695, 823, 951, 187, 733, 699, 1463, 443, 1467, 887, 1775,
+    111, 367, 623, 879, 379, 1391, 891, 1775, 223, 735, 763, 1759,
+    447, 1471, 895, 1791, 7, 23, 39, 55, 71, 87, 103, 119,
+    135, 151, 167, 183, 199, 215, 231, 239, 71, 279, 295, 311,
+    327, 343, 359, 375, 199, 407, 423, 439, 455, 471, 463, 479,
+    39, 157, 313, 315, 295, 599, 615, 631, 167, 663, 679, 695,
+    423, 727, 743, 759, 103, 371, 615, 823, 359, 855, 871, 887,
+    231, 743, 743, 951, 463, 943, 927, 959, 23, 93, 157, 187,
+    279, 349, 371, 375, 151, 605, 663, 733, 407, 747, 743, 751,
+    87, 349, 599, 699, 343, 1367, 855, 1399, 215, 747, 727, 1463,
+    471, 1495, 943, 1503, 55, 187, 315, 443, 311, 699, 823, 887,
+    183, 733, 695, 1467, 439, 1463, 951, 1775, 119, 375, 631, 887,
+    375, 1399, 887, 1911, 239, 751, 759, 1775, 479, 1503, 959, 1919,
+    15, 47, 79, 111, 143, 175, 207, 239, 143, 303, 335, 367,
+    399, 431, 463, 495, 79, 317, 591, 623, 335, 687, 719, 751,
+    207, 755, 719, 879, 463, 943, 975, 991, 47, 189, 317, 379,
+    303, 701, 755, 759, 175, 701, 687, 1391, 431, 1455, 943, 1519,
+    111, 379, 623, 891, 367, 1391, 879, 1775, 239, 759, 751, 1775,
+    495, 1519, 991, 1983, 31, 95, 159, 223, 287, 351, 415, 479,
+    159, 607, 671, 735, 415, 863, 927, 991, 95, 381, 607, 763,
+    351, 1375, 863, 1503, 223, 763, 735, 1759, 479, 1503, 991, 2015,
+    63, 191, 319, 447, 319, 703, 831, 959, 191, 765, 703, 1471,
+    447, 1471, 959, 1983, 127, 383, 639, 895, 383, 1407, 895, 1919,
+    255, 767, 767, 1791, 511, 1535, 1023, 2047, 1, 3, 5, 7,
+    9, 11, 11, 15, 17, 19, 21, 23, 19, 27, 23, 31,
+    33, 35, 37, 39, 37, 43, 45, 47, 35, 51, 43, 55,
+    39, 55, 47, 63, 65, 67, 69, 71, 73, 75, 77, 79,
+    69, 83, 85, 87, 77, 91, 93, 95, 67, 99, 83, 103,
+    75, 107, 91, 111, 71, 103, 87, 119, 79, 111, 95, 127,
+    33, 67, 133, 135, 137, 139, 141, 143, 137, 147, 149, 151,
+    153, 155, 157, 159, 133, 163, 165, 167, 149, 171, 173, 175,
+    141, 179, 173, 183, 157, 187, 189, 191, 67, 195, 163, 199,
+    147, 203, 179, 207, 139, 203, 171, 215, 155, 219, 187, 223,
+    135, 199, 167, 231, 151, 215, 183, 239, 143, 207, 175, 239,
+    159, 223, 191, 255, 17, 35, 69, 71, 137, 141, 139, 143,
+    273, 275, 277, 279, 275, 283, 279, 287, 137, 291, 293, 295,
+    297, 299, 301, 303, 275, 307, 309, 311, 313, 315, 317, 319,
+    69, 163, 325, 327, 293, 331, 333, 335, 277, 339, 341, 343,
+    309, 347, 349, 351, 139, 355, 333, 359, 301, 363, 365, 367,
+    279, 371, 349, 375, 317, 379, 381, 383, 35, 99, 163, 199,
+    291, 355, 355, 399, 275, 403, 339, 407, 307, 411, 371, 415,
+    141, 355, 331, 423, 299, 427, 363, 431, 283, 411, 347, 439,
+    315, 443, 379, 447, 71, 199, 327, 455, 295, 423, 359, 463,
+    279, 407, 343, 471, 311, 439, 375, 479, 143, 399, 335, 463,
+    303, 431, 367, 495, 287, 415, 351, 479, 319, 447, 383, 511,
+    9, 19, 37, 39, 73, 77, 75, 79, 137, 153, 149, 157,
+    147, 155, 151, 159, 137, 275, 297, 313, 293, 309, 301, 317,
+    291, 307, 299, 315, 295, 311, 303, 319, 73, 147, 293, 295,
+    585, 587, 587, 591, 293, 595, 597, 599, 587, 603, 605, 607,
+    147, 403, 595, 615, 587, 619, 603, 623, 295, 615, 599, 631,
+    591, 623, 607, 639, 37, 83, 165, 167, 293, 333, 331, 335,
+    297, 595, 661, 663, 595, 667, 663, 671, 149, 339, 661, 679,
+    597, 683, 685, 687, 299, 691, 693, 695, 599, 699, 701, 703,
+    75, 203, 331, 423, 587, 715, 717, 719, 301, 723, 685, 727,
+    603, 731, 733, 735, 151, 407, 663, 743, 605, 747, 733, 751,
+    303, 755, 701, 759, 607, 763, 765, 767, 19, 51, 83, 103,
+    147, 179, 203, 207, 275, 307, 339, 371, 403, 411, 407, 415,
+    153, 307, 595, 615, 595, 691, 723, 755, 307, 819, 691, 823,
+    615, 823, 755, 831, 77, 179, 333, 359, 587, 717, 715, 719,
+    309, 691, 683, 855, 619, 859, 747, 863, 155, 411, 667, 871,
+    603, 859, 731, 879, 311, 823, 699, 887, 623, 891, 763, 895,
+    39, 103, 167, 231, 295, 359, 423, 463, 313, 615, 679, 743,
+    615, 871, 743, 927, 157, 371, 663, 743, 599, 855, 727, 943,
+    315, 823, 695, 951, 631, 887, 759, 959, 79, 207, 335, 463,
+    591, 719, 719, 975, 317, 755, 687, 943, 623, 879, 751, 991,
+    159, 415, 671, 927, 607, 863, 735, 991, 319, 831, 703, 959,
+    639, 895, 767, 1023, 5, 11, 21, 23, 37, 45, 43, 47,
+    69, 77, 85, 93, 83, 91, 87, 95, 133, 141, 149, 157,
+    165, 173, 173, 189, 163, 179, 171, 187, 167, 183, 175, 191,
+    69, 139, 277, 279, 293, 301, 309, 317, 325, 333, 341, 349,
+    333, 365, 349, 381, 163, 355, 339, 371, 331, 363, 347, 379,
+    327, 359, 343, 375, 335, 367, 351, 383, 37, 75, 149, 151,
+    297, 301, 299, 303, 293, 587, 597, 605, 595, 603, 599, 607,
+    165, 331, 661, 663, 661, 685, 693, 701, 331, 717, 685, 733,
+    663, 733, 701, 765, 83, 203, 339, 407, 595, 723, 691, 755,
+    333, 715, 683, 747, 667, 731, 699, 763, 167, 423, 679, 743,
+    663, 727, 695, 759, 335, 719, 687, 751, 671, 735, 703, 767,
+    21, 43, 85, 87, 149, 173, 171, 175, 277, 309, 341, 349,
+    339, 347, 343, 351, 149, 299, 597, 599, 661, 693, 685, 701,
+    339, 691, 683, 699, 679, 695, 687, 703, 85, 171, 341, 343,
+    597, 685, 683, 687, 341, 683, 1365, 1367, 683, 1371, 1367, 1375,
+    171, 427, 683, 855, 685, 1387, 1371, 1391, 343, 855, 1367, 1399,
+    687, 1391, 1375, 1407, 43, 107, 171, 215, 299, 363, 427, 431,
+    309, 619, 683, 747, 691, 859, 855, 863, 173, 363, 685, 727,
+    693, 1387, 1387, 1455, 347, 859, 1371, 1463, 695, 1467, 1391, 1471,
+    87, 215, 343, 471, 599, 727, 855, 943, 349, 747, 1367, 1495,
+    699, 1463, 1399, 1503, 175, 431, 687, 943, 701, 1455, 1391, 1519,
+    351, 863, 1375, 1503, 703, 1471, 1407, 1535, 11, 27, 43, 55,
+    75, 91, 107, 111, 139, 155, 171, 187, 203, 219, 215, 223,
+    141, 283, 299, 315, 331, 347, 363, 379, 355, 411, 427, 443,
+    423, 439, 431, 447, 77, 155, 309, 311, 587, 603, 619, 623,
+    333, 667, 683, 699, 715, 731, 747, 763, 179, 411, 691, 823,
+    717, 859, 859, 891, 359, 871, 855, 887, 719, 879, 863, 895,
+    45, 91, 173, 183, 301, 365, 363, 367, 301, 603, 685, 733,
+    723, 731, 727, 735, 173, 347, 693, 695, 685, 1371, 1387, 1391,
+    363, 859, 1387, 1467, 727, 1463, 1455, 1471, 91, 219, 347, 439,
+    603, 731, 859, 879, 365, 731, 1371, 1463, 731, 1755, 1463, 1759,
+    183, 439, 695, 951, 733, 1463, 1467, 1775, 367, 879, 1391, 1775,
+    735, 1759, 1471, 1791, 23, 55, 87, 119, 151, 183, 215, 239,
+    279, 311, 343, 375, 407, 439, 471, 479, 157, 315, 599, 631,
+    663, 695, 727, 759, 371, 823, 855, 887, 743, 951, 943, 959,
+    93, 187, 349, 375, 605, 733, 747, 751, 349, 699, 1367, 1399,
+    747, 1463, 1495, 1503, 187, 443, 699, 887, 733, 1467, 1463, 1775,
+    375, 887, 1399, 1911, 751, 1775, 1503, 1919, 47, 111, 175, 239,
+    303, 367, 431, 495, 317, 623, 687, 751, 755, 879, 943, 991,
+    189, 379, 701, 759, 701, 1391, 1455, 1519, 379, 891, 1391, 1775,
+    759, 1775, 1519, 1983, 95, 223, 351, 479, 607, 735, 863, 991,
+    381, 763, 1375, 1503, 763, 1759, 1503, 2015, 191, 447, 703, 959,
+    765, 1471, 1471, 1983, 383, 895, 1407, 1919, 767, 1791, 1535, 2047,
+    3, 7, 11, 15, 19, 23, 27, 31, 35, 39, 43, 47,
+    51, 55, 55, 63, 67, 71, 75, 79, 83, 87, 91, 95,
+    99, 103, 107, 111, 103, 119, 111, 127, 67, 135, 139, 143,
+    147, 151, 155, 159, 163, 167, 171, 175, 179, 183, 187, 191,
+    195, 199, 203, 207, 203, 215, 219, 223, 199, 231, 215, 239,
+    207, 239, 223, 255, 35, 71, 141, 143, 275, 279, 283, 287,
+    291, 295, 299, 303, 307, 311, 315, 319, 163, 327, 331, 335,
+    339, 343, 347, 351, 355, 359, 363, 367, 371, 375, 379, 383,
+    99, 199, 355, 399, 403, 407, 411, 415, 355, 423, 427, 431,
+    411, 439, 443, 447, 199, 455, 423, 463, 407, 471, 439, 479,
+    399, 463, 431, 495, 415, 479, 447, 511, 19, 39, 77, 79,
+    153, 157, 155, 159, 275, 313, 309, 317, 307, 315, 311, 319,
+    147, 295, 587, 591, 595, 599, 603, 607, 403, 615, 619, 623,
+    615, 631, 623, 639, 83, 167, 333, 335, 595, 663, 667, 671,
+    339, 679, 683, 687, 691, 695, 699, 703, 203, 423, 715, 719,
+    723, 727, 731, 735, 407, 743, 747, 751, 755, 759, 763, 767,
+    51, 103, 179, 207, 307, 371, 411, 415, 307, 615, 691, 755,
+    819, 823, 823, 831, 179, 359, 717, 719, 691, 855, 859, 863,
+    411, 871, 859, 879, 823, 887, 891, 895, 103, 231, 359, 463,
+    615, 743, 871, 927, 371, 743, 855, 943, 823, 951, 887, 959,
+    207, 463, 719, 975, 755, 943, 879, 991, 415, 927, 863, 991,
+    831, 959, 895, 1023, 11, 23, 45, 47, 77, 93, 91, 95,
+    141, 157, 173, 189, 179, 187, 183, 191, 139, 279, 301, 317,
+    333, 349, 365, 381, 355, 371, 363, 379, 359, 375, 367, 383,
+    75, 151, 301, 303, 587, 605, 603, 607, 331, 663, 685, 701,
+    717, 733, 733, 765, 203, 407, 723, 755, 715, 747, 731, 763,
+    423, 743, 727, 759, 719, 751, 735, 767, 43, 87, 173, 175,
+    309, 349, 347, 351, 299, 599, 693, 701, 691, 699, 695, 703,
+    171, 343, 685, 687, 683, 1367, 1371, 1375, 427, 855, 1387, 1391,
+    855, 1399, 1391, 1407, 107, 215, 363, 431, 619, 747, 859, 863,
+    363, 727, 1387, 1455, 859, 1463, 1467, 1471, 215, 471, 727, 943,
+    747, 1495, 1463, 1503, 431, 943, 1455, 1519, 863, 1503, 1471, 1535,
+    27, 55, 91, 111, 155, 187, 219, 223, 283, 315, 347, 379,
+    411, 443, 439, 447, 155, 311, 603, 623, 667, 699, 731, 763,
+    411, 823, 859, 891, 871, 887, 879, 895, 91, 183, 365, 367,
+    603, 733, 731, 735, 347, 695, 1371, 1391, 859, 1467, 1463, 1471,
+    219, 439, 731, 879, 731, 1463, 1755, 1759, 439, 951, 1463, 1775,
+    879, 1775, 1759, 1791, 55, 119, 183, 239, 311, 375, 439, 479,
+    315, 631, 695, 759, 823, 887, 951, 959, 187, 375, 733, 751,
+    699, 1399, 1463, 1503, 443, 887, 1467, 1775, 887, 1911, 1775, 1919,
+    111, 239, 367, 495, 623, 751, 879, 991, 379, 759, 1391, 1519,
+    891, 1775, 1775, 1983, 223, 479, 735, 991, 763, 1503, 1759, 2015,
+    447, 959, 1471, 1983, 895, 1919, 1791, 2047, 7, 15, 23, 31,
+    39, 47, 55, 63, 71, 79, 87, 95, 103, 111, 119, 127,
+    135, 143, 151, 159, 167, 175, 183, 191, 199, 207, 215, 223,
+    231, 239, 239, 255, 71, 143, 279, 287, 295, 303, 311, 319,
+    327, 335, 343, 351, 359, 367, 375, 383, 199, 399, 407, 415,
+    423, 431, 439, 447, 455, 463, 471, 479, 463, 495, 479, 511,
+    39, 79, 157, 159, 313, 317, 315, 319, 295, 591, 599, 607,
+    615, 623, 631, 639, 167, 335, 663, 671, 679, 687, 695, 703,
+    423, 719, 727, 735, 743, 751, 759, 767, 103, 207, 371, 415,
+    615, 755, 823, 831, 359, 719, 855, 863, 871, 879, 887, 895,
+    231, 463, 743, 927, 743, 943, 951, 959, 463, 975, 943, 991,
+    927, 991, 959, 1023, 23, 47, 93, 95, 157, 189, 187, 191,
+    279, 317, 349, 381, 371, 379, 375, 383, 151, 303, 605, 607,
+    663, 701, 733, 765, 407, 755, 747, 763, 743, 759, 751, 767,
+    87, 175, 349, 351, 599, 701, 699, 703, 343, 687, 1367, 1375,
+    855, 1391, 1399, 1407, 215, 431, 747, 863, 727, 1455, 1463, 1471,
+    471, 943, 1495, 1503, 943, 1519, 1503, 1535, 55, 111, 187, 223,
+    315, 379, 443, 447, 311, 623, 699, 763, 823, 891, 887, 895,
+    183, 367, 733, 735, 695, 1391, 1467, 1471, 439, 879, 1463, 1759,
+    951, 1775, 1775, 1791, 119, 239, 375, 479, 631, 759, 887, 959,
+    375, 751, 1399, 1503, 887, 1775, 1911, 1919, 239, 495, 751, 991,
+    759, 1519, 1775, 1983, 479, 991, 1503, 2015, 959, 1983, 1919, 2047,
+    15, 31, 47, 63, 79, 95, 111, 127, 143, 159, 175, 191,
+    207, 223, 239, 255, 143, 287, 303, 319, 335, 351, 367, 383,
+    399, 415, 431, 447, 463, 479, 495, 511, 79, 159, 317, 319,
+    591, 607, 623, 639, 335, 671, 687, 703, 719, 735, 751, 767,
+    207, 415, 755, 831, 719, 863, 879, 895, 463, 927, 943, 959,
+    975, 991, 991, 1023, 47, 95, 189, 191, 317, 381, 379, 383,
+    303, 607, 701, 765, 755, 763, 759, 767, 175, 351, 701, 703,
+    687, 1375, 1391, 1407, 431, 863, 1455, 1471, 943, 1503, 1519, 1535,
+    111, 223, 379, 447, 623, 763, 891, 895, 367, 735, 1391, 1471,
+    879, 1759, 1775, 1791, 239, 479, 759, 959, 751, 1503, 1775, 1919,
+    495, 991, 1519, 1983, 991, 2015, 1983, 2047, 31, 63, 95, 127,
+    159, 191, 223, 255, 287, 319, 351, 383, 415, 447, 479, 511,
+    159, 319, 607, 639, 671, 703, 735, 767, 415, 831, 863, 895,
+    927, 959, 991, 1023, 95, 191, 381, 383, 607, 765, 763, 767,
+    351, 703, 1375, 1407, 863, 1471, 1503, 1535, 223, 447, 763, 895,
+    735, 1471, 1759, 1791, 479, 959, 1503, 1919, 991, 1983, 2015, 2047,
+    63, 127, 191, 255, 319, 383, 447, 511, 319, 639, 703, 767,
+    831, 895, 959, 1023, 191, 383, 765, 767, 703, 1407, 1471, 1535,
+    447, 895, 1471, 1791, 959, 1919, 1983, 2047, 127, 255, 383, 511,
+    639, 767, 895, 1023, 383, 767, 1407, 1535, 895, 1791, 1919, 2047,
+    255, 511, 767, 1023, 767, 1535, 1791, 2047, 511, 1023, 1535, 2047,
+    1023, 2047, 2047, 4095,
+)
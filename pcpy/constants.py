@@ -1,19 +1,35 @@
 # Package-wide constants
 
+import sys
+
 # Pitch-classes
-PCS = set(range(12))
+PCS = frozenset(range(12))
 
 # Collection aggregates
-TT = {0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11}
-OCT0 = {0, 1, 3, 4, 6, 7, 9, 10}
-OCT1 = {1, 2, 4, 5, 7, 8, 10, 11}
-OCT2 = {2, 3, 5, 6, 8, 9, 11, 0}
-WT0 = {0, 2, 4, 6, 8, 10}
-WT1 = {1, 3, 5, 7, 9, 11}
-HEX0 = {0, 1, 4, 5, 8, 9}
-HEX1 = {1, 2, 5, 6, 9, 10}
-HEX2 = {2, 3, 6, 7, 10, 11}
-HEX3 = {3, 4, 7, 8, 11, 0}
+TT = frozenset({0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11})
+OCT0 = frozenset({0, 1, 3, 4, 6, 7, 9, 10})
+OCT1 = frozenset({1, 2, 4, 5, 7, 8, 10, 11})
+OCT2 = frozenset({2, 3, 5, 6, 8, 9, 11, 0})
+WT0 = frozenset({0, 2, 4, 6, 8, 10})
+WT1 = frozenset({1, 3, 5, 7, 9, 11})
+HEX0 = frozenset({0, 1, 4, 5, 8, 9})
+HEX1 = frozenset({1, 2, 5, 6, 9, 10})
+HEX2 = frozenset({2, 3, 6, 7, 10, 11})
+HEX3 = frozenset({3, 4, 7, 8, 11, 0})
+DT = frozenset({0, 1, 3, 5, 6, 8, 10})
+
+# Bitmasks of the collection aggregates (bit i is set if pc i is included)
+TT_MASK = 0xFFF
+OCT0_MASK = 0x6DB
+OCT1_MASK = 0xDB6
+OCT2_MASK = 0xB6D
+WT0_MASK = 0x555
+WT1_MASK = 0xAAA
+HEX0_MASK = 0x333
+HEX1_MASK = 0x666
+HEX2_MASK = 0xCCC
+HEX3_MASK = 0x999
+DT_MASK = 0x56B
 
 # Abbreviated names of the referential collections and transposition levels
 REF_COLS = ["O0", "O1", "O2", "W0", "W1", "H0", "H1", "H2", "H3"]
@@ -23,6 +39,15 @@ COL_DICT = {"O0": OCT0, "O1": OCT1, "O2": OCT2,
             "W0": WT0, "W1": WT1,
             "H0": HEX0, "H1": HEX1, "H2": HEX2, "H3": HEX3}
 
+# Collection dictionary with the bitmasks
+COL_MASKS = {"O0": OCT0_MASK, "O1": OCT1_MASK, "O2": OCT2_MASK,
+             "W0": WT0_MASK, "W1": WT1_MASK,
+             "H0": HEX0_MASK, "H1": HEX1_MASK, "H2": HEX2_MASK,
+             "H3": HEX3_MASK}
+
+# Bitmasks of the referential collections in the order of REF_COLS
+REF_COL_MASKS = tuple(COL_MASKS[col] for col in REF_COLS)
+
 # Ordinal numbers in the order of sequentially output prime forms
 ORDINAL_NUMS = [
     ["dummy"],
@@ -102,6 +127,17 @@ SN_VECS = [
      "9-10", "9-11", "9-12"]
 ]
 
+# Set names in the order of sequentially output prime forms, indexed by
+#   cardinality and then by position from 0: ORDINAL_NUMS flattened into
+#   interned set names without the dummy entries.
+PF_ORDER_NAMES = tuple(
+    tuple(sys.intern("{}-{}".format(card, num)) for num in nums[1:])
+    for card, nums in enumerate(ORDINAL_NUMS))
+
+# Set names in the Forte order, indexed by cardinality and then by ordinal
+#   number from 0: SN_VECS without the dummy entries, interned.
+SET_NAMES = tuple(tuple(sys.intern(sn) for sn in vec[1:]) for vec in SN_VECS)
+
 # Set names and prime forms of the MSC nexus sets
 NEXUS_SETS = [
     ("5-10", (0, 1, 3, 4, 6)),
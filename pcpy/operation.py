@@ -11,6 +11,9 @@ For the functions defined here, the parameter, pcs, is an iterable type:
 set, tuple, list, or Pcset object--an instance of Pcset class from the
 module pcset--but not str because each pc is represented by an int.
 
+The set transformation functions return a frozenset, which is hashable and
+can be used as a dict key; use set() to obtain a mutable copy.
+
 List of functions:
 
 INTERVAL CALCULATION
@@ -34,6 +37,7 @@ SET PROFILE
     primeForm(pcs)
     transformationLevels(pcs)
     referentialCollections(pcs)
+    referentialCounts(pcsets)
 
 SET ANALYSIS
     complement(pcs)
@@ -45,7 +49,12 @@ SET ANALYSIS
     inversionalSymmetry(pcs)
 """
 
-from .pcset import Pcset
+from functools import lru_cache
+from operator import sub
+from . import constants as c
+from ._bitmask import (IC_TABLE, INVERT_TABLE, ICV_TABLE, toMask, fromMask,
+                       rotate, popcount, subMasks, indexVectorOf, normalFormOf,
+                       primeFormOf, transformationLevelsOf, symmetryOf)
 
 __all__ = ["pitchInterval",
            "interval",
@@ -63,6 +72,7 @@ __all__ = ["pitchInterval",
            "primeForm",
            "transformationLevels",
            "referentialCollections",
+           "referentialCounts",
            "complement",
            "modalComplements",
            "subsets",
@@ -85,14 +95,11 @@ def pitchInterval(pseg, ordered=False):
         and False (default) for unordered pitch intervals.
     :return: a list of pitch intervals.
     """
-    intervals = []
-    for i in range(len(pseg) - 1):
-        intvl = pseg[i + 1] - pseg[i]
-        intervals.append(intvl)
+    intervals = list(map(sub, pseg[1:], pseg))
     if ordered:
         return intervals
     else:
-        return [abs(j) for j in intervals]
+        return list(map(abs, intervals))
 
 
 def interval(pcseg):
@@ -103,11 +110,7 @@ def interval(pcseg):
         the pitch-class space.
     :return: a list of ordered pitch-class intervals.
     """
-    intervals = []
-    for i in range(len(pcseg) - 1):
-        intvl = (pcseg[i + 1] - pcseg[i]) % 12
-        intervals.append(intvl)
-    return intervals
+    return [intvl % 12 for intvl in map(sub, pcseg[1:], pcseg)]
 
 
 def intervalClass(pcseg):
@@ -119,15 +122,10 @@ def intervalClass(pcseg):
         the pitch-class space with interval classes.
     :return: a list of integers in the range from 0 to 6.
     """
-    ics = []
-    for i in range(len(pcseg) - 1):
-        intvl1 = (pcseg[i + 1] - pcseg[i]) % 12
-        intvl2 = (pcseg[i] - pcseg[i + 1]) % 12
-        if intvl1 == intvl2:
-            ics.append(6)
-        else:
-            ics.append(min(intvl1, intvl2))
-    return ics
+    # Int intervals index the ic table; other numbers, such as float pcs,
+    #   take the smaller of the interval and its inverse.
+    return [IC_TABLE[i] if isinstance(i, int) else min(i, 12 - i)
+            for i in interval(pcseg)]
 
 
 # Set transformation functions ------------------------------------------------
@@ -138,9 +136,9 @@ def transpose(pcs, n):
 
     :param pcs: an iterable with pcs.
     :param n: an int (mod 12) for the transposition number.
-    :return: a set of transposed pcs.
+    :return: a frozenset of transposed pcs.
     """
-    return {(pc + n) % 12 for pc in pcs}
+    return fromMask(rotate(toMask(pcs), n))
 
 
 def invert(pcs):
@@ -148,9 +146,9 @@ def invert(pcs):
     A function to invert the input set around pc 0.
 
     :param pcs: an iterable with pcs.
-    :return: a set of inverted pcs.
+    :return: a frozenset of inverted pcs.
     """
-    return {(12 - pc) % 12 for pc in pcs}
+    return fromMask(INVERT_TABLE[toMask(pcs)])
 
 
 def invertXY(pcs, x, y):
@@ -164,7 +162,7 @@ def invertXY(pcs, x, y):
     :param pcs: an iterable with pcs.
     :param x: an int that inverts x onto y.
     :param y: an int that inverts y onto x.
-    :return: a set of inverted pcs.
+    :return: a frozenset of inverted pcs.
     """
     return opTnI(pcs, (x + y) % 12)
 
@@ -187,7 +185,7 @@ def opTnI(pcs, n):
     """
     Shorthand for TnI operation--inversion followed by transposition at n.
     """
-    return transpose(invert(pcs), n)
+    return fromMask(rotate(INVERT_TABLE[toMask(pcs)], n))
 
 
 def opIxy(pcs, x, y):
@@ -205,26 +203,10 @@ def icv(pcs):
 
     ICV is an enumeration of unordered pc intervals (i.e., ics).
 
-    # FIXME: icv method in pcpy.Pcset will have an option to use this
-        function (recursive calculation of icv) as the mode 2.
-        Pcset.icv() has its implementation already which is mode 1.
-        As the module import hierarchy is that operation.py imports
-        pcset.py, move the icv() function body below to pcset.py.
-        Then, the function can be called as Pcset(pcs).icv(mode=2).
-
     :param pcs: an iterable with pcs.
     :return: a list for the ICV.
     """
-    pcs = sorted(set(pcs))  # Remove duplicates and sort the pcs
-    if len(pcs) == 1:  # Base case
-        return [0] * 6
-    else:
-        vec = [0] * 6
-        for pc in pcs[1:]:
-            x = pc - pcs[0]
-            ic = min(x, 12 - x)  # Convert ordered pc interval to ic
-            vec[ic - 1] += 1     # Increment ICV digit
-        return list(map(lambda a, b: a + b, vec, icv(pcs[1:])))
+    return list(ICV_TABLE[toMask(pcs)])
 
 
 def indexVector(pcs):
@@ -234,7 +216,7 @@ def indexVector(pcs):
     :param pcs: an iterable with pcs.
     :return: a list of the index vector.
     """
-    return Pcset(pcs).indexVector()
+    return list(indexVectorOf(toMask(pcs)))
 
 
 def normalForm(pcs):
@@ -244,7 +226,7 @@ def normalForm(pcs):
     :param pcs: an iterable with pcs.
     :return: a list of the normal form.
     """
-    return Pcset(pcs).normalForm()
+    return list(normalFormOf(toMask(pcs)))
 
 
 def primeForm(pcs):
@@ -254,7 +236,7 @@ def primeForm(pcs):
     :param pcs: an iterable with pcs.
     :return: a list of the prime form.
     """
-    return Pcset(pcs).primeForm()
+    return list(primeFormOf(toMask(pcs)))
 
 
 def transformationLevels(pcs):
@@ -267,7 +249,8 @@ def transformationLevels(pcs):
         For transpositionally and inversionally symmetrical sets,
         there would be multiple entries in the lists.
     """
-    return Pcset(pcs).transformationLevels()
+    tn, tni = transformationLevelsOf(toMask(pcs))
+    return {"Tn": list(tn), "TnI": list(tni)}
 
 
 def referentialCollections(pcs):
@@ -288,7 +271,23 @@ def referentialCollections(pcs):
             True    if the current set is an abstract subset of DT
             False   otherwise
     """
-    return Pcset(pcs).referentialCollections()
+    return dict(_referentialCollectionsOf(toMask(pcs)))
+
+
+def referentialCounts(pcsets):
+    """
+    A function to count the pcs shared with each of the referential
+    collections for a batch of pcsets (e.g., the successive frames of an
+    analyzed passage).
+
+    :param pcsets: an iterable of pcsets.
+    :return: a list of lists, one for each pcset, with the numbers of pcs
+        in common with O0, O1, O2, W0, W1, H0, H1, H2, and H3 in this
+        order (i.e., that of constants.REF_COLS).
+    """
+    refColMasks = c.REF_COL_MASKS
+    return [[popcount(mask & colMask) for colMask in refColMasks]
+            for mask in map(toMask, pcsets)]
 
 
 # Set analysis function -------------------------------------------------------
@@ -300,7 +299,7 @@ def complement(pcs):
     :param pcs: an iterable with pcs.
     :return: a set of the complement of the current pcset.
     """
-    return Pcset(pcs).complement()
+    return set(fromMask(c.TT_MASK ^ toMask(pcs)))
 
 
 def modalComplements(pcs):
@@ -314,7 +313,9 @@ def modalComplements(pcs):
         Each key has a value for the complementing pcs to the
         modal collection.
     """
-    return Pcset(pcs).modalComplements()
+    mask = toMask(pcs)
+    return {col: set(fromMask(colMask & ~mask))
+            for col, colMask in c.COL_MASKS.items()}
 
 
 def subsets(pcs, n):
@@ -325,7 +326,10 @@ def subsets(pcs, n):
     :param n: an int for the cardinality of the subsets.
     :return: a list containing the subsets of cardinality n.
     """
-    return Pcset(pcs).subsets(n)
+    mask = toMask(pcs)
+    if n >= popcount(mask):
+        return None
+    return [set(fromMask(sub)) for sub in subMasks(mask, n)]
 
 
 def transpositionalInvariants(pcs, n):
@@ -339,7 +343,8 @@ def transpositionalInvariants(pcs, n):
     :param n: an int for the ordered pc interval of transposition.
     :return: a set of invariant pcs.
     """
-    return Pcset(pcs).transpositionalInvariants(n)
+    from .pcset import _pcset
+    return _pcset(toMask(pcs)).transpositionalInvariants(n)
 
 
 def inversionalInvariants(pcs, n):
@@ -351,7 +356,8 @@ def inversionalInvariants(pcs, n):
     :param n: an int for the index number.
     :return: a set of invariant pcs.
     """
-    return Pcset(pcs).inversionalInvariants(n)
+    from .pcset import _pcset
+    return _pcset(toMask(pcs)).inversionalInvariants(n)
 
 
 def transpositionalSymmetry(pcs):
@@ -363,7 +369,7 @@ def transpositionalSymmetry(pcs):
         onto itself when transposing at the transpositional level(s).
         The number is at least 1, because T0 is an identity operator.
     """
-    return Pcset(pcs).transpositinalSymmetry()
+    return list(symmetryOf(toMask(pcs))[0])
 
 
 def inversionalSymmetry(pcs):
@@ -375,4 +381,20 @@ def inversionalSymmetry(pcs):
         onto itself when inverting with the index number(s).
         None is output when the set is not inversionally symmetrical.
     """
-    return Pcset(pcs).inversionalSymmetry()
+    return list(symmetryOf(toMask(pcs))[1])
+
+
+# Private functions -----------------------------------------------------------
+
+# The set profiles are pure functions of the bitmask of the input pcset, and
+#   there are only 4096 of them. The results are memoized as tuples so that
+#   the public functions can hand out fresh lists.
+#
+# The functions that need Pcset objects import the pcset module only when
+#   first called: the interval and transformation functions work without it.
+
+@lru_cache(maxsize=4096)
+def _referentialCollectionsOf(mask):
+    """A helper function to memoize referentialCollections() by bitmask."""
+    from .pcset import _pcset
+    return tuple(_pcset(mask).referentialCollections().items())
@@ -5,10 +5,11 @@ This module includes the Pcset class. An object of the Pcset class can be
 instantiated as Pcset(pcs) where pcs is an iterable (tuple, set, list,
 or Pcset object). Each pc is an int, hence pcs is not a string.
 
-The instance variable stores the pcs as a set, representing an unordered
-collection of unique elements. The class supports set operational and
-relational methods. For the full list of the methods, see the doc string of
-Pcset class.
+The instance variable stores the pcs as a 12-bit int (bitmask) where bit i
+is set if pc i is an element, representing an unordered collection of unique
+elements; the pcset property presents it as a read-only frozenset. The class
+supports set operational and relational methods. For the full list of the
+methods, see the doc string of Pcset class.
 
 The class supports __iter__ and can return a generator object, that is,
 an iterable with the current pcs. Therefore, method chaining is possible,
@@ -19,8 +20,13 @@ s = Pcset(a)
 s.transpose(4).union(b).normalForm()
 """
 
-from itertools import combinations
+import warnings
+from functools import lru_cache
 from . import constants as c
+from ._bitmask import (INVERT_TABLE, ICV_TABLE, toMask, fromMask, rotate,
+                       popcount, subMasks, imagesOf, indexVectorOf,
+                       normalFormOf, primeFormOf, transformationLevelsOf,
+                       symmetryOf)
 
 __all__ = ["Pcset"]
 
@@ -83,15 +89,39 @@ class Pcset:  # TODO: will inherit MutableSet and define the abstract methods.
         recrel(pcs)
     """
 
+    # The bitmask is the only instance variable, so instances are laid out
+    #   without a __dict__.
+    __slots__ = ("mask",)
+
     # Basic methods -----------------------------------------------------------
 
     def __init__(self, pcs):
         """Constructor takes an iterable with pcs."""
-        self.pcset = set(pcs)
+        self.mask = _maskOf(pcs)
+
+    @classmethod
+    def _fromMask(cls, mask):
+        """Alternative constructor taking the bitmask of a pcset."""
+        obj = cls.__new__(cls)
+        obj.mask = mask
+        return obj
+
+    @property
+    def pcset(self):
+        """
+        The current pcs as a frozenset, decoded from the bitmask. It is a
+        read-only view: assign a new iterable to the property, or call the
+        mutator methods (e.g., union, transpose), to change the pcs.
+        """
+        return fromMask(self.mask)
+
+    @pcset.setter
+    def pcset(self, pcs):
+        self.mask = _maskOf(pcs)
 
     def __iter__(self):
         """Returns an iterable of the current object."""
-        for pc in self.pcset:
+        for pc in fromMask(self.mask):
             yield pc
 
     def __repr__(self):
@@ -101,15 +131,15 @@ class Pcset:  # TODO: will inherit MutableSet and define the abstract methods.
         >>> Pcset({0, 1, 4})
         Pcset({0, 1, 4})
         """
-        return "Pcset({})".format(self.pcset)
+        return "Pcset({})".format(set(fromMask(self.mask)))
 
     def __len__(self):
         """Returns the cardinality of the pcset."""
-        return len(self.pcset)
+        return popcount(self.mask)
 
     def copy(self):
         """Returns a deep copy of the current state of the object."""
-        return Pcset(self.pcset)
+        return Pcset._fromMask(self.mask)
 
     def clone(self):
         """Same as copy method--to be deprecated."""
@@ -120,12 +150,14 @@ class Pcset:  # TODO: will inherit MutableSet and define the abstract methods.
 
     def getSet(self):
         """
-        Returns a shallow copy of the current pcset.
+        Returns the current pcset as a frozenset, the same as the pcset
+        property, so that the result cannot be mutated in place: use
+        set(getSet()) for a mutable copy of the pcs.
 
-        To obtain a deep copy, use copy method.
+        To obtain a copy of the object, use copy method.
         """
         # TODO: use property instead?
-        return self.pcset
+        return fromMask(self.mask)
 
     # PC membership methods ---------------------------------------------------
 
@@ -135,7 +167,7 @@ class Pcset:  # TODO: will inherit MutableSet and define the abstract methods.
 
         :param pcs: an iterable with pcs.
         """
-        self.pcset |= set(pcs)
+        self.mask |= _maskOf(pcs)
         return self
 
     def difference(self, pcs):
@@ -144,7 +176,7 @@ class Pcset:  # TODO: will inherit MutableSet and define the abstract methods.
 
         :param pcs: an iterable with pcs.
         """
-        self.pcset -= set(pcs)
+        self.mask &= ~_maskOf(pcs)
         return self
 
     def intersection(self, pcs):
@@ -153,7 +185,7 @@ class Pcset:  # TODO: will inherit MutableSet and define the abstract methods.
 
         :param pcs: an iterable with pcs.
         """
-        self.pcset &= set(pcs)
+        self.mask &= _maskOf(pcs)
         return self
 
     def symmetricDifference(self, pcs):
@@ -163,12 +195,12 @@ class Pcset:  # TODO: will inherit MutableSet and define the abstract methods.
 
         :param pcs: an iterable with pcs.
         """
-        self.pcset ^= set(pcs)
+        self.mask ^= _maskOf(pcs)
         return self
 
     def clear(self):
         """Removes all the pcs from the current pcset."""
-        self.pcset.clear()
+        self.mask = 0
         return self
 
     # Set transformation methods ----------------------------------------------
@@ -179,14 +211,14 @@ class Pcset:  # TODO: will inherit MutableSet and define the abstract methods.
 
         :param n: mod 12 integer for the transposition number.
         """
-        self.pcset = {(pc + n) % 12 for pc in self.pcset}
+        self.mask = rotate(self.mask, n)
         return self
 
     def invert(self):
         """
         Inverts the current pcset around pc 0.
         """
-        self.pcset = {(12 - pc) % 12 for pc in self.pcset}
+        self.mask = INVERT_TABLE[self.mask]
         return self
 
     def invertXY(self, x, y):
@@ -222,7 +254,7 @@ class Pcset:  # TODO: will inherit MutableSet and define the abstract methods.
         """
         Shorthand for TnI operation: inversion followed by transposition at n.
         """
-        self.invert().transpose(n)
+        self.mask = rotate(INVERT_TABLE[self.mask], n)
         return self
 
     def opIxy(self, x, y):
@@ -242,15 +274,7 @@ class Pcset:  # TODO: will inherit MutableSet and define the abstract methods.
 
         :return: a list representing the ICV.
         """
-        icv = [0] * 6
-        pcseg = sorted(self.pcset)
-        while len(pcseg) > 1:
-            pc1 = pcseg.pop()
-            for pc in pcseg:
-                i = (pc - pc1) % 12  # Ordered interval class
-                i = min(i, 12 - i)
-                icv[i-1] += 1
-        return icv
+        return list(ICV_TABLE[self.mask])
 
     def indexVector(self):
         """
@@ -258,13 +282,7 @@ class Pcset:  # TODO: will inherit MutableSet and define the abstract methods.
 
         :return: a list representing the index vector.
         """
-        pcs = list(self.pcset)
-        ivec = [0] * 12
-        # Index vector is computed using addition table.
-        for i in pcs:
-            for j in pcs:
-                ivec[(i + j) % 12] += 1
-        return ivec
+        return list(indexVectorOf(self.mask))
 
     def normalForm(self):
         """
@@ -272,29 +290,7 @@ class Pcset:  # TODO: will inherit MutableSet and define the abstract methods.
 
         :return: a list of pcs representing the normal form.
         """
-        card = len(self.pcset)      # Set cardinality
-        if card == 0:
-            return []
-        elif card == 12:
-            return list(range(12))
-        pcseg = sorted(self.pcset)  # pcset to a sorted list
-        rots = []                   # Array for rotations of pcseg
-        for r in range(card):       # Make all rotations of pcseg
-            rots.append(self.__rotate(pcseg, r))
-        k = card - 1
-        while len(rots) > 1:
-            # If k=0 is reached, NF is the one with the smallest first pc.
-            if k == 0:
-                return rots[0]
-            else:
-                intervals = [(rot[k] - rot[0]) % 12 for rot in rots]
-                # Smallest intervals of each member of rots
-                smallest = min(intervals)
-                # Delete a set in rots if its interval > the smallest interval
-                rots = [rots[i] for i in range(len(rots)) if intervals[i] ==
-                        smallest]
-                k -= 1
-        return rots[0]
+        return list(normalFormOf(self.mask))
 
     def primeForm(self):
         """
@@ -302,21 +298,7 @@ class Pcset:  # TODO: will inherit MutableSet and define the abstract methods.
 
         :return: a list of pcs representing the prime form.
         """
-        card = len(self.pcset)
-        if card == 0:
-            return []
-        elif card == 12:
-            return list(range(12))
-        s1 = self.normalForm()
-        s2 = Pcset(s1).invert().normalForm()
-        s1 = [(pc - s1[0]) % 12 for pc in s1]
-        s2 = [(pc - s2[0]) % 12 for pc in s2]
-        for i in range(len(s1) - 2, 0, -1):
-            if s1[i] < s2[i]:
-                return s1
-            elif s1[i] > s2[i]:
-                return s2
-        return s1  # s1 = s2, a symmetrical set
+        return list(primeFormOf(self.mask))
 
     def transformationLevels(self):
         """
@@ -327,9 +309,8 @@ class Pcset:  # TODO: will inherit MutableSet and define the abstract methods.
             current set. For transpositionally and inversionally symmetrical
             sets, there would be multiple entries in the lists.
         """
-        nf = self.normalForm()
-        pf = self.primeForm()
-        return Pcset(pf).pathSame(nf)
+        tn, tni = transformationLevelsOf(self.mask)
+        return {"Tn": list(tn), "TnI": list(tni)}
 
     def referentialCollections(self):
         """
@@ -347,15 +328,16 @@ class Pcset:  # TODO: will inherit MutableSet and define the abstract methods.
                 True    if the current set is an abstract subset of DT
                 False   otherwise
         """
-        # Create referential collection dictionary with default val 0 to every key.
-        refCols = {col: 0 for col in list(c.COL_DICT.keys())}
-        # Check the subset status of the current set against OCT, WT, and HEX collections.
-        for col in refCols:
-            refCols[col] = self.__subsetStatus(c.COL_DICT[col])
-        refCols["D"] = False  # Add abstract subset status for DT collection
-        path = self.pathEmbed({0, 1, 3, 5, 6, 8, 10})  # Operational paths to DT
-        if len(path["Tn"]) + len(path["TnI"]) > 0:
-            refCols["D"] = True
+        # Check the subset status of the current set against OCT, WT, and HEX
+        #   collections, scanning their bitmasks in parallel with the names.
+        refCols = {col: self.__subsetStatus(colMask)
+                   for col, colMask in zip(c.REF_COLS, c.REF_COL_MASKS)}
+        # Add abstract subset status for DT collection: True if the current
+        #   set is smaller than DT and any of its Tn/TnI images is within DT
+        refCols["D"] = False
+        if popcount(self.mask) < popcount(c.DT_MASK):
+            tns, tnis = imagesOf(self.mask)
+            refCols["D"] = any(img & c.DT_MASK == img for img in tns + tnis)
         return refCols
 
     # Set analysis methods ----------------------------------------------------
@@ -364,7 +346,7 @@ class Pcset:  # TODO: will inherit MutableSet and define the abstract methods.
         """
         Returns the complement of the current pcset.
         """
-        return c.TT - self.pcset
+        return set(fromMask(c.TT_MASK ^ self.mask))
 
     def modalComplements(self):
         """
@@ -374,10 +356,8 @@ class Pcset:  # TODO: will inherit MutableSet and define the abstract methods.
             the collection's initial and n is the transposition level e.g., O0, W1, H3, etc.
             Each key has a value for the complementing pcs to the modal collection.
         """
-        modalComps = {col: {} for col in list(c.COL_DICT.keys())}
-        for col in modalComps:
-            modalComps[col] = c.COL_DICT[col] - self.pcset
-        return modalComps
+        return {col: set(fromMask(colMask & ~self.mask))
+                for col, colMask in c.COL_MASKS.items()}
 
     def subsets(self, n):
         """
@@ -386,9 +366,9 @@ class Pcset:  # TODO: will inherit MutableSet and define the abstract methods.
         :param n: the cardinality of the subsets.
         :return: a list of sets--the subsets of cardinality n.
         """
-        if n >= len(self.pcset):
+        if n >= popcount(self.mask):
             return None
-        return [set(s) for s in combinations(self.pcset, n)]
+        return [set(fromMask(sub)) for sub in subMasks(self.mask, n)]
 
     def transpositionalInvariants(self, n):
         """
@@ -401,10 +381,9 @@ class Pcset:  # TODO: will inherit MutableSet and define the abstract methods.
         :return: a set of invariant pcs.
         """
         if n == 0:  # ICV has no entry for ic0
-            return set(self.pcset)
-        copy = self.clone()
+            return set(fromMask(self.mask))
         n = min(12-n, n)
-        return self.pcset & copy.transpose(n).getSet()
+        return set(fromMask(self.mask & rotate(self.mask, n)))
 
     def inversionalInvariants(self, n):
         """
@@ -415,10 +394,9 @@ class Pcset:  # TODO: will inherit MutableSet and define the abstract methods.
         :param n: int for the index number.
         :return: a set of invariant pcs.
         """
-        copy = self.clone()
-        return self.pcset & copy.opTnI(n).getSet()
+        return set(fromMask(self.mask & rotate(INVERT_TABLE[self.mask], n)))
 
-    def transpositinalSymmetry(self):
+    def transpositionalSymmetry(self):
         """
         Returns the degree of transpositional symmetry.
 
@@ -426,14 +404,14 @@ class Pcset:  # TODO: will inherit MutableSet and define the abstract methods.
             onto itself when transposing at the transpositional level(s).
             The number is at least 1, because T0 is an identity operator.
         """
-        icv = self.icv()
-        icv[5] *= 2
-        sym = {0}  # T0 is identity operation
-        size = len(self.pcset)
-        for i in range(6):
-            if icv[i] == size:
-                sym |= {(i + 1), 12 - (i + 1)}
-        return sorted(sym)
+        return list(symmetryOf(self.mask)[0])
+
+    def transpositinalSymmetry(self):
+        """Misspelled alias of transpositionalSymmetry--deprecated."""
+        warnings.warn("transpositinalSymmetry() is deprecated; use "
+                      "transpositionalSymmetry() instead",
+                      DeprecationWarning, stacklevel=2)
+        return self.transpositionalSymmetry()
 
     def inversionalSymmetry(self):
         """
@@ -443,8 +421,7 @@ class Pcset:  # TODO: will inherit MutableSet and define the abstract methods.
             onto itself when inverting with the index number(s).
             None is output when the set is not inversionally symmetrical.
         """
-        ivec = self.indexVector()
-        return [i for i in range(12) if ivec[i] == len(self.pcset)]
+        return list(symmetryOf(self.mask)[1])
 
     # Set relation methods ----------------------------------------------------
 
@@ -461,15 +438,16 @@ class Pcset:  # TODO: will inherit MutableSet and define the abstract methods.
             The list TnI comprises possible values for n where TnI(set1) == set2.
         """
         path = {"Tn": [], "TnI": []}
-        pcs = set(pcs)
-        if self.primeForm() != Pcset(pcs).primeForm():
+        mask = _maskOf(pcs)
+        if popcount(self.mask) != popcount(mask):
+            return path
+        # Sets of different ICVs belong to different set classes, so the
+        #   images are only scanned when the ICVs match.
+        if ICV_TABLE[self.mask] != ICV_TABLE[mask]:
             return path
-        for n in range(12):
-            tn, tni = Pcset(self.pcset), Pcset(self.pcset)
-            if tn.opT(n).getSet() == pcs:
-                path["Tn"].append(n)
-            if tni.opTnI(n).getSet() == pcs:
-                path["TnI"].append(n)
+        tns, tnis = imagesOf(self.mask)
+        path["Tn"] = [n for n, tn in enumerate(tns) if tn == mask]
+        path["TnI"] = [n for n, tni in enumerate(tnis) if tni == mask]
         return path
 
     def pathEmbed(self, pcs):
@@ -483,15 +461,13 @@ class Pcset:  # TODO: will inherit MutableSet and define the abstract methods.
             The list TnI comprises possible values for n where TnI(set1) < set2.
         """
         path = {"Tn": [], "TnI": []}
-        pcs = set(pcs)
-        if len(self.pcset) >= len(pcs):
+        mask = _maskOf(pcs)
+        if popcount(self.mask) >= popcount(mask):
             return path
-        for n in range(12):
-            tn, tni = Pcset(self.pcset), Pcset(self.pcset)
-            if tn.opT(n).getSet() < pcs:
-                path["Tn"].append(n)
-            if tni.opTnI(n).getSet() < pcs:
-                path["TnI"].append(n)
+        # Being smaller, an image is a proper subset if it is within mask.
+        tns, tnis = imagesOf(self.mask)
+        path["Tn"] = [n for n, tn in enumerate(tns) if tn & mask == tn]
+        path["TnI"] = [n for n, tni in enumerate(tnis) if tni & mask == tni]
         return path
 
     def pathCover(self, pcs):
@@ -505,15 +481,13 @@ class Pcset:  # TODO: will inherit MutableSet and define the abstract methods.
             The list TnI comprises possible values for n where TnI(set1) > set2.
         """
         path = {"Tn": [], "TnI": []}
-        pcs = set(pcs)
-        if len(self.pcset) <= len(pcs):
+        mask = _maskOf(pcs)
+        if popcount(self.mask) <= popcount(mask):
             return path
-        for n in range(12):
-            tn, tni = Pcset(self.pcset), Pcset(self.pcset)
-            if tn.opT(n).getSet() > pcs:
-                path["Tn"].append(n)
-            if tni.opTnI(n).getSet() > pcs:
-                path["TnI"].append(n)
+        # Being larger, an image is a proper superset if it covers mask.
+        tns, tnis = imagesOf(self.mask)
+        path["Tn"] = [n for n, tn in enumerate(tns) if tn & mask == mask]
+        path["TnI"] = [n for n, tni in enumerate(tnis) if tni & mask == mask]
         return path
 
     def inclusion(self, pcs):
@@ -527,16 +501,18 @@ class Pcset:  # TODO: will inherit MutableSet and define the abstract methods.
             diff: a set of difference pcs--pcs in the current set but not in
                 the target set.
         """
-        target = set(Pcset(pcs).primeForm())
+        targetMask = _maskOf(pcs)
+        target, icv = primeFormOf(targetMask), ICV_TABLE[targetMask]
         card = len(target)
-        targets = []
         # Pretest--target must be smaller than the current set
-        if len(self.pcset) - card <= 0:
-            return targets
-        for s in list(self.subsets(card)):
-            if set(Pcset(s).primeForm()) == target:
-                targets.append((s, self.pcset - s))
-        return targets
+        if popcount(self.mask) - card <= 0:
+            return []
+        # The matching subsets are filtered in a single pass, rejecting those
+        #   of other ICVs by a table lookup before comparing prime forms.
+        hits = [sub for sub in subMasks(self.mask, card)
+                if ICV_TABLE[sub] == icv and primeFormOf(sub) == target]
+        return [(set(fromMask(sub)), set(fromMask(self.mask ^ sub)))
+                for sub in hits]
 
     def complementation(self, pcs):
         """
@@ -551,17 +527,18 @@ class Pcset:  # TODO: will inherit MutableSet and define the abstract methods.
                 current set, that is, the complementing pcs for the current set
                 to form the target set class.
         """
-        target = set(Pcset(pcs).primeForm())
-        targets = []
-        gap = len(target) - len(self.pcset)
+        targetMask = _maskOf(pcs)
+        target, icv = primeFormOf(targetMask), ICV_TABLE[targetMask]
+        gap = len(target) - popcount(self.mask)
         if gap <= 0:  # Pretest--target must be larger than the current set
-            return targets
-        candidates = [set(s) for s in combinations(c.TT - self.pcset, gap)]
-        for diff in candidates:
-            s = Pcset(self.pcset | diff)
-            if set(s.primeForm()) == target:
-                targets.append((set(s), diff))
-        return targets
+            return []
+        # Candidates for the complementing pcs are the subsets of the
+        #   complement of the current set.
+        hits = [diff for diff in subMasks(c.TT_MASK ^ self.mask, gap)
+                if ICV_TABLE[self.mask | diff] == icv
+                and primeFormOf(self.mask | diff) == target]
+        return [(set(fromMask(self.mask | diff)), set(fromMask(diff)))
+                for diff in hits]
 
     def icvsim(self, pcs, raw=False):
         """
@@ -616,28 +593,46 @@ class Pcset:  # TODO: will inherit MutableSet and define the abstract methods.
 
     # Private methods ---------------------------------------------------------
 
-    def __rotate(self, lst, n):
-        """A helper function to rotate a list by n items."""
-        return lst[n:] + lst[:n]
-
-    def __subsetStatus(self, pcs):
+    def __subsetStatus(self, colMask):
         """
         A helper method that returns the literal subset status
         of the current set against the input set.
 
-        :param pcs: an iterable with pcs.
+        :param colMask: an int for the bitmask of the input set.
         :return:
             0: more than one pc are not the elements of the input set
             1: all but one pc are the elements of the input set
             2: literal subset in, or the same as, the input set
         """
-        pcs = set(pcs)
-        if self.pcset > pcs:  # Pretest
+        mask = self.mask
+        if mask & colMask == colMask and mask != colMask:  # Pretest
             return 0
-        n = len(self.pcset - pcs)
+        n = popcount(mask & ~colMask)  # pcs outside the input set
         if n == 0:
             return 2
         elif n == 1:
             return 1
         else:
             return 0
+
+
+def _maskOf(pcs):
+    """
+    A helper function to convert pcs into a bitmask, taking the bitmask of
+    a Pcset object as it is instead of iterating over its pcs.
+    """
+    if isinstance(pcs, Pcset):
+        return pcs.mask
+    return toMask(pcs)
+
+
+@lru_cache(maxsize=4096)
+def _pcset(mask):
+    """
+    A helper function to memoize the Pcset object of a bitmask, so that
+    analyzing the same pcset with several functions constructs it once.
+
+    The returned object is shared among the callers and must not be
+    mutated: call only the methods that leave the current pcset intact.
+    """
+    return Pcset._fromMask(mask)
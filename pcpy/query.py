@@ -10,7 +10,7 @@ where this program is in.
 
 This module decodes the JSON file and assign the data to the variable,
 catalog. So the queries can be made through importing the variable in other
-scripts.
+scripts. The file is decoded once, when the variable is first accessed.
 
 The variable, catalog, is a dict with nested dict structures. The nested
 dicts are associated with four top-level keys, PFToSN, SC, inclusionTable,
@@ -103,18 +103,46 @@ fromPFStr(sn)
 
 import os.path
 import json
+try:  # orjson decodes the catalog faster, if it is installed
+    import orjson
+except ImportError:
+    orjson = None
+from collections import Counter
+from functools import lru_cache
 from itertools import combinations
 from .operation import (complement, primeForm, icv, referentialCollections,
-                        opT, opTnI, transpositionalSymmetry,
-                        inversionalSymmetry)
-from .relation import setComplexRelations, isSubset
+                        transpositionalSymmetry, inversionalSymmetry)
+from .relation import setComplexTable, isSubset
+from ._bitmask import toMask, subMasks, imagesOf, primeFormOf
 from . import constants as c
 
 __all__ = ["toPFStr", "fromPFStr", "makePFLists", "catalog", "makeCatalog"]
 
 filename = os.path.join(os.path.dirname(__file__), "catalog.json")
-with open(filename, "r") as f:
-    catalog = json.load(f)
+
+
+def __getattr__(name):
+    """
+    Loads the catalog from the JSON file at the first access to the
+    variable, catalog, so that importing the module does not parse it.
+    """
+    if name == "catalog":
+        global catalog
+        if orjson is not None:
+            with open(filename, "rb") as f:
+                catalog = orjson.loads(f.read())
+        else:
+            with open(filename, "r") as f:
+                catalog = json.load(f)
+        return catalog
+    raise AttributeError("module {!r} has no attribute {!r}"
+                         .format(__name__, name))
+
+
+# Characters for pcs in PF strings, where T and E are substituted for 10 and
+#   11, and the inverse mapping
+_PC_CHARS = "0123456789TE"
+_CHAR_PCS = {ch: pc for pc, ch in enumerate(_PC_CHARS)}
 
 
 # Public functions ------------------------------------------------------------
@@ -127,10 +155,17 @@ def toPFStr(s):
     :param s: an iterable of a prime form.
     :return: a str of characters representing pcs is a prime form.
         int 10 and 11 are substituted by T and E in the PF string.
+    :raises ValueError: if a pc is not in the range from 0 to 11.
     """
-    # Substitute str T and E for int 10 and 11
-    pf = ["T" if pc == 10 else "E" if pc == 11 else pc for pc in s]
-    return "".join(str(pc) for pc in pf)  # Convert to string
+    # A negative pc would index _PC_CHARS from the end, so the range is
+    #   checked before the lookup.
+    chars = []
+    for pc in s:
+        if not 0 <= pc < 12:
+            raise ValueError("pc {!r} is out of the range from 0 to 11"
+                             .format(pc))
+        chars.append(_PC_CHARS[pc])
+    return "".join(chars)
 
 
 def fromPFStr(sn):
@@ -141,8 +176,7 @@ def fromPFStr(sn):
     :param sn: a str representing a prime form.
     :return: a list representing the same prime form as the input.
     """
-    # Substitute int 10 and 11 for str T and E
-    return [10 if ch == "T" else 11 if ch == "E" else int(ch) for ch in sn]
+    return [_CHAR_PCS[ch] for ch in sn]
 
 
 # Functions for creating the JSON file ----------------------------------------
@@ -155,16 +189,12 @@ def mapPFToSN(pfs):
         cardinality from 3 to 9.
     :return: a dict (key=PF, value=SN). PF and SN are both str.
     """
-    lst = []  # list for tuples (key=SN, value=PF)
+    dct = {}  # dict for PF to SN conversion
     for card in range(3, 10):
-        ord_ = 1
         sets = pfs[card-3]
-        for s in sets:
-            pf = toPFStr(s)
-            sn = str(card) + "-" + c.ORDINAL_NUMS[card][ord_]  # Make SN str
-            lst.append((pf, sn))
-            ord_ += 1
-    return dict(lst)
+        for s, sn in zip(sets, c.PF_ORDER_NAMES[card]):
+            dct[toPFStr(s)] = sn
+    return dct
 
 
 def mapSC(pfs, dct):
@@ -188,54 +218,48 @@ def mapSC(pfs, dct):
         MSC: a list of MSC nexus sets, represented by SNs, to which the SC
             is a member.
     """
-    lst = []  # list for (key=SN, value=[PF, ICV, Z-corr, MA])
+    profiles = {}  # dict for (key=SN, value={PF, ICV, Z-corr, MA, ...})
     for card in range(3, 10):
-        ord_ = 1
         sets = pfs[card-3]
-        for s in sets:
-            # SN
-            sn = str(card) + "-" + c.ORDINAL_NUMS[card][ord_]
+        # ICVs of the sets, and PFs grouped by ICV to look up Z-correspondents
+        icvs = [tuple(icv(s)) for s in sets]
+        pfsByICV = {}
+        for s, icvec in zip(sets, icvs):
+            pfsByICV.setdefault(icvec, []).append(toPFStr(s))
+        # SN
+        for s, sn, icvec in zip(sets, c.PF_ORDER_NAMES[card], icvs):
             # PF
             pf = toPFStr(s)
-            # ICV
-            icvec = icv(s)
             # Z-correspondent
             zcorr = None
-            others = [t for t in sets if t != s]
-            for zcand in others:
-                if icvec == icv(zcand):
-                    zcorr = dct[toPFStr(zcand)]
+            for zpf in pfsByICV[icvec]:
+                if zpf != pf:  # Z-correspondents are unique
+                    zcorr = dct[zpf]
+                    break
             # Degrees of symmetry
             degrees = [len(transpositionalSymmetry(s)),
                        len(inversionalSymmetry(s))]
-            # Modal attributes
-            matts = []
+            # Modal attributes, kept as dict keys to drop duplicates in
+            #   the order of their first occurrences
+            matts = {}
             ref = referentialCollections(s)
             for col in c.REF_COLS:
                 sym = col[0]  # Extract only the modal collection symbol
                 if ref[col] == 2:
-                    if sym not in matts:
-                        matts.append(sym)
+                    matts[sym] = None
                 # Check prime reference only for hexachords
                 elif card == 6 and ref[col] == 1:
-                    sym += "'"
-                    if sym not in matts:
-                        matts.append(sym)
+                    matts[sym + "'"] = None
             if ref["D"]:
-                matts.append("D")
+                matts["D"] = None
             # MSC membership
-            mscs = []
-            for nexusSN, nexusPF in c.NEXUS_SETS:
-                rels = setComplexRelations(s, nexusPF)
-                if (int(card) <= 5 and rels == 2) \
-                        or (int(card) == 6 and rels >= 1 and isSubset(nexusPF, s)):
-                    mscs.append(nexusSN)
+            mscs = [nexusSN for nexusSN, nexusPF, nexusTable in _nexusTables()
+                    if _isMSCMember(tuple(s), card, nexusPF, nexusTable)]
             # Consolidate the dict entry for the current SC
-            lst.append((sn, {"PF": pf, "ICV": tuple(icvec),
-                             "Z-corr": zcorr, "symmetry": degrees,
-                             "MA": tuple(matts), "MSC": mscs}))
-            ord_ += 1
-    return dict(lst)
+            profiles[sn] = {"PF": pf, "ICV": icvec,
+                            "Z-corr": zcorr, "symmetry": degrees,
+                            "MA": tuple(matts), "MSC": mscs}
+    return profiles
 
 
 def countInclusions(s1, s2):
@@ -258,18 +282,13 @@ def countInclusions(s1, s2):
         return 0
     count = 0  # Inclusion count
     if card1 > card2:
-        for s in combinations(s1, card2):
-            if primeForm(s) == s2:
-                count += 1
+        # The subsets of s1 are tallied by prime form in a single pass for
+        #   all the SC2s of the cardinality.
+        count = _subsetClassCounts(toMask(s1), card2)[tuple(s2)]
     else:
-        sets = []
-        for n in range(12):
-            sets.append(tuple(sorted(opT(s2, n))))
-            sets.append(tuple(sorted(opTnI(s2, n))))
-        sets = set(sets)  # Eliminate Tn and TnI equivalent sets
-        s1 = set(s1)
-        for s in sets:
-            if set(s) > s1:
+        mask1 = toMask(s1)
+        for mask in _memberMasks(toMask(s2)):
+            if mask & mask1 == mask1 and mask != mask1:
                 count += 1
     return count
 
@@ -283,20 +302,31 @@ def mapInclusionTable(dct):
         where the nested dict represents the inclusion table of the SC.
         Each inclusion table is also a dict with key=card and value=inclVec.
     """
+    # PFs and their bitmasks, converted once for all the SNs
+    pfs = {sn: tuple(fromPFStr(dct[sn]["PF"])) for i in range(3, 10)
+           for sn in c.SET_NAMES[i]}
+    masks = {sn: toMask(pf) for sn, pf in pfs.items()}
     tables = {}  # dict for all the inclusion tables
     for i in range(3, 10):
-        for sn1 in c.SN_VECS[i][1:]:
+        cards = [k for k in range(3, 10) if k != i]
+        for sn1 in c.SET_NAMES[i]:
             table = {}  # Inclusion table for the current sn1
-            s1 = fromPFStr(dct[sn1]["PF"])  # list form of PF
-            for j in [k for k in range(3, 10) if k != i]:
-                card = str(j)
-                vec = []  # Inclusion vector for the current card
-                for sn2 in c.SN_VECS[j][1:]:
-                    s2 = fromPFStr(dct[sn2]["PF"])  # list form of PF
-                    vec.append(countInclusions(s1, s2))
-                table[card] = vec
+            mask1 = masks[sn1]
+            for j in cards:
+                # Inclusion vector for the current card, as countInclusions()
+                #   computes each entry: the subsets of sn1 are enumerated
+                #   once for the whole vector when j < i, and the members of
+                #   each larger SC are tested against sn1 when j > i.
+                if j < i:
+                    counts = _subsetClassCounts(mask1, j)
+                    vec = [counts[pfs[sn2]] for sn2 in c.SET_NAMES[j]]
+                else:
+                    vec = [sum(1 for mask in _memberMasks(masks[sn2])
+                               if mask & mask1 == mask1)
+                           for sn2 in c.SET_NAMES[j]]
+                table[str(j)] = vec
             tables[sn1] = table
-    return dict(tables)
+    return tables
 
 
 def mapMSC(dctSC, dctIncl):
@@ -323,26 +353,29 @@ def mapMSC(dctSC, dctIncl):
         Z-corr: a str for the name of Z-correspondent represented by
             a SN if any, None otherwise
     """
+    # SNs and PFs of the candidate members, converted once for all the
+    #   nexus sets
+    cards = (3, 4, 6)
+    sets = {card: [(sn, tuple(fromPFStr(dctSC[sn]["PF"])))
+                   for sn in c.SET_NAMES[card]] for card in cards}
     dct = {}
-    for nexusSN, nexusPF in c.NEXUS_SETS:
+    for nexusSN, nexusPF, nexusTable in _nexusTables():
         profile = {}  # dict for the profile of the current MSC
-        for card in "346":
-            snvec = c.SN_VECS[int(card)]  # SN vector of the current card
+        counts = dctIncl[nexusSN]  # Inclusion table of the nexus set
+        for card in cards:
+            key = str(card)  # Cardinalities are str keys in the catalog
             members = []  # MSC members for the current card
-            for ord_ in range(1, len(snvec)):
-                sn = snvec[ord_]  # SN of the current pcset
-                pf = fromPFStr(dctSC[sn]["PF"])  # PF of the current pcset
+            # SN and PF of the current pcset
+            for ord_, (sn, pf) in enumerate(sets[card]):
                 # Add the current pcset to MSC members if it is Kh-related
                 #   or K-related (in case of hexachord) to the nexus set.
-                rels = setComplexRelations(pf, nexusPF)
-                if rels == 2 or (int(card) == 6 and rels >= 1
-                                 and isSubset(nexusPF, pf)):
+                if _isMSCMember(pf, card, nexusPF, nexusTable):
                     # MA
                     matts = dctSC[sn]["MA"]
                     # Degrees of symmetry
                     degrees = dctSC[sn]["symmetry"]
                     # Inclusion count
-                    count = dctIncl[nexusSN][card][ord_-1]
+                    count = counts[key][ord_]
                     # Z-corr
                     zcorr = dctSC[sn]["Z-corr"]
                     # dict for this member
@@ -350,9 +383,9 @@ def mapMSC(dctSC, dctIncl):
                                   symmetry=degrees, inclusion=count)
                     member["Z-corr"] = zcorr
                     members.append(member)
-            profile[card] = members
+            profile[key] = members
         dct[nexusSN] = profile
-    return dict(dct)
+    return dct
 
 
 def makePFLists():
@@ -399,3 +432,66 @@ def makeCatalog():
     # Write the master dict to a JSON file
     with open("pcpy/catalog.json", "w") as outfile:
         json.dump(data, fp=outfile, indent=4, sort_keys=True)
+
+
+# Private functions -----------------------------------------------------------
+
+@lru_cache(maxsize=4096)
+def _subsetClassCounts(mask, card):
+    """
+    A helper function to count the subsets of cardinality card of a pcset
+    by their prime forms, memoized so that filling an inclusion vector
+    enumerates the subsets once instead of once per set class.
+
+    :param mask: an int for the bitmask of a pcset.
+    :param card: an int for the cardinality of the subsets.
+    :return: a Counter with prime form tuples as the keys.
+    """
+    return Counter(primeFormOf(sub) for sub in subMasks(mask, card))
+
+
+@lru_cache(maxsize=4096)
+def _memberMasks(mask):
+    """
+    A helper function to collect the bitmasks of the distinct Tn and TnI
+    members of the set class of a pcset.
+
+    :param mask: an int for the bitmask of a pcset.
+    :return: a frozenset of ints for the bitmasks of the members.
+    """
+    tns, tnis = imagesOf(mask)
+    return frozenset(tns + tnis)  # Eliminate Tn and TnI equivalent sets
+
+
+@lru_cache(maxsize=None)
+def _nexusTables():
+    """
+    A helper function to compute the set-complex relations of all the set
+    classes about each MSC nexus set once, shared by mapSC() and mapMSC().
+
+    :return: a tuple of (SN, PF, table) for the nexus sets, where table is
+        a dict from PF tuples to the relations given by setComplexTable().
+    """
+    return tuple((sn, pf, setComplexTable(pf)) for sn, pf in c.NEXUS_SETS)
+
+
+def _isMSCMember(pf, card, nexusPF, nexusTable):
+    """
+    A helper function to check whether a set class is a member of the MSC
+    of a nexus set: a set class of cardinality up to 5 is a member if it is
+    Kh-related to the nexus set, and a hexachord is a member if it is K- or
+    Kh-related to the nexus set and includes it.
+
+    :param pf: a tuple for the prime form of the set class.
+    :param card: an int for the cardinality of the set class.
+    :param nexusPF: a tuple for the prime form of the nexus set.
+    :param nexusTable: a dict of the set-complex relations about the nexus
+        set, as given by setComplexTable().
+    :return: True if the set class is a member of the MSC, False otherwise.
+    """
+    rels = nexusTable.get(pf, 0)
+    if card <= 5:
+        return rels == 2
+    elif card == 6:
+        return rels >= 1 and bool(isSubset(nexusPF, pf))
+    return False
@@ -40,17 +40,21 @@ Z-RELATION
 
 SET-COMPLEX RELATION
     setComplexRelations(s1, s2)
+    setComplexTable(s2)
 
 SIMILARITY RELATION
     simRp(s1, s2)
     simIC(s1, s2)
+    icvsim(s1, s2, raw=)
+    icvsimMatrix(pcsets, raw=)
 """
 
-from itertools import combinations
 from math import sqrt
-from statistics import mean
-from .pcset import Pcset
-from .operation import interval, primeForm, subsets, complement, icv
+from .operation import interval
+from .pcset import _pcset
+from ._bitmask import (MASK_ALL, ROTATIONS, INVERT_TABLE, ICV_TABLE, toMask,
+                       fromMask, popcount, subMasks, normalFormOf,
+                       primeFormOf)
 
 __all__ = ["union",
            "difference",
@@ -68,12 +72,18 @@ __all__ = ["union",
            "complementation",
            "isZRelated",
            "setComplexRelations",
+           "setComplexTable",
            "simRp",
            "simIC",
            "icvsim",
+           "icvsimMatrix",
            "recrel"]
 
 
+# Maximum dissimilarity returned from ICVSIM(SC6-35, SC8-28)
+_MAX_DISSIM = 3.5784850922639815
+
+
 # Binary operation functions ----------------------------------------------
 
 def union(s1, s2):
@@ -84,8 +94,7 @@ def union(s1, s2):
     :param s2: an iterable with pcs.
     :return: a set resulted from the set union.
     """
-    s1, s2 = set(s1), set(s2)
-    return s1 | s2
+    return set(fromMask(toMask(s1) | toMask(s2)))
 
 
 def difference(s1, s2):
@@ -96,8 +105,7 @@ def difference(s1, s2):
     :param s2: an iterable with pcs.
     :return: a set resulted from the set difference.
     """
-    s1, s2 = set(s1), set(s2)
-    return s1 - s2
+    return set(fromMask(toMask(s1) & ~toMask(s2)))
 
 
 def intersection(s1, s2):
@@ -108,8 +116,7 @@ def intersection(s1, s2):
     :param s2: an iterable with pcs.
     :return: a set resulted from the set intersection.
     """
-    s1, s2 = set(s1), set(s2)
-    return s1 & s2
+    return set(fromMask(toMask(s1) & toMask(s2)))
 
 
 def symmetricDifference(s1, s2):
@@ -120,8 +127,7 @@ def symmetricDifference(s1, s2):
     :param s2: an iterable with pcs.
     :return: a set resulted from the set symmetrical difference.
     """
-    s1, s2 = set(s1), set(s2)
-    return s1 ^ s2
+    return set(fromMask(toMask(s1) ^ toMask(s2)))
 
 
 # Transformation relation functions ---------------------------------------
@@ -136,9 +142,13 @@ def isTnEquivalent(s1, s2):
     :return: an int for the transposition number with which s1 and s2
         are Tn equivalent, None if they are not Tn equivalent.
     """
-    if len(s1) != len(s2):
+    m1, m2 = toMask(s1), toMask(s2)
+    # The ICV is invariant under Tn, so sets with different ICVs are
+    #   rejected by a table lookup before computing the normal forms.
+    if popcount(m1) != popcount(m2) or ICV_TABLE[m1] != ICV_TABLE[m2]:
         return None
-    s1, s2 = Pcset(s1).normalForm(), Pcset(s2).normalForm()
+    # The memoized normal forms are shared tuples, compared without copying.
+    s1, s2 = normalFormOf(m1), normalFormOf(m2)
     # When sets are transpositionally equivalent, they hold the same AIS.
     if interval(s1) == interval(s2):
         return (s2[0] - s1[0]) % 12
@@ -156,23 +166,18 @@ def isTnIEquivalent(s1, s2):
     :return: an int for the index number with which s1 and s2 are TnI
         equivalent, None if they are not TnI equivalent.
     """
-    if len(s1) != len(s2):
-        return None
-    s1, s2 = Pcset(s1).normalForm(), Pcset(s2).normalForm()
-    ais1, ais2 = interval(s1), interval(s1)  # Create AIS
-    # Sets are inversionally equivalent, if their AISs are mutually
-    # retrogradable.
-    if ais1 == list(reversed(ais2)):
-        return (s2[-1] + s1[0]) % 12
-    else:
-        # Exceptions are some inversionally symmetrical set, in such case
-        #   either set must be rotated to detect mutually retrogradable AIS.
-        rots = [_rotate(s2, j) for j in range(len(s2))]
-        for rot in rots:
-            ais2 = interval(rot)
-            if ais1 == list(reversed(ais2)):
-                return (s1[0] + rot[-1]) % 12
+    m1, m2 = toMask(s1), toMask(s2)
+    # The ICV is invariant under TnI, so it rules out most of the
+    #   non-equivalent sets before trying the 12 transposition levels.
+    if popcount(m1) != popcount(m2) or ICV_TABLE[m1] != ICV_TABLE[m2]:
         return None
+    # s1 and s2 are inversionally equivalent with the index number n, if
+    #   the inversion of s1 rotated by n bits (i.e., TnI) is identical to s2.
+    inv1 = INVERT_TABLE[m1]
+    for n, rot in enumerate(ROTATIONS):
+        if rot(inv1) == m2:
+            return n
+    return None
 
 
 def pathSame(s1, s2):
@@ -188,7 +193,7 @@ def pathSame(s1, s2):
         the list Tn comprises possible values for n where Tn(s1) == s2
         the list TnI comprises possible values for n where TnI(s1) == s2.
     """
-    return Pcset(s1).pathSame(s2)
+    return _pcset(toMask(s1)).pathSame(s2)
 
 
 def pathEmbed(s1, s2):
@@ -201,7 +206,7 @@ def pathEmbed(s1, s2):
         the list Tn comprises possible values for n where Tn(s1) < s2
         the list TnI comprises possible values for n where TnI(s1) < s2.
     """
-    return Pcset(s1).pathEmbed(s2)
+    return _pcset(toMask(s1)).pathEmbed(s2)
 
 
 def pathCover(s1, s2):
@@ -215,7 +220,7 @@ def pathCover(s1, s2):
         the list Tn comprises possible values for n where Tn(s1) > s2
         the list TnI comprises possible values for n where TnI(s1) > s2.
     """
-    return Pcset(s1).pathCover(s2)
+    return _pcset(toMask(s1)).pathCover(s2)
 
 
 # Inclusion relation functions --------------------------------------------
@@ -229,15 +234,7 @@ def isSubset(s1, s2):
     :param s2: an iterable with pcs.
     :return: 0 (not a subset), 1 (literal subset), 2 (abstract subset).
     """
-    if len(s1) >= len(s2):  # Pretest
-        return 0
-    s1, s2 = set(s1), set(s2)
-    if s1 < s2:  # Literal subset
-        return 1
-    elif set(primeForm(s1)) in [set(primeForm(s)) for s in subsets(s2, len(s1))]:
-        return 2
-    else:
-        return 0
+    return _inclusionOf(toMask(s1), toMask(s2))
 
 
 def isSuperset(s1, s2):
@@ -249,11 +246,8 @@ def isSuperset(s1, s2):
     :param s2: an iterable with pcs.
     :return: 0 (not a superset), 1 (literal superset), 2 (abstract superset).
     """
-    if len(s1) <= len(s2):  # Pretest
-        return 0
-    s1, s2 = set(s1), set(s2)
     # s1 is a superset of s2, if s2 is a subset of s1.
-    return isSubset(s2, s1)
+    return _inclusionOf(toMask(s2), toMask(s1))
 
 
 def inclusion(s1, s2):
@@ -267,7 +261,7 @@ def inclusion(s1, s2):
         target: a literal subset of the current set of the target set class
         diff: a set of difference pcs--pcs in the current set but not in target
     """
-    return Pcset(s1).inclusion(s2)
+    return _pcset(toMask(s1)).inclusion(s2)
 
 
 # Complement relation functions -------------------------------------------
@@ -281,14 +275,14 @@ def isComplement(s1, s2):
     :param s2: an iterable with pcs.
     :return: 0 (not a complement), 1 (literal complement), 2 (abstract complement)
     """
-    if len(s1) + len(s2) != 12:  # Pretest
+    m1, m2 = toMask(s1), toMask(s2)
+    if popcount(m1) + popcount(m2) != 12:  # Pretest
         return 0
-    # Comparison is made in set data type
-    s1 = set(s1)
-    s2Comp = complement(s2)
-    if s1 == s2Comp:  # Literal complement
+    # Comparison is made in bitmask: the complement of s2 is its bitwise NOT.
+    m2Comp = MASK_ALL ^ m2
+    if m1 == m2Comp:  # Literal complement
         return 1
-    elif primeForm(s1) == primeForm(s2Comp):  # Abstract complement
+    elif primeFormOf(m1) == primeFormOf(m2Comp):  # Abstract complement
         return 2
     else:
         return 0
@@ -307,7 +301,7 @@ def complementation(s1, s2):
         comp: a set of complementing pcs for the current set to form
             the target set class
     """
-    return Pcset(s1).complementation(s2)
+    return _pcset(toMask(s1)).complementation(s2)
 
 
 # Z-relation function -----------------------------------------------------
@@ -315,13 +309,16 @@ def complementation(s1, s2):
 def isZRelated(s1, s2):
     """
     A function to check the Z-relation between s1 and s2, that is, whether
-    the input s1 and s2 are Z-related having the same ICV.
+    the input s1 and s2 are Z-related having the same ICV but belonging to
+    different set classes.
 
     :param s1: an iterable with pcs.
     :param s2: an iterable with pcs.
     :return: True if Z-related, False otherwise.
     """
-    return set(icv(s1)) == set(icv(s2))
+    mask1, mask2 = toMask(s1), toMask(s2)
+    return (ICV_TABLE[mask1] == ICV_TABLE[mask2]
+            and primeFormOf(mask1) != primeFormOf(mask2))
 
 
 # Set-complex relation ----------------------------------------------------
@@ -338,12 +335,21 @@ def setComplexRelations(s1, s2):
     """
     # Preliminary conditions of s1 and s2 are that their cardinalities
     #   are between 3 and 9 and not the same with each other.
-    card1, card2 = len(s1), len(s2)
+    m1, m2 = toMask(s1), toMask(s2)
+    card1, card2 = popcount(m1), popcount(m2)
     if not(3 <= card1 <= 9) or not(3 <= card2 <= 9) or (card1 == card2):
         return 0
-    s2Comp = complement(s2)
-    bool1 = isSubset(s1, s2) or isSuperset(s1, s2)
-    bool2 = isSubset(s1, s2Comp) or isSuperset(s1, s2Comp)
+    # Only the smaller set can be included in the larger one, so a single
+    #   inclusion test decides both the subset and the superset relations.
+    m2Comp = MASK_ALL ^ m2
+    if card1 < card2:
+        bool1 = _inclusionOf(m1, m2)
+    else:
+        bool1 = _inclusionOf(m2, m1)
+    if card1 < 12 - card2:
+        bool2 = _inclusionOf(m1, m2Comp)
+    else:
+        bool2 = _inclusionOf(m2Comp, m1)
     if bool1 and bool2:
         return 2
     elif bool1 or bool2:
@@ -352,6 +358,38 @@ def setComplexRelations(s1, s2):
         return 0
 
 
+def setComplexTable(s2):
+    """
+    A function to check the set-complex relations about s2 of all the set
+    classes at once, which is faster than calling setComplexRelations() for
+    each of them: the set classes related to s2 or its complement by
+    inclusion are collected in a single pass over their subsets and
+    supersets.
+
+    :param s2: an iterable with pcs.
+    :return: a dict with the prime forms (tuples) of all the set classes of
+        cardinality between 3 and 9 other than that of s2 as keys and
+        1 (set-complex relation K), 2 (set-complex relation Kh), or 0 (if
+        none of set complex relations hold) as values; empty if the
+        cardinality of s2 is not between 3 and 9.
+    """
+    m2 = toMask(s2)
+    card2 = popcount(m2)
+    if not(3 <= card2 <= 9):
+        return {}
+    pfs1, pfs2 = _inclusionClasses(m2), _inclusionClasses(MASK_ALL ^ m2)
+    table = {}
+    for mask in range(4096):
+        card1 = popcount(mask)
+        if 3 <= card1 <= 9 and card1 != card2:
+            pf = primeFormOf(mask)
+            if pf not in table:
+                # K if s1 is related by inclusion to s2 or its complement,
+                #   and Kh if to both.
+                table[pf] = (pf in pfs1) + (pf in pfs2)
+    return table
+
+
 # Similarity relation -----------------------------------------------------
 
 def simRp(s1, s2):
@@ -363,11 +401,15 @@ def simRp(s1, s2):
     :param s2: an iterable with pcs.
     :return: True if Rp holds between s1 and s2, False otherwise.
     """
-    if len(s1) != len(s2):  # s1 and s2 must have the same cardinality.
+    m1, m2 = toMask(s1), toMask(s2)
+    # s1 and s2 must have the same cardinality.
+    if popcount(m1) != popcount(m2):
         return False
-    s1 = set([tuple(primeForm(s)) for s in combinations(s1, len(s1) - 1)])
-    s2 = set([tuple(primeForm(s)) for s in combinations(s2, len(s2) - 1)])
-    return len(s1 & s2) != 0
+    # The subsets of cardinality n-1 of an n-element set are those with one
+    #   of its bits cleared.
+    pfs1 = {primeFormOf(m1 ^ (1 << pc)) for pc in fromMask(m1)}
+    pfs2 = {primeFormOf(m2 ^ (1 << pc)) for pc in fromMask(m2)}
+    return not pfs1.isdisjoint(pfs2)
 
 
 def simIC(s1, s2):
@@ -383,13 +425,12 @@ def simIC(s1, s2):
     :param s2: an iterable with pcs.
     :return: 1 (R1), 2 (R2), 0 (R0), -1 (if none of R1, R2, or R0 holds).
     """
-    if len(s1) != len(s2):  # s1 and s2 must have the same cardinality.
+    m1, m2 = toMask(s1), toMask(s2)
+    # s1 and s2 must have the same cardinality.
+    if popcount(m1) != popcount(m2):
         return -1
-    v1, v2 = icv(s1), icv(s2)
-    nonEqual = []
-    for i in range(6):
-        if v1[i] != v2[i]:
-            nonEqual.append((v1[i], v2[i]))
+    v1, v2 = ICV_TABLE[m1], ICV_TABLE[m2]
+    nonEqual = [(x1, x2) for x1, x2 in zip(v1, v2) if x1 != x2]
     if len(nonEqual) == 6:
         return 0
     elif len(nonEqual) == 2:
@@ -438,17 +479,31 @@ def icvsim(s1, s2, raw=False):
     :return: ICVSIM value.
     :rtype: float
     """
-    icv1, icv2 = icv(s1), icv(s2)
-    idv = [icv2[i] - icv1[i] for i in range(6)]  # Interval-difference Vector
-    idvMean = mean(idv)
-    sim = sqrt(sum([(idv[i] - idvMean) ** 2 for i in range(6)]) / 6)  # ICVSIM
+    return _icvsimOf(ICV_TABLE[toMask(s1)], ICV_TABLE[toMask(s2)], raw)
 
-    if raw:
-        return sim
-    else:
-        # Maximum dissimilarity returned from ICVSIM(SC6-35, SC8-28)
-        maxDissim = 3.5784850922639815
-        return (maxDissim - sim) / maxDissim
+
+def icvsimMatrix(pcsets, raw=False):
+    """
+    Return the matrix of the ICVSIM values between all the pairs of the
+    input pcsets (e.g., the set classes in a catalog). The ICV of each
+    pcset is looked up only once, and since ICVSIM is symmetric, only the
+    values on and above the diagonal are computed.
+
+    :param pcsets: an iterable of pcsets.
+    :param raw: If True, the ICVSIM values are in the range [0.0,
+        3.578...]; if False (default), they are flipped and normalized as
+        in icvsim().
+    :return: a list of lists of floats, where the j-th item of the i-th
+        list is the ICVSIM value between the i-th and j-th pcsets.
+    """
+    icvs = [ICV_TABLE[toMask(pcs)] for pcs in pcsets]
+    n = len(icvs)
+    matrix = [[0.0] * n for _ in range(n)]
+    for i, icv1 in enumerate(icvs):
+        row = matrix[i]
+        for j in range(i, n):
+            row[j] = matrix[j][i] = _icvsimOf(icv1, icvs[j], raw)
+    return matrix
 
 
 def recrel(s1, s2):
@@ -464,6 +519,56 @@ def recrel(s1, s2):
 
 # Private functions -------------------------------------------------------
 
-def _rotate(lst, n):
-    """A helper function to rotate a list by n items"""
-    return lst[n:] + lst[:n]
+def _inclusionOf(m1, m2):
+    """
+    A helper function to check whether the pcset of bitmask m1 is a subset
+    of that of bitmask m2 literally or abstractly.
+
+    :param m1: an int for the bitmask of a pcset.
+    :param m2: an int for the bitmask of a pcset.
+    :return: 0 (not a subset), 1 (literal subset), 2 (abstract subset).
+    """
+    card1 = popcount(m1)
+    if card1 >= popcount(m2):  # Pretest
+        return 0
+    if m1 & m2 == m1:  # Literal subset
+        return 1
+    # Abstract subset: the ICV is a table lookup, and a subset of m2 with
+    #   an ICV other than that of m1 cannot be in its set class, so the
+    #   prime forms are compared only for the subsets passing the ICV test.
+    icv1, pf1 = ICV_TABLE[m1], primeFormOf(m1)
+    if any(ICV_TABLE[sub] == icv1 and primeFormOf(sub) == pf1
+           for sub in subMasks(m2, card1)):
+        return 2
+    return 0
+
+
+def _icvsimOf(icv1, icv2, raw):
+    """A helper function to compute ICVSIM from the two ICVs."""
+    idv = [x2 - x1 for x1, x2 in zip(icv1, icv2)]  # Interval-difference Vector
+    idvMean = sum(idv) / 6
+    sim = sqrt(sum((d - idvMean) ** 2 for d in idv) / 6)  # ICVSIM
+
+    if raw:
+        return sim
+    else:
+        return (_MAX_DISSIM - sim) / _MAX_DISSIM
+
+
+def _inclusionClasses(mask):
+    """
+    A helper function to collect the prime forms of the set classes whose
+    members are literal proper subsets or supersets of the pcset of a
+    bitmask.
+    """
+    pfs = set()
+    sub = mask
+    while sub:  # Proper submasks of mask
+        sub = (sub - 1) & mask
+        pfs.add(primeFormOf(sub))
+    holes = MASK_ALL ^ mask
+    sub = holes
+    while sub:  # mask with each nonempty submask of its holes added
+        pfs.add(primeFormOf(mask | sub))
+        sub = (sub - 1) & holes
+    return pfs
@@ -1,64 +1,117 @@
 # operation_test.py
-# Testing script for functions defined in the operation module
+# Tests for functions defined in the operation module
 
 from pcpy.operation import *
 
 
-lst = [3, 5, 1, 10, 23, 16, 8]
-print("\nPitch intervals:")
-print(pitchInterval(lst))  # Unordered (directed) interval
-print(pitchInterval(lst, ordered=True))  # Ordered (absolute) interval
-print("\nOrdered pitch-class intervals:")
-print(interval(lst))
-print("\nUnordered pitch-class intervals (ics):")
-print(intervalClass(lst))
-
-s = [4, 0, 9, 11, 8]
-print("\nTransposition in pc space:")
-print(transpose(s, 5), opT(s, 5))
-print("\nInversion:")
-print(invert(s))
-print(opTnI(s, 5))
-print(opIxy(s, 2, 3))
-
-s = [0, 1, 2, 6, 8]
-print("\nInterval-class vector:")
-print(icv(s))
-
-s = [0, 1, 4, 8]
-print("\nIndex vector")
-print(indexVector(s))
-
-s = [4, 0, 9, 11, 8]
-print("\nNormal form:")
-print(normalForm(s))
-
-s = [0, 4, 6, 11, 1, 7, 10]
-print("\nPrime form:")
-print(primeForm(s))
-
-s = [8, 9, 2, 5, 0, 1]
-print("\nTransformation levels:")
-print(transformationLevels(s))
-
-s = [9, 10, 0, 5, 3, 2]  # 6-Z25 (T8I, O2' D)
-print("\nReferential collections:")
-print(referentialCollections(s))
-print("\nComplement (12T)")
-print(complement(s))
-print("\nModal complements:")
-print(modalComplements(s))
-print("\nSubsets of cardinality n")
-print(subsets(s, 5))
-
-s = [10, 0, 1, 3, 4]  # 5-10 (T4I, O0)
-print("\nTranspositional invariants:")
-print(transpositionalInvariants(s, 9))
-print("\nInversional invariants:")
-print(inversionalInvariants(s, 1))
-
-s = [3, 4, 9, 10]  # 4-9 (T5, O2)
-print("\nTranspositional symmetry:")
-print(transpositionalSymmetry(s))
-print("\nInversional symmetry:")
-print(inversionalSymmetry(s))
+def test_pitchInterval():
+    lst = [3, 5, 1, 10, 23, 16, 8]
+    # Unordered (directed) interval
+    assert pitchInterval(lst) == [2, 4, 9, 13, 7, 8]
+    # Ordered (absolute) interval
+    assert pitchInterval(lst, ordered=True) == [2, -4, 9, 13, -7, -8]
+
+
+def test_interval():
+    lst = [3, 5, 1, 10, 23, 16, 8]
+    assert interval(lst) == [2, 8, 9, 1, 5, 4]
+    assert intervalClass(lst) == [2, 4, 3, 1, 5, 4]
+    # A repeated pc is a unison (ic 0), not a tritone
+    assert intervalClass([0, 0]) == [0]
+    assert intervalClass([11, 0]) == [1]
+    assert intervalClass([0, 6]) == [6]
+
+
+def test_intervalNumericTypes():
+    # Int and float segments that compare equal must not share results
+    assert interval([0.0, 2.0]) == [2.0]
+    assert intervalClass([0, 2]) == [2]
+    assert pitchInterval([60, 62]) == [2]
+    result = pitchInterval([60.0, 62.0])
+    assert result == [2.0] and isinstance(result[0], float)
+    assert intervalClass([0.0, 8.0, 2.0]) == [4.0, 6.0]
+
+
+def test_transformations():
+    s = [4, 0, 9, 11, 8]
+    assert transpose(s, 5) == opT(s, 5) == {1, 2, 4, 5, 9}
+    assert invert(s) == {0, 1, 3, 4, 8}
+    assert opTnI(s, 5) == {1, 5, 6, 8, 9}
+    assert opIxy(s, 2, 3) == {1, 5, 6, 8, 9}
+    # Results of the transformations can be passed on as they are
+    assert invert(transpose(s, 5)) == {3, 7, 8, 10, 11}
+    # Float pcs are rejected whether or not they come in a frozenset
+    for pcs in ([1.0], frozenset({1.0})):
+        try:
+            transpose(pcs, 1)
+        except TypeError:
+            pass
+        else:
+            raise AssertionError("float pcs must raise TypeError")
+
+
+def test_icv():
+    assert icv([0, 1, 2, 6, 8]) == [2, 2, 0, 2, 2, 2]
+
+
+def test_indexVector():
+    assert indexVector([0, 1, 4, 8]) == [3, 2, 1, 0, 3, 2, 0, 0, 3, 2, 0, 0]
+
+
+def test_normalForm():
+    assert normalForm([4, 0, 9, 11, 8]) == [8, 9, 11, 0, 4]
+
+
+def test_primeForm():
+    assert primeForm([0, 4, 6, 11, 1, 7, 10]) == [0, 1, 2, 3, 6, 7, 9]
+
+
+def test_transformationLevels():
+    assert transformationLevels([8, 9, 2, 5, 0, 1]) == {"Tn": [], "TnI": [2]}
+
+
+def test_referentialCollections():
+    s = [9, 10, 0, 5, 3, 2]  # 6-Z25 (T8I, O2' D)
+    assert referentialCollections(s) == {
+        "O0": 0, "O1": 0, "O2": 1, "W0": 0, "W1": 0,
+        "H0": 0, "H1": 0, "H2": 0, "H3": 0, "D": True}
+    assert referentialCounts([s, [0, 1, 3], [0, 4, 8]]) == [
+        [4, 3, 5, 3, 3, 3, 4, 3, 2],
+        [3, 1, 2, 1, 2, 2, 1, 1, 2],
+        [2, 2, 2, 3, 0, 3, 0, 0, 3]]
+
+
+def test_complement():
+    s = [9, 10, 0, 5, 3, 2]
+    assert complement(s) == {1, 4, 6, 7, 8, 11}
+    assert modalComplements(s) == {
+        "O0": {1, 4, 6, 7}, "O1": {1, 4, 7, 8, 11}, "O2": {6, 8, 11},
+        "W0": {4, 6, 8}, "W1": {1, 7, 11},
+        "H0": {1, 4, 8}, "H1": {1, 6}, "H2": {6, 7, 11}, "H3": {4, 7, 8, 11}}
+
+
+def test_subsets():
+    s = [9, 10, 0, 5, 3, 2]
+    assert sorted(sorted(sub) for sub in subsets(s, 5)) == [
+        [0, 2, 3, 5, 9], [0, 2, 3, 5, 10], [0, 2, 3, 9, 10],
+        [0, 2, 5, 9, 10], [0, 3, 5, 9, 10], [2, 3, 5, 9, 10]]
+    assert subsets(s, 6) is None
+    # A negative cardinality is rejected like itertools.combinations()
+    try:
+        subsets(s, -1)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("negative n must raise ValueError")
+
+
+def test_invariants():
+    s = [10, 0, 1, 3, 4]  # 5-10 (T4I, O0)
+    assert transpositionalInvariants(s, 9) == {1, 3, 4}
+    assert inversionalInvariants(s, 1) == {0, 1, 3, 10}
+
+
+def test_symmetry():
+    s = [3, 4, 9, 10]  # 4-9 (T5, O2)
+    assert transpositionalSymmetry(s) == [0, 6]
+    assert inversionalSymmetry(s) == [1, 7]
@@ -1,5 +1,5 @@
 # pcset_test.py
-# Testing script for the class defined in the pcset module.
+# Tests for the class defined in the pcset module.
 
 from pcpy.pcset import *
 from pcpy.operation import *
@@ -7,28 +7,62 @@ from pcpy.operation import *
 set1 = {4, 0, 1}
 set2 = [0, 3, 4, 5, 7, 8]
 
-print("\nMethod chaining:")
-s1 = Pcset(set1)
-s2 = Pcset(set2)
-print(s1.transpose(4).union(s2.transpose(2)))
-
-print(s1.getSet(), "test")
-
-print("\nObject copying:")
-s1 = Pcset(set1)
-s2 = Pcset(set2)
-s = s1.copy().transpose(5)
-print(s1, s)  # s1 is intact
-print(s1.union(s2))  # Argument can be a Pcset object
-
-print("\nInclusion:")
-s2 = Pcset(set2)
-for target, diff in s2.inclusion(set1):
-    print(target, diff)
-    print(primeForm(target), primeForm(diff))
-
-print("\nComplementation:")
-s1 = Pcset(set1)
-for target, comp in s1.complementation(set2):
-    print(target, comp)
-    print(primeForm(target), primeForm(comp))
+
+def test_methodChaining():
+    s1 = Pcset(set1)
+    s2 = Pcset(set2)
+    s = s1.transpose(4).union(s2.transpose(2))
+    assert s.getSet() == {2, 4, 5, 6, 7, 8, 9, 10}
+    assert repr(s) == "Pcset({2, 4, 5, 6, 7, 8, 9, 10})"
+
+
+def test_copy():
+    s1 = Pcset(set1)
+    s2 = Pcset(set2)
+    s = s1.copy().transpose(5)
+    assert s1.getSet() == {0, 1, 4}  # s1 is intact
+    assert s.getSet() == {5, 6, 9}
+    # Argument can be a Pcset object
+    assert s1.union(s2).getSet() == {0, 1, 3, 4, 5, 7, 8}
+
+
+def test_pcsetProperty():
+    s1 = Pcset(set1)
+    # The property is read-only; mutation goes through the methods
+    try:
+        s1.pcset.add(5)
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError("pcset property must not be mutable")
+    s1.pcset = {2, 3}
+    assert s1.getSet() == {2, 3}
+    assert isinstance(s1.getSet(), frozenset)
+
+
+def test_inclusion():
+    s2 = Pcset(set2)
+    targets = s2.inclusion(set1)
+    assert {(frozenset(target), frozenset(diff))
+            for target, diff in targets} == {
+        (frozenset({0, 3, 4}), frozenset({5, 7, 8})),
+        (frozenset({3, 4, 7}), frozenset({0, 5, 8})),
+        (frozenset({4, 5, 8}), frozenset({0, 3, 7})),
+        (frozenset({4, 7, 8}), frozenset({0, 3, 5}))}
+    for target, diff in targets:
+        assert primeForm(target) == [0, 1, 4]
+        assert target | diff == set(set2)
+
+
+def test_complementation():
+    s1 = Pcset(set1)
+    targets = s1.complementation(set2)
+    assert {(frozenset(target), frozenset(comp))
+            for target, comp in targets} == {
+        (frozenset({0, 1, 3, 4, 5, 8}), frozenset({3, 5, 8})),
+        (frozenset({0, 1, 2, 4, 5, 9}), frozenset({2, 5, 9})),
+        (frozenset({0, 1, 3, 4, 8, 11}), frozenset({3, 8, 11})),
+        (frozenset({0, 1, 4, 8, 9, 11}), frozenset({8, 9, 11}))}
+    for target, comp in targets:
+        assert primeForm(target) == [0, 1, 3, 4, 5, 8]
+        assert target - comp == set1
@@ -1,10 +1,42 @@
 # query_test.py
-# Testing script for querying the catalog dict variable defined in the query
+# Tests for querying the catalog dict variable defined in the query
 #  module.
 
-from pprint import pprint
-from pcpy.query import catalog
+from pcpy.query import catalog, toPFStr, fromPFStr
 
-print(catalog['SC']['3-1'])
-print(catalog['inclusionTable']['4-12']['3'])
-pprint(catalog['MSC']['5-10'])
+
+def test_PFStr():
+    assert toPFStr([0, 1, 3, 4, 6, 8, 10]) == "013468T"
+    assert fromPFStr("013468T") == [0, 1, 3, 4, 6, 8, 10]
+    assert catalog["PFToSN"][toPFStr([0, 2, 4, 6, 8, 10])] == "6-35"
+    for pcs in ([0, -1], [0, 12]):
+        try:
+            toPFStr(pcs)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("out-of-range pc must raise ValueError")
+
+
+def test_SC():
+    assert catalog["SC"]["3-1"] == {
+        "ICV": [2, 1, 0, 0, 0, 0], "MA": [], "MSC": [], "PF": "012",
+        "Z-corr": None, "symmetry": [1, 1]}
+    assert catalog["SC"]["4-Z15"]["Z-corr"] == "4-Z29"
+
+
+def test_inclusionTable():
+    assert catalog["inclusionTable"]["4-12"]["3"] == [
+        0, 1, 1, 0, 0, 0, 0, 1, 0, 1, 0, 0]
+
+
+def test_MSC():
+    msc = catalog["MSC"]["5-10"]
+    assert [member["SN"] for member in msc["3"]] == [
+        "3-2", "3-3", "3-5", "3-7", "3-8", "3-10"]
+    assert [member["SN"] for member in msc["4"]] == [
+        "4-3", "4-10", "4-12", "4-13", "4-Z15"]
+    assert [member["SN"] for member in msc["6"]] == [
+        "6-2", "6-Z3", "6-Z11", "6-Z13", "6-Z23", "6-Z24", "6-27"]
+    assert msc["3"][0] == {"MA": ["O", "D"], "SN": "3-2", "Z-corr": None,
+                           "inclusion": 3, "symmetry": [1, 0]}
@@ -1,91 +1,103 @@
 # relation_test.py
-# Testing script for functions defined in the relation module
+# Tests for functions defined in the relation module
 
 from pcpy.relation import *
 
-a = {0, 1, 3, 5, 6}
-b = {1, 3, 4}
-print("\nBinary operations:")
-print(union(a, b))
-print(difference(a, b))
-print(intersection(a, b))
-print(symmetricDifference(a, b))
-
-a = {11, 8, 7, 5}
-b = {4, 7, 1, 3}
-print("\nTranspositional equivalence:")
-print(isTnEquivalent(a, b))
-
-a = {8, 0, 5, 4}
-b = {0, 5, 1, 9}
-print("\nInversional equivalence:")
-print(isTnIEquivalent(a, b))
-
-a = {1, 2, 5}
-b = {7, 4, 3}
-print("\nPath to the same set:")
-print(pathSame(a, b))
-
-a = {7, 4, 3}
-b = {1, 2, 5, 9}
-print("\nPath to the literal subset:")
-print(pathEmbed(a, b))
-
-a = {1, 2, 5, 11}
-b = {5, 8, 9}
-print("\nPath to the literal superset:")
-print(pathCover(a, b))
-
-a, b = {2, 3, 7}, {0, 1, 4, 5, 8}  # SC 3-4 and 5-21
-print("\nSubset relation:")
-print(isSubset(a, b))
-
-a, b = {11, 0, 3, 4, 7}, {0, 3, 7}
-print("\nSuperset relation:")
-print(isSuperset(a, b))
-
-a, b = {2, 3, 6, 7, 9, 10}, {3, 6, 7}  # 6-Z19 and 3-3
-print("\nInclusion")
-print(inclusion(a, b))
-
-a, b = [0, 1, 2, 5, 6, 8, 9], [3, 4, 7, 10, 11]
-c, d = [0, 1, 2, 5, 6, 8, 9], [0, 1, 4, 7, 8]
-print("\nComplement relation:")
-print(isComplement(a, b))
-print(isComplement(c, d))
-
-a, b = [0, 1, 4], [9, 0, 1, 3, 4]  # f = 5-16 (T4I, O0)
-print("\nComplementation:")
-print(complementation(a, b))
-
-a, b = [1, 2, 5, 7], [3, 4, 6, 10]  # SC 4-Z15 and 4-Z29
-print("\nZ-relation:")
-print(isZRelated(a, b))
-
-# (4-4, 7-6) = Kh
-a = {0, 1, 2, 5}
-b = {0, 1, 2, 3, 4, 6, 7}
-print("\nSet-complex relation (K and Kh)")
-print(setComplexRelations(a, b))
-# (4-4, 7-5) = K
-b = {0, 1, 2, 3, 5, 6, 7}
-print(setComplexRelations(a, b))
-# (4-4, 7-28) = none
-b = {0, 1, 3, 5, 6, 7, 9}
-print(setComplexRelations(a, b))
-
-a = [10, 0, 1, 3, 4]
-b = [9, 10, 0, 2, 3]
-print("\nPitch-class relation (Rp)")
-print(simRp(a, b))
-
-a = [3, 4, 5, 7, 9]
-b = [11, 1, 3, 5, 6]
-print("\nInterval-class relations (R1, R2, R0)")
-print(simIC(a, b))
-a = [10, 0, 1, 3, 4]
-b = [9, 10, 0, 2, 3]
-print(simIC(a, b))
-a = [3, 4, 5, 7]
-b = [8, 11, 1, 2]
-print(simIC(a, b))
+
+def test_binaryOperations():
+    a = {0, 1, 3, 5, 6}
+    b = {1, 3, 4}
+    assert union(a, b) == {0, 1, 3, 4, 5, 6}
+    assert difference(a, b) == {0, 5, 6}
+    assert intersection(a, b) == {1, 3}
+    assert symmetricDifference(a, b) == {0, 4, 5, 6}
+
+
+def test_equivalence():
+    assert isTnEquivalent({11, 8, 7, 5}, {4, 7, 1, 3}) == 8
+    assert isTnIEquivalent({8, 0, 5, 4}, {0, 5, 1, 9}) == 5
+    # Same cardinality but different set classes (3-1 and 3-2)
+    assert isTnIEquivalent({0, 1, 2}, {0, 1, 3}) is None
+    # Related by TnI only
+    assert isTnEquivalent({0, 1, 3}, {0, 2, 3}) is None
+    assert isTnIEquivalent({0, 1, 3}, {0, 2, 3}) == 3
+
+
+def test_paths():
+    # Path to the same set
+    assert pathSame({1, 2, 5}, {7, 4, 3}) == {"Tn": [2], "TnI": []}
+    # Path to the literal subset
+    assert pathEmbed({7, 4, 3}, {1, 2, 5, 9}) == {"Tn": [10], "TnI": []}
+    # Path to the literal superset
+    assert pathCover({1, 2, 5, 11}, {5, 8, 9}) == {"Tn": [], "TnI": [10]}
+
+
+def test_inclusion():
+    a, b = {2, 3, 7}, {0, 1, 4, 5, 8}  # SC 3-4 and 5-21
+    assert isSubset(a, b) == 2
+    a, b = {11, 0, 3, 4, 7}, {0, 3, 7}
+    assert isSuperset(a, b) == 1
+    a, b = {2, 3, 6, 7, 9, 10}, {3, 6, 7}  # 6-Z19 and 3-3
+    assert {(frozenset(target), frozenset(diff))
+            for target, diff in inclusion(a, b)} == {
+        (frozenset({2, 3, 6}), frozenset({7, 9, 10})),
+        (frozenset({3, 6, 7}), frozenset({2, 9, 10})),
+        (frozenset({6, 7, 10}), frozenset({2, 3, 9})),
+        (frozenset({6, 9, 10}), frozenset({2, 3, 7}))}
+
+
+def test_complement():
+    a, b = [0, 1, 2, 5, 6, 8, 9], [3, 4, 7, 10, 11]
+    c, d = [0, 1, 2, 5, 6, 8, 9], [0, 1, 4, 7, 8]
+    assert isComplement(a, b) == 1
+    assert isComplement(c, d) == 2
+    a, b = [0, 1, 4], [9, 0, 1, 3, 4]  # f = 5-16 (T4I, O0)
+    assert {(frozenset(target), frozenset(comp))
+            for target, comp in complementation(a, b)} == {
+        (frozenset({0, 1, 3, 4, 7}), frozenset({3, 7})),
+        (frozenset({0, 1, 3, 4, 9}), frozenset({3, 9})),
+        (frozenset({0, 1, 4, 9, 10}), frozenset({9, 10}))}
+
+
+def test_isZRelated():
+    a, b = [1, 2, 5, 7], [3, 4, 6, 10]  # SC 4-Z15 and 4-Z29
+    assert isZRelated(a, b)
+    # ICVs <111000> and <101100> share their digits but differ in order
+    assert isZRelated({0, 1, 3}, {0, 1, 4}) is False
+    # Members of the same set class have the same ICV but are not Z-related
+    assert isZRelated(a, [0, 1, 4, 6]) is False
+
+
+def test_setComplexRelations():
+    a = {0, 1, 2, 5}
+    # (4-4, 7-6) = Kh
+    assert setComplexRelations(a, {0, 1, 2, 3, 4, 6, 7}) == 2
+    # (4-4, 7-5) = K
+    assert setComplexRelations(a, {0, 1, 2, 3, 5, 6, 7}) == 1
+    # (4-4, 7-28) = none
+    b = {0, 1, 3, 5, 6, 7, 9}
+    assert setComplexRelations(a, b) == 0
+    # Set classes in K or Kh about 7-28
+    table = setComplexTable(b)
+    assert table[(0, 1, 2, 5)] == 0
+    assert [pf for pf, rel in table.items() if rel == 2][:6] == [
+        (0, 1, 3), (0, 1, 4), (0, 2, 5), (0, 1, 6), (0, 2, 6), (0, 3, 6)]
+    assert all(rel == setComplexRelations(pf, b) for pf, rel in table.items())
+
+
+def test_similarity():
+    # Pitch-class relation (Rp)
+    assert simRp([10, 0, 1, 3, 4], [9, 10, 0, 2, 3])
+    # Interval-class relations (R1, R2, R0)
+    assert simIC([3, 4, 5, 7, 9], [11, 1, 3, 5, 6]) == 1
+    assert simIC([10, 0, 1, 3, 4], [9, 10, 0, 2, 3]) == 2
+    assert simIC([3, 4, 5, 7], [8, 11, 1, 2]) == 0
+
+
+def test_icvsim():
+    a = [0, 1, 2]
+    assert abs(icvsim(a, [0, 1, 2, 5, 6, 7]) - 0.7205521403004266) < 1e-12
+    matrix = icvsimMatrix([a, [0, 1, 2, 3, 6], [0, 3, 6, 9]], raw=True)
+    assert [row[i] for i, row in enumerate(matrix)] == [0.0, 0.0, 0.0]
+    assert abs(matrix[0][1] - 0.3726779962499649) < 1e-12
+    assert matrix[1][0] == matrix[0][1]